@@ -25,6 +25,14 @@ from githooks.core.github_utils import extract_ticket_from_branch, get_current_b
 
 app = typer.Typer()
 
+# Commit message patterns, compiled once at import
+_SCOPED_HEADER_RE = re.compile(r"^(\w+)\(([^)]+)\):\s*(.*)$")
+_DUPLICATE_HEADER_RE = re.compile(r"^(\w+\(.*?\):)\s*\1")
+_HEADER_PREFIX_RE = re.compile(r"^(\w+(?:\(.*?\))?(!)?:\s*)(.*)$")
+_TYPE_RE = re.compile(r"^(feat|fix|docs|style|refactor|test|chore|ci)(?:\(.*?\))?(!)?:")
+_BREAKING_HEADER_RE = re.compile(r"^(\w+)(?:\(.*?\))?!:(?:\s|$)")
+_TICKET_RE = re.compile(r"\b([A-Z]{2,}-\d+)\b")
+
 
 @app.command()
 def main(repo_alias: str, jira_ticket: str):
@@ -118,7 +126,7 @@ def fix_duplicate_scope(msg: str) -> str:
     Example: "feat(scope): scope: rest" -> "feat(scope): rest"
     """
     # If header includes a scope, and the body starts with the same scope colon, strip it
-    m = re.match(r"^(\w+)\(([^)]+)\):\s*(.*)$", msg)
+    m = _SCOPED_HEADER_RE.match(msg)
     if m:
         _type, scope, body = m.groups()
         prefix = f"{scope}: "
@@ -126,8 +134,7 @@ def fix_duplicate_scope(msg: str) -> str:
             body = body[len(prefix) :]
         return f"{_type}({scope}): {body}"
     # Fallback: remove exact duplicated header if present
-    pattern = r"^(\w+\(.*?\):)\s*\1"
-    return re.sub(pattern, r"\1", msg)
+    return _DUPLICATE_HEADER_RE.sub(r"\1", msg)
 
 
 def ensure_ticket_in_header(msg: str, jira_ticket: str) -> str:
@@ -138,7 +145,7 @@ def ensure_ticket_in_header(msg: str, jira_ticket: str) -> str:
     """
     ticket = jira_ticket.upper()
     # Updated regex to handle optional breaking change indicator (!)
-    header_match = re.match(r"^(\w+(?:\(.*?\))?(!)?:\s*)(.*)$", msg)
+    header_match = _HEADER_PREFIX_RE.match(msg)
     if header_match:
         prefix, breaking_indicator, rest = header_match.groups()
         if ticket in rest:
@@ -151,7 +158,7 @@ def ensure_ticket_in_header(msg: str, jira_ticket: str) -> str:
 
 
 def has_conventional_type(msg: str) -> bool:
-    return bool(re.match(r"^(feat|fix|docs|style|refactor|test|chore|ci)(?:\(.*?\))?(!)?:", msg))
+    return bool(_TYPE_RE.match(msg))
 
 
 def suggest_type_header(msg: str) -> str:
@@ -171,7 +178,7 @@ def add_footer_if_breaking_change(msg: str, jira_ticket: str) -> str:
 
     Detect via feat!: in header or a BREAKING CHANGE: footer already present.
     """
-    if re.match(r"^(\w+)(?:\(.*?\))?!:(?:\s|$)", msg) or "BREAKING CHANGE:" in msg:
+    if _BREAKING_HEADER_RE.match(msg) or "BREAKING CHANGE:" in msg:
         footer = f"\n\n{jira_ticket.upper()} #comment Breaking change; review impacts #resolve"
         if footer.strip() in msg:
             return msg
@@ -233,7 +240,7 @@ def validate_commit_message(msg: str) -> tuple[bool, list[str]]:
 
 
 def extract_ticket_from_header_or_body(msg: str) -> Optional[str]:
-    m = re.search(r"\b([A-Z]{2,}-\d+)\b", msg)
+    m = _TICKET_RE.search(msg)
     return m.group(1) if m else None
 
 
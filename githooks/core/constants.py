@@ -5,8 +5,11 @@ This module contains all configuration constants used across the git-go workflow
 including JIRA work logging durations, transition names, and service defaults.
 """
 
+import re
+
 # Git Configuration
 BRANCH_REGEX = r"([A-Z]+-\d+)"  # JIRA ticket pattern (e.g., PROJ-123)
+BRANCH_PATTERN = re.compile(BRANCH_REGEX)  # Precompiled BRANCH_REGEX for hot-path matching
 GITHUB_ISSUE_REGEX = r"(?:issue|gh|#)?-?(\d+)"  # GitHub issue pattern (e.g., issue-123, gh-123, #123)
 DEFAULT_ROOT_BRANCH = "develop"
 
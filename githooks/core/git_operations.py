@@ -29,14 +29,40 @@ def safe_run_git(
         raise RuntimeError(f"Command '{' '.join(cmd)}' failed: {exc}") from exc
 
 
+def read_head_branch(repo_path: Optional[Path] = None) -> Optional[str]:
+    """Read the checked-out branch straight from ``.git/HEAD`` without spawning git.
+
+    Only handles the common case of a repository root whose ``.git`` is a directory and
+    whose HEAD is a symbolic ref; callers fall back to ``git rev-parse`` otherwise.
+
+    Args:
+        repo_path (Optional[Path]): The repository root (defaults to the current directory).
+    Returns:
+        Optional[str]: The branch name, or None if HEAD is detached, ``.git`` is a file
+        (worktree/submodule), or the path is not a repository root.
+    """
+    try:
+        head = (Path(repo_path or ".") / ".git" / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if head.startswith("ref: refs/heads/"):
+        return head[len("ref: refs/heads/") :]
+    return None
+
+
 def get_current_branch(repo_path: Optional[Path] = None) -> Optional[str]:
     """Get the current git branch name for the given repository path.
 
+    Reads ``.git/HEAD`` directly when possible and only runs git as a fallback.
+
     Args:
         repo_path (Optional[Path]): The path to the git repository.
     Returns:
         Optional[str]: The current branch name, or None if not found.
     """
+    branch = read_head_branch(repo_path)
+    if branch:
+        return branch
     cmd = ["git", "rev-parse", "--abbrev-ref", "HEAD"]
     try:
         result = safe_run_git(cmd, cwd=repo_path, check=True)
@@ -13,12 +13,15 @@ from typing import Any, List, Optional
 
 from github import Github  # type: ignore[import,no-redef]
 
-from githooks.core.constants import BRANCH_REGEX, DEFAULT_JIRA_SERVER
+from githooks.core.constants import BRANCH_PATTERN, DEFAULT_JIRA_SERVER
 from githooks.core.git_operations import get_commits_since as lib_get_commits_since
 from githooks.core.git_operations import get_current_branch as lib_get_current_branch
 from githooks.core.repo_helpers import build_pr_body, get_github_token, get_repo_from_url  # type: ignore[attr-defined]
 from githooks.core.utils import push_latest_changes
 
+# Runs of anything but lowercase letters and digits (underscores included) collapse to one "_"
+_FORMAT_RE = re.compile(r"[^a-z0-9]+")
+
 
 def safe_run(
     cmd: List[str], cwd: Optional[Path] = None, check: bool = False, capture_output: bool = True, text: bool = False
@@ -47,7 +50,7 @@ def get_commits_since_branch(repo_path: Path, base_branch: str) -> List[str]:
 
 
 def get_ticket_from_branch(branch_name: str) -> str:
-    """Extract the JIRA ticket from a branch name using BRANCH_REGEX.
+    """Extract the JIRA ticket from a branch name using BRANCH_PATTERN.
 
     Args:
         branch_name: Git branch name
@@ -58,7 +61,7 @@ def get_ticket_from_branch(branch_name: str) -> str:
     Raises:
         SystemExit if ticket cannot be found
     """
-    ticket_match = re.search(BRANCH_REGEX, branch_name)
+    ticket_match = BRANCH_PATTERN.search(branch_name)
     if not ticket_match:
         print(f"[ERROR] No JIRA ticket found in branch name: {branch_name}", file=sys.stderr)
         sys.exit(1)
@@ -74,7 +77,7 @@ def extract_ticket_from_branch(branch_name: str) -> Optional[str]:
     Returns:
         JIRA ticket identifier or None
     """
-    ticket_match = re.search(BRANCH_REGEX, branch_name)
+    ticket_match = BRANCH_PATTERN.search(branch_name)
     return ticket_match.group(1) if ticket_match else None
 
 
@@ -105,9 +108,7 @@ def format_summary_for_branch(summary: str, max_length: int = 50) -> str:
         Formatted summary suitable for branch name
     """
     summary = summary.strip().lower()
-    summary = re.sub(r"[^a-z0-9]+", "_", summary)
-    summary = re.sub(r"_+", "_", summary)
-    summary = summary.strip("_")
+    summary = _FORMAT_RE.sub("_", summary).strip("_")
     if len(summary) <= max_length:
         return summary
     words = summary.split("_")
@@ -15,13 +15,30 @@ Branch Naming Patterns:
     GitHub: issue-123-description, gh-123-description, 123-description, #123
 """
 
+import functools
 import re
 from typing import Literal, Optional, Tuple
 
-from githooks.core.constants import BRANCH_REGEX, GITHUB_ISSUE_REGEX, ISSUE_TRACKER_GITHUB, ISSUE_TRACKER_JIRA, ISSUE_TRACKER_UNKNOWN
+from githooks.core.constants import BRANCH_PATTERN, BRANCH_REGEX, GITHUB_ISSUE_REGEX, ISSUE_TRACKER_GITHUB, ISSUE_TRACKER_JIRA, ISSUE_TRACKER_UNKNOWN
 
 IssueTracker = Literal["jira", "github", "unknown"]
 
+# GitHub issue matchers, precompiled and tried in order: explicit prefix anywhere (issue-123, gh-123, #123),
+# then a number at the start of the branch name (123-description). The latter uses Pattern.match so a
+# non-numeric name fails at the first character instead of being scanned position by position.
+_GITHUB_ISSUE_MATCHERS = (
+    re.compile(r"(?:issue|gh|#)-?(\d+)", re.IGNORECASE).search,
+    re.compile(r"(\d+)-").match,
+)
+
+# All branch shapes fused into one pattern anchored at the start, so detection and extraction take a
+# single match call. Each lookahead scans the whole name, which keeps the old precedence: a JIRA key
+# anywhere wins over a GitHub prefix anywhere, which wins over a leading number.
+_ISSUE_RE = re.compile(
+    rf"^(?:(?=.*?(?P<jira>{BRANCH_REGEX}))|(?=.*?(?i:issue|gh|#)-?(?P<gh_prefixed>\d+))|(?P<gh_bare>\d+)-)",
+    re.DOTALL,
+)
+
 
 def detect_issue_tracker(branch_name: str) -> IssueTracker:
     """Detect which issue tracking system is used based on branch name.
@@ -32,20 +49,7 @@ def detect_issue_tracker(branch_name: str) -> IssueTracker:
     Returns:
         'jira', 'github', or 'unknown'
     """
-    # Check for JIRA pattern first (more specific: PROJECT-123)
-    if re.search(BRANCH_REGEX, branch_name):
-        return ISSUE_TRACKER_JIRA  # type: ignore[return-value]
-
-    # Check for GitHub issue patterns (issue-123, gh-123, #123, or just 123-description)
-    # Look for common GitHub issue prefixes or numeric patterns
-    if re.search(r"(?:issue|gh|#)-?\d+", branch_name, re.IGNORECASE):
-        return ISSUE_TRACKER_GITHUB  # type: ignore[return-value]
-
-    # Check if branch name starts with a number (common pattern: 123-fix-bug)
-    if re.match(r"^\d+-", branch_name):
-        return ISSUE_TRACKER_GITHUB  # type: ignore[return-value]
-
-    return ISSUE_TRACKER_UNKNOWN  # type: ignore[return-value]
+    return parse_issue_from_branch(branch_name)[0]
 
 
 def parse_jira_ticket(branch_name: str) -> Optional[str]:
@@ -57,7 +61,10 @@ def parse_jira_ticket(branch_name: str) -> Optional[str]:
     Returns:
         JIRA ticket key (e.g., 'PROJ-123') or None
     """
-    match = re.search(BRANCH_REGEX, branch_name)
+    # Every JIRA key contains a hyphen; skip the regex scan for names like 'main' or 'develop'
+    if "-" not in branch_name:
+        return None
+    match = BRANCH_PATTERN.search(branch_name)
     return match.group(1) if match else None
 
 
@@ -76,22 +83,22 @@ def parse_github_issue(branch_name: str) -> Optional[int]:
     Returns:
         GitHub issue number or None
     """
-    # Try explicit patterns first (issue-123, gh-123, #123)
-    match = re.search(r"(?:issue|gh|#)-?(\d+)", branch_name, re.IGNORECASE)
-    if match:
-        return int(match.group(1))
-
-    # Try number at start of branch name (123-description)
-    match = re.match(r"^(\d+)-", branch_name)
-    if match:
-        return int(match.group(1))
+    # Explicit patterns first (issue-123, gh-123, #123), then number at start (123-description)
+    for matcher in _GITHUB_ISSUE_MATCHERS:
+        match = matcher(branch_name)
+        if match:
+            return int(match.group(1))
 
     return None
 
 
+@functools.lru_cache(maxsize=256)
 def parse_issue_from_branch(branch_name: str) -> Tuple[IssueTracker, Optional[str], Optional[int]]:
     """Parse issue reference from branch name, detecting tracker type.
 
+    Results are memoized per branch name, so repeated lookups (e.g. via
+    ``detect_issue_tracker``) skip the regex.
+
     Args:
         branch_name: Git branch name
 
@@ -101,17 +108,15 @@ def parse_issue_from_branch(branch_name: str) -> Tuple[IssueTracker, Optional[st
         - jira_key: JIRA ticket key if JIRA, else None
         - github_issue_number: GitHub issue number if GitHub, else None
     """
-    tracker = detect_issue_tracker(branch_name)
-
-    if tracker == ISSUE_TRACKER_JIRA:
-        jira_key = parse_jira_ticket(branch_name)
-        return (tracker, jira_key, None)
+    match = _ISSUE_RE.match(branch_name)
+    if match is None:
+        return (ISSUE_TRACKER_UNKNOWN, None, None)  # type: ignore[return-value]
 
-    if tracker == ISSUE_TRACKER_GITHUB:
-        github_issue = parse_github_issue(branch_name)
-        return (tracker, None, github_issue)
+    if match.group("jira") is not None:
+        return (ISSUE_TRACKER_JIRA, match.group("jira"), None)  # type: ignore[return-value]
 
-    return (ISSUE_TRACKER_UNKNOWN, None, None)  # type: ignore[return-value]
+    github_issue = match.group("gh_prefixed") or match.group("gh_bare")
+    return (ISSUE_TRACKER_GITHUB, None, int(github_issue))  # type: ignore[return-value]
 
 
 def format_issue_reference(tracker: IssueTracker, jira_key: Optional[str] = None, github_issue: Optional[int] = None) -> str:
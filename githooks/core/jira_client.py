@@ -16,16 +16,16 @@ Credentials are sourced from environment variables, system keyring, or user inpu
 and can be cached securely using the keyring library.
 """
 
+import functools
 import getpass
 import os
-import re
 import sys
 from typing import Optional
 
 import keyring
 from jira import JIRA
 
-from githooks.core.constants import BRANCH_REGEX, DEFAULT_JIRA_SERVER, SERVICE_NAME
+from githooks.core.constants import BRANCH_PATTERN, DEFAULT_JIRA_SERVER, SERVICE_NAME
 
 
 def get_jira_credentials() -> tuple[str, str]:
@@ -71,16 +71,22 @@ def get_jira_client(server: Optional[str] = None):
         return None
 
 
+@functools.lru_cache(maxsize=256)
 def parse_ticket_from_branch(branch: str) -> Optional[str]:
     """
     Parse and return the JIRA ticket key from a branch name using the configured regex.
 
+    Results are memoized per branch name, since several hooks parse the same branch
+    during one git operation.
+
     Parameters:
         branch (str): The branch name to parse.
 
     Returns:
-        Optional[str]: The extracted JIRA ticket key, or None if not found.
+        Optional[str]: The extracted JIRA ticket key, or None if not found (or if branch is empty/None).
     """
-
-    match = re.search(BRANCH_REGEX, branch)
+    # Every JIRA key contains a hyphen, so 'main', 'develop' and the like skip the regex
+    if not branch or "-" not in branch:
+        return None
+    match = BRANCH_PATTERN.search(branch)
     return match.group(1) if match else None
@@ -29,9 +29,10 @@ import platform
 import shutil
 import subprocess
 import winreg
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 
 class BashDetector:
@@ -209,6 +210,9 @@ class RuntimeCache:
         hooks.runtime.node: Cached Node.js path
         hooks.runtime.detectedAt: ISO timestamp of last detection
 
+    The config scope is read once with ``git config --list -z`` and served from
+    an in-memory snapshot; writes go through to Git and update the snapshot.
+
     Attributes:
         repo_path: Repository path for local config, None for global
         cache_ttl: Time-to-live for cache entries (default: 7 days)
@@ -223,6 +227,7 @@ class RuntimeCache:
         """
         self.repo_path = repo_path
         self.cache_ttl = cache_ttl
+        self._config_snapshot: Optional[Dict[str, str]] = None
 
     def get_bash_path(self, force_detect: bool = False) -> Optional[str]:
         """Get bash path from cache or detect.
@@ -284,14 +289,50 @@ class RuntimeCache:
             self._write_cache("node", detected_path)
         return detected_path
 
+    def get_all_paths(self, force_detect: bool = False) -> Dict[str, Optional[str]]:
+        """Get bash, Python and Node.js paths, detecting cache misses concurrently.
+
+        The detectors are independent filesystem and PATH probes, so they run
+        on a thread pool; cache writes stay serial because each ``git config``
+        write takes the config lock file.
+
+        Args:
+            force_detect: If True, bypass cache and re-detect every runtime.
+
+        Returns:
+            Mapping of runtime name ("bash", "python", "node") to its path,
+            or None for an optional runtime that was not found.
+        """
+        detectors = {"bash": BashDetector.detect, "python": PythonDetector.detect, "node": NodeDetector.detect}
+        paths: Dict[str, Optional[str]] = {}
+
+        if not force_detect and self._is_cache_valid():
+            for runtime in detectors:
+                cached_path = self._read_cache(runtime)
+                if cached_path and self._path_exists(cached_path):
+                    paths[runtime] = cached_path
+
+        missing = [runtime for runtime in detectors if runtime not in paths]
+        if missing:
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                detected = dict(zip(missing, executor.map(lambda runtime: detectors[runtime](), missing)))
+            for runtime, detected_path in detected.items():
+                if detected_path:
+                    self._write_cache(runtime, detected_path)
+                paths[runtime] = detected_path
+        return paths
+
     def invalidate(self) -> None:
         """Invalidate all cached runtime paths.
 
         Forces re-detection on next access. Useful when runtime
-        environments change (e.g., Git reinstalled).
+        environments change (e.g., Git reinstalled). Only the cache's own keys are
+        unset, and only those present in the snapshot; other hooks.runtime.* keys are kept.
         """
+        config = self._git_config_load_all()
         for key in ["bash", "python", "node", "detectedAt"]:
-            self._git_config_unset(f"hooks.runtime.{key}")
+            if self._normalize_key(f"hooks.runtime.{key}") in config:
+                self._git_config_unset(f"hooks.runtime.{key}")
 
     def _read_cache(self, runtime: str) -> Optional[str]:
         """Read cached runtime path from Git config."""
@@ -321,48 +362,60 @@ class RuntimeCache:
         """Verify cached path still exists."""
         return Path(path).exists()
 
-    def _git_config_get(self, key: str) -> Optional[str]:
-        """Read value from Git config."""
-        cmd = ["git", "config"]
-        if self.repo_path:
-            cmd.append("--local")
-        else:
-            cmd.append("--global")
-        cmd.append(key)
+    @staticmethod
+    def _normalize_key(key: str) -> str:
+        """Canonicalize a config key the way ``git config --list`` prints it.
 
+        Section and variable names are case-insensitive and listed lowercase;
+        subsection names are case-sensitive and kept as-is.
+        """
+        section, _, rest = key.partition(".")
+        subsection, _, name = rest.rpartition(".")
+        return ".".join(part for part in (section.lower(), subsection, name.lower()) if part)
+
+    def _git_config_cmd(self, *args: str) -> List[str]:
+        """Build a ``git config`` command for this cache's scope."""
+        return ["git", "config", "--local" if self.repo_path else "--global", *args]
+
+    def _git_config_load_all(self) -> Dict[str, str]:
+        """Read every key in this cache's config scope with one ``git config --list``."""
+        if self._config_snapshot is not None:
+            return self._config_snapshot
+
+        snapshot: Dict[str, str] = {}
         try:
-            result = subprocess.run(cmd, cwd=self.repo_path, capture_output=True, text=True, check=False, encoding="utf-8", errors="replace")
+            result = subprocess.run(
+                self._git_config_cmd("--list", "-z"), cwd=self.repo_path, capture_output=True, text=True, check=False, encoding="utf-8", errors="replace"
+            )
             if result.returncode == 0:
-                return result.stdout.strip()
+                for entry in result.stdout.split("\0"):
+                    key, _, value = entry.partition("\n")
+                    if key:
+                        snapshot[key] = value
         except (subprocess.SubprocessError, OSError):
             pass
-        return None
+        self._config_snapshot = snapshot
+        return snapshot
+
+    def _git_config_get(self, key: str) -> Optional[str]:
+        """Read value from Git config."""
+        value = self._git_config_load_all().get(self._normalize_key(key))
+        return value.strip() if value is not None else None
 
     def _git_config_set(self, key: str, value: str) -> None:
         """Write value to Git config."""
-        cmd = ["git", "config"]
-        if self.repo_path:
-            cmd.append("--local")
-        else:
-            cmd.append("--global")
-        cmd.extend([key, value])
-
         try:
-            subprocess.run(cmd, cwd=self.repo_path, check=True, capture_output=True, encoding="utf-8", errors="replace")
+            subprocess.run(self._git_config_cmd(key, value), cwd=self.repo_path, check=True, capture_output=True, encoding="utf-8", errors="replace")
         except (subprocess.SubprocessError, OSError) as exc:
             # Non-fatal - cache write failure shouldn't break installation
             print(f"Warning: Failed to cache runtime path: {exc}")
+            return
+        self._git_config_load_all()[self._normalize_key(key)] = value
 
     def _git_config_unset(self, key: str) -> None:
         """Remove value from Git config."""
-        cmd = ["git", "config"]
-        if self.repo_path:
-            cmd.append("--local")
-        else:
-            cmd.append("--global")
-        cmd.extend(["--unset", key])
-
         try:
-            subprocess.run(cmd, cwd=self.repo_path, check=False, capture_output=True, encoding="utf-8", errors="replace")
+            subprocess.run(self._git_config_cmd("--unset", key), cwd=self.repo_path, check=False, capture_output=True, encoding="utf-8", errors="replace")
         except (subprocess.SubprocessError, OSError):
             pass  # Ignore errors - key might not exist
+        self._git_config_load_all().pop(self._normalize_key(key), None)
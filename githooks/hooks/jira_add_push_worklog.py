@@ -10,14 +10,17 @@ import keyring  # imported for test monkeypatching
 import typer  # imported for test compatibility
 from jira import JIRA  # imported for test compatibility
 
+from githooks.core.constants import BRANCH_PATTERN as _BRANCH_PATTERN
 from githooks.core.constants import BRANCH_REGEX as _BRANCH_REGEX
 from githooks.core.constants import DEFAULT_JIRA_SERVER
 from githooks.core.constants import SERVICE_NAME as _SERVICE_NAME
 from githooks.core.constants import WORKLOG_PUSH_TIME
+from githooks.core.git_operations import read_head_branch
 from githooks.core.jira_client import get_jira_client, parse_ticket_from_branch
 
 # Re-export constants for backward compatibility with tests
 BRANCH_REGEX = _BRANCH_REGEX
+BRANCH_PATTERN = _BRANCH_PATTERN
 SERVICE_NAME = _SERVICE_NAME
 DEFAULT_SERVER = DEFAULT_JIRA_SERVER
 
@@ -56,10 +59,19 @@ def ensure_dependencies():
         sys.exit(1)
 
 
-def get_current_branch() -> Optional[str]:
-    """Get the current git branch name."""
+def get_current_branch(repo_path: Optional[str] = None) -> Optional[str]:
+    """Get the current git branch name, reading .git/HEAD before falling back to git.
+
+    Args:
+        repo_path: Repository to inspect (defaults to the current directory)
+    """
+    branch = read_head_branch(repo_path)
+    if branch:
+        return branch
     try:
-        result = subprocess.run(["git", "rev-parse", "--abbrev-ref", "HEAD"], capture_output=True, check=True, encoding="utf-8", errors="replace")
+        result = subprocess.run(
+            ["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=repo_path, capture_output=True, check=True, encoding="utf-8", errors="replace"
+        )
         return result.stdout.strip()
     except Exception:
         return None
@@ -126,6 +138,7 @@ __all__ = [
     "ensure_dependencies",
     "main",
     "BRANCH_REGEX",
+    "BRANCH_PATTERN",
     "SERVICE_NAME",
     "DEFAULT_SERVER",
     "DEFAULT_TIME_SPENT",
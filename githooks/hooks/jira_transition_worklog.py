@@ -10,6 +10,7 @@ import keyring  # imported for test monkeypatching
 import typer  # imported for test compatibility
 from jira import JIRA  # imported for test compatibility
 
+from githooks.core.constants import BRANCH_PATTERN as _BRANCH_PATTERN
 from githooks.core.constants import BRANCH_REGEX as _BRANCH_REGEX
 from githooks.core.constants import DEFAULT_JIRA_SERVER
 from githooks.core.constants import SERVICE_NAME as _SERVICE_NAME
@@ -18,6 +19,7 @@ from githooks.core.jira_client import get_jira_client, parse_ticket_from_branch
 
 # Re-export constants for backward compatibility with tests
 BRANCH_REGEX = _BRANCH_REGEX
+BRANCH_PATTERN = _BRANCH_PATTERN
 SERVICE_NAME = _SERVICE_NAME
 DEFAULT_SERVER = DEFAULT_JIRA_SERVER
 
@@ -92,6 +94,7 @@ __all__ = [
     "transition_and_log_work",
     "ensure_dependencies",
     "BRANCH_REGEX",
+    "BRANCH_PATTERN",
     "SERVICE_NAME",
     "DEFAULT_SERVER",
     "DEFAULT_TIME_SPENT",
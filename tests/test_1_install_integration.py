@@ -14,19 +14,23 @@ import subprocess
 from pathlib import Path
 
 
+def _run_install(repo: Path, *, capture: bool = False) -> subprocess.CompletedProcess:
+    """Run the repo's copy of install.py; output is discarded unless ``capture`` is set."""
+    kwargs: dict = {"cwd": repo, "timeout": 30}
+    if capture:
+        kwargs.update(capture_output=True, text=True)
+    else:
+        kwargs.update(stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return subprocess.run(["python", str(repo / "install.py")], **kwargs)
+
+
 def test_install_copies_hooks_to_git_directory(temp_git_repo: Path) -> None:
     """install.py copies hook files to .git/hooks/ directory."""
     # Run install.py from the temp repo (fixture copies it there)
     install_script = temp_git_repo / "install.py"
     assert install_script.exists(), "Fixture should copy install.py to temp repo"
 
-    result = subprocess.run(
-        ["python", str(install_script)],
-        cwd=temp_git_repo,
-        capture_output=True,
-        text=True,
-        timeout=30,
-    )
+    result = _run_install(temp_git_repo, capture=True)
 
     # Installation should complete (may warn about missing dependencies)
     assert result.returncode in (0, 1), f"Install failed unexpectedly:\nSTDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}"
@@ -43,8 +47,6 @@ def test_install_copies_hooks_to_git_directory(temp_git_repo: Path) -> None:
 
 def test_install_preserves_existing_hooks(temp_git_repo: Path) -> None:
     """install.py replaces existing hooks (no backup in current implementation)."""
-    install_script = temp_git_repo / "install.py"
-
     # Create a fake pre-existing hook
     hooks_dir = temp_git_repo / ".git" / "hooks"
     hooks_dir.mkdir(parents=True, exist_ok=True)
@@ -52,13 +54,7 @@ def test_install_preserves_existing_hooks(temp_git_repo: Path) -> None:
     existing_hook.write_text("#!/bin/bash\necho 'Old hook'\n", encoding="utf-8")
 
     # Run installer
-    subprocess.run(
-        ["python", str(install_script)],
-        cwd=temp_git_repo,
-        capture_output=True,
-        text=True,
-        timeout=30,
-    )
+    _run_install(temp_git_repo)
 
     # Old hook should be replaced (current behavior: overwrite without backup)
     current_content = existing_hook.read_text(encoding="utf-8")
@@ -69,15 +65,7 @@ def test_install_preserves_existing_hooks(temp_git_repo: Path) -> None:
 
 def test_install_creates_executable_hooks(temp_git_repo: Path) -> None:
     """Installed hooks are executable on Unix systems (Windows uses .exe)."""
-    install_script = temp_git_repo / "install.py"
-
-    subprocess.run(
-        ["python", str(install_script)],
-        cwd=str(temp_git_repo),
-        capture_output=True,
-        text=True,
-        timeout=30,
-    )
+    _run_install(temp_git_repo)
 
     hooks_dir = temp_git_repo / ".git" / "hooks"
     hook_files = [f for f in hooks_dir.glob("*") if f.is_file() and not f.suffix]
@@ -95,8 +83,6 @@ def test_install_creates_executable_hooks(temp_git_repo: Path) -> None:
 
 def test_install_handles_missing_hook_directories(temp_git_repo: Path) -> None:
     """install.py handles repositories without pre-existing hook directories."""
-    install_script = temp_git_repo / "install.py"
-
     # Remove hooks directory if it exists
     hooks_dir = temp_git_repo / ".git" / "hooks"
     if hooks_dir.exists():
@@ -105,13 +91,7 @@ def test_install_handles_missing_hook_directories(temp_git_repo: Path) -> None:
         shutil.rmtree(hooks_dir)
 
     # Install should create directory
-    result = subprocess.run(
-        ["python", str(install_script)],
-        cwd=str(temp_git_repo),
-        capture_output=True,
-        text=True,
-        timeout=30,
-    )
+    result = _run_install(temp_git_repo)
 
     assert result.returncode in (0, 1), "Install should complete even without existing hooks dir"
     assert hooks_dir.exists(), "Hooks directory should be created"
@@ -119,15 +99,7 @@ def test_install_handles_missing_hook_directories(temp_git_repo: Path) -> None:
 
 def test_install_generates_dispatcher_hooks(temp_git_repo: Path) -> None:
     """install.py generates dispatcher hooks that iterate through .hook files."""
-    install_script = temp_git_repo / "install.py"
-
-    subprocess.run(
-        ["python", str(install_script)],
-        cwd=temp_git_repo,
-        capture_output=True,
-        text=True,
-        timeout=30,
-    )
+    _run_install(temp_git_repo)
 
     # Check pre-commit dispatcher content
     pre_commit = temp_git_repo / ".git" / "hooks" / "pre-commit"
@@ -143,27 +115,13 @@ def test_install_generates_dispatcher_hooks(temp_git_repo: Path) -> None:
 
 def test_install_idempotent(temp_git_repo: Path) -> None:
     """Running install.py twice produces consistent results (idempotent)."""
-    install_script = temp_git_repo / "install.py"
-
     # First install
-    result1 = subprocess.run(
-        ["python", str(install_script)],
-        cwd=temp_git_repo,
-        capture_output=True,
-        text=True,
-        timeout=30,
-    )
+    result1 = _run_install(temp_git_repo)
 
     hooks_after_first = list((temp_git_repo / ".git" / "hooks").glob("*"))
 
     # Second install
-    result2 = subprocess.run(
-        ["python", str(install_script)],
-        cwd=temp_git_repo,
-        capture_output=True,
-        text=True,
-        timeout=30,
-    )
+    result2 = _run_install(temp_git_repo)
 
     hooks_after_second = list((temp_git_repo / ".git" / "hooks").glob("*"))
 
@@ -19,7 +19,7 @@ from githooks.cli.commitmint import (
     has_conventional_type,
     suggest_type_header,
 )
-from tests.conftest import REAL_TEST_REPO_BRANCHES_URL, REAL_TEST_REPO_URL
+from tests.conftest import REAL_TEST_REPO_BRANCHES_URL, REAL_TEST_REPO_URL, git_batch
 
 
 def test_actual_branch_with_multiple_bad_commits(real_test_repo):
@@ -37,7 +37,7 @@ def test_actual_branch_with_multiple_bad_commits(real_test_repo):
     branch_name = f"JT_{ticket}_test_{timestamp}"
 
     # Create and checkout the test branch
-    subprocess.run(["git", "checkout", "-b", branch_name], cwd=repo, check=True, capture_output=True)
+    subprocess.run(["git", "checkout", "-b", branch_name], cwd=repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
     # Verify branch was created correctly
     current_branch = get_current_branch(repo)
@@ -66,8 +66,7 @@ def test_actual_branch_with_multiple_bad_commits(real_test_repo):
     for filename, msg, _ in bad_commits_data:
         file_path = repo / filename
         file_path.write_text(f"Content for {filename}\n", encoding="utf-8")
-        subprocess.run(["git", "add", str(filename)], cwd=repo, check=True, capture_output=True)
-        subprocess.run(["git", "commit", "-m", msg, "--no-verify"], cwd=repo, check=True, capture_output=True)
+        git_batch(repo, ["add", str(filename)], ["commit", "-m", msg, "--no-verify"])
 
     # Verify commits were created
     result = subprocess.run(["git", "log", "--oneline", "--no-decorate"], cwd=repo, check=True, capture_output=True, text=True)
@@ -189,7 +188,9 @@ esac
     assert len(corrections) >= 8, f"Expected at least 8 corrections, but only found {len(corrections)}"
 
     # Clean up filter-branch refs
-    subprocess.run(["git", "update-ref", "-d", "refs/original/refs/heads/" + branch_name], cwd=repo, capture_output=True, check=False)
+    subprocess.run(
+        ["git", "update-ref", "-d", "refs/original/refs/heads/" + branch_name], cwd=repo, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False
+    )
 
     # Verify the corrections stuck by re-reading all commits
     print(f"\n✓ Amended {len(corrections)} commits on branch {branch_name}")
@@ -202,7 +203,9 @@ esac
     # Push the branch to remote so it appears on REAL_TEST_REPO_BRANCHES_URL
     # Use --force since we rewrote commit history
     try:
-        subprocess.run(["git", "push", "--force", "-u", "origin", branch_name], cwd=repo, check=True, capture_output=True, timeout=30)
+        subprocess.run(
+            ["git", "push", "--force", "-u", "origin", branch_name], cwd=repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30
+        )
         print(f"\n✓ Branch '{branch_name}' pushed to {REAL_TEST_REPO_URL}")
         print(f"  View at: {REAL_TEST_REPO_BRANCHES_URL}")
     except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
@@ -224,7 +227,7 @@ def test_actual_branch_all_correction_types(real_test_repo):
     branch_name = f"JT_{ticket}_comprehensive_test"
 
     # Create and checkout branch
-    subprocess.run(["git", "checkout", "-b", branch_name], cwd=repo, check=True, capture_output=True)
+    subprocess.run(["git", "checkout", "-b", branch_name], cwd=repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
     # Test cases with expected corrections
     test_cases = [
@@ -274,9 +277,8 @@ def test_actual_branch_all_correction_types(real_test_repo):
     for test_case in test_cases:
         file_path = repo / test_case["file"]
         file_path.write_text(f"Test content for {test_case['file']}\n", encoding="utf-8")
-        subprocess.run(["git", "add", test_case["file"]], cwd=repo, check=True, capture_output=True)
         # Use --no-verify to skip hooks that might add feat: prefix
-        subprocess.run(["git", "commit", "-m", test_case["original"], "--no-verify"], cwd=repo, check=True, capture_output=True)
+        git_batch(repo, ["add", test_case["file"]], ["commit", "-m", test_case["original"], "--no-verify"])
 
     # Verify each commit and actually amend them with corrections
     corrections_made = []
@@ -363,11 +365,19 @@ def test_actual_branch_all_correction_types(real_test_repo):
             script_file.unlink(missing_ok=True)
 
         # Clean up filter-branch refs
-        subprocess.run(["git", "update-ref", "-d", "refs/original/refs/heads/" + branch_name], cwd=repo, capture_output=True, check=False)
+        subprocess.run(
+            ["git", "update-ref", "-d", "refs/original/refs/heads/" + branch_name],
+            cwd=repo,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
 
     # Push the branch to remote (force push since we rewrote history)
     try:
-        subprocess.run(["git", "push", "--force", "-u", "origin", branch_name], cwd=repo, check=True, capture_output=True, timeout=30)
+        subprocess.run(
+            ["git", "push", "--force", "-u", "origin", branch_name], cwd=repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30
+        )
         print(f"\n✓ Branch '{branch_name}' pushed to {REAL_TEST_REPO_URL}")
         print(f"  View at: {REAL_TEST_REPO_BRANCHES_URL}")
     except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
@@ -391,7 +401,7 @@ def test_actual_branch_extract_ticket_from_branch(real_test_repo):
 
     for branch_name, expected_ticket in test_branches:
         # Delete branch if it already exists (from previous test runs)
-        subprocess.run(["git", "branch", "-D", branch_name], cwd=repo, capture_output=True, check=False)
+        subprocess.run(["git", "branch", "-D", branch_name], cwd=repo, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
         
         # Create branch from current HEAD (don't need to switch back)
         result = subprocess.run(["git", "checkout", "-b", branch_name], cwd=repo, capture_output=True, check=False)
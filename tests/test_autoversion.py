@@ -7,22 +7,22 @@ import os
 
 import pytest
 
+HOOK_PATH = os.path.join(os.path.dirname(__file__), "../post-commit/autoversion-conventional-commit.hook")
 
-def test_autoversion_hook_exists():
+
+def test_autoversion_hook_exists(hook_stats):
     """autoversion-conventional-commit.hook file exists and is readable."""
-    path = os.path.join(os.path.dirname(__file__), "../post-commit/autoversion-conventional-commit.hook")
-    disabled_path = path + ".disabled"
-    if not os.path.exists(path) and os.path.exists(disabled_path):
-        pytest.skip(f"Hook is disabled: {disabled_path}")
-    assert os.path.exists(path)
+    post_commit = hook_stats["post-commit"]
+    if "autoversion-conventional-commit.hook" not in post_commit and "autoversion-conventional-commit.hook.disabled" in post_commit:
+        pytest.skip(f"Hook is disabled: {HOOK_PATH}.disabled")
+    assert "autoversion-conventional-commit.hook" in post_commit
 
 
 def test_autoversion_hook_importable():
     """autoversion-conventional-commit.hook can be loaded as a module (if Python)."""
-    path = os.path.join(os.path.dirname(__file__), "../post-commit/autoversion-conventional-commit.hook")
-    if not path.endswith(".py"):
+    if not HOOK_PATH.endswith(".py"):
         pytest.skip("Not a Python file; skipping import test.")
     load_hook_module = pytest.fixture()(lambda: __import__("tests.conftest").load_hook_module)
 
-    module = load_hook_module(path)
+    module = load_hook_module(HOOK_PATH)
     # Should not raise
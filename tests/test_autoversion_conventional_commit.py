@@ -4,26 +4,29 @@ Tests for autoversion-conventional-commit.hook.
 Verifies existence, importability, and correct behavior for conventional and non-conventional commits.
 """
 
+import io
 import os
-import shutil
+import runpy
 import subprocess
-import sys
-import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
 
 import pytest
 
+from tests.conftest import init_temp_repo_fast
+
 HOOK_PATH = os.path.join(os.path.dirname(__file__), "../post-commit/autoversion-conventional-commit.hook")
 
 
-def test_hook_exists():
+def test_hook_exists(hook_stats):
     """Hook script should exist in post-commit directory."""
-    disabled_path = HOOK_PATH + ".disabled"
-    if not os.path.isfile(HOOK_PATH) and os.path.isfile(disabled_path):
-        pytest.skip(f"Hook is disabled: {disabled_path}")
-    assert os.path.isfile(HOOK_PATH)
+    post_commit = hook_stats["post-commit"]
+    if "autoversion-conventional-commit.hook" not in post_commit and "autoversion-conventional-commit.hook.disabled" in post_commit:
+        pytest.skip(f"Hook is disabled: {HOOK_PATH}.disabled")
+    assert "autoversion-conventional-commit.hook" in post_commit
 
 
-def test_hook_importable(load_hook_module):
+def test_hook_importable(compile_hook):
     """Hook script should be importable as a Python module (if Python)."""
     disabled_path = HOOK_PATH + ".disabled"
     if not os.path.isfile(HOOK_PATH) and os.path.isfile(disabled_path):
@@ -35,34 +38,33 @@ def test_hook_importable(load_hook_module):
         first_line = f.readline()
     if not (first_line.startswith("#!/usr/bin/env python") or first_line.startswith("#!/usr/bin/python")):
         pytest.skip("Not a Python script; skipping import test.")
-    import importlib.util
+    # Parse and byte-compile only; executing the hook would run its module-level side effects
+    compile_hook(HOOK_PATH)
 
-    spec = importlib.util.spec_from_file_location("hook_module", HOOK_PATH)
-    if spec is None or spec.loader is None:
-        pytest.skip("Could not load Python module spec; skipping import test.")
-    load_hook_module(HOOK_PATH)
-    # Should not raise
 
+def run_git_with_commit_message(repo: Path, commit_msg: str, monkeypatch: pytest.MonkeyPatch) -> subprocess.CompletedProcess[str]:
+    """Helper to run the hook in-process inside a fresh git repo at ``repo`` whose only commit has ``commit_msg``.
 
-def run_git_with_commit_message(commit_msg: str) -> subprocess.CompletedProcess[str]:
-    """Helper to run the hook in a temp git repo with a given commit message."""
+    The hook is executed with ``runpy`` as ``__main__`` rather than in a child interpreter; ``SystemExit`` is
+    translated to a return code and stdout/stderr are captured into the returned ``CompletedProcess``.
+    """
     disabled_path = HOOK_PATH + ".disabled"
     if not os.path.isfile(HOOK_PATH) and os.path.isfile(disabled_path):
         pytest.skip(f"Hook is disabled: {disabled_path}")
     if not os.path.isfile(HOOK_PATH):
         pytest.skip(f"Hook not found: {HOOK_PATH}")
 
-    with tempfile.TemporaryDirectory() as repo:
-        subprocess.run(["git", "init"], cwd=repo, check=True)
-        with open(os.path.join(repo, "file.txt"), "w", encoding="utf-8") as f:
-            f.write("test")
-        subprocess.run(["git", "add", "file.txt"], cwd=repo, check=True)
-        subprocess.run(["git", "commit", "-m", commit_msg], cwd=repo, check=True)
-        # Copy hook to repo
-        hook_dest = os.path.join(repo, "autoversion-conventional-commit.hook")
-        shutil.copy(HOOK_PATH, hook_dest)
-        result = subprocess.run([sys.executable, hook_dest], cwd=repo, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False, text=True)
-        return result
+    init_temp_repo_fast(repo, {"file.txt": "test"}, message=commit_msg)
+    monkeypatch.chdir(repo)
+    monkeypatch.setattr("sys.argv", [HOOK_PATH])
+    out, err = io.StringIO(), io.StringIO()
+    code = 0
+    with redirect_stdout(out), redirect_stderr(err):
+        try:
+            runpy.run_path(HOOK_PATH, run_name="__main__")
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else int(e.code is not None)
+    return subprocess.CompletedProcess([HOOK_PATH], code, out.getvalue(), err.getvalue())
 
 
 @pytest.mark.parametrize(
@@ -74,9 +76,9 @@ def run_git_with_commit_message(commit_msg: str) -> subprocess.CompletedProcess[
         ("random message", False),
     ],
 )
-def test_hook_behavior_on_commit_message(msg: str, should_run: bool) -> None:
+def test_hook_behavior_on_commit_message(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, msg: str, should_run: bool) -> None:
     """Hook should run standard-version only for conventional commits."""
-    result = run_git_with_commit_message(msg)
+    result = run_git_with_commit_message(tmp_path, msg, monkeypatch)
     # If npx is missing, exit code will be 1 and error message will mention npx
     if should_run:
         assert result.returncode in (0, 1)
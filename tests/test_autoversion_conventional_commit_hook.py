@@ -8,20 +8,18 @@ import os
 
 import pytest
 
-from tests.conftest import load_hook_module
-
 HOOK_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "../post-commit/autoversion-conventional-commit.hook")).replace("\\", "/")
 
 
-def test_hook_exists():
+def test_hook_exists(hook_stats):
     """Hook script should exist in post-commit directory."""
-    disabled_path = HOOK_PATH + ".disabled"
-    if not os.path.isfile(HOOK_PATH) and os.path.isfile(disabled_path):
-        pytest.skip(f"Hook is disabled: {disabled_path}")
-    assert os.path.isfile(HOOK_PATH)
+    post_commit = hook_stats["post-commit"]
+    if "autoversion-conventional-commit.hook" not in post_commit and "autoversion-conventional-commit.hook.disabled" in post_commit:
+        pytest.skip(f"Hook is disabled: {HOOK_PATH}.disabled")
+    assert "autoversion-conventional-commit.hook" in post_commit
 
 
-def test_hook_importable(load_hook_module):
+def test_hook_importable(compile_hook):
     """Hook script should be importable as a Python module (if Python)."""
     disabled_path = HOOK_PATH + ".disabled"
     if not os.path.isfile(HOOK_PATH) and os.path.isfile(disabled_path):
@@ -33,10 +31,5 @@ def test_hook_importable(load_hook_module):
         first_line = f.readline()
     if not (first_line.startswith("#!/usr/bin/env python") or first_line.startswith("#!/usr/bin/python")):
         pytest.skip("Not a Python script; skipping import test.")
-    import importlib.util
-
-    spec = importlib.util.spec_from_file_location("hook_module", HOOK_PATH)
-    if spec is None or spec.loader is None:
-        pytest.skip("Could not load Python module spec; skipping import test.")
-    load_hook_module(HOOK_PATH)
-    # Should not raise
+    # Parse and byte-compile only; executing the hook would run its module-level side effects
+    compile_hook(HOOK_PATH)
@@ -5,38 +5,34 @@ Verifies existence and execution of the classify-commit-type-by-diff.hook script
 """
 
 import os
-import subprocess
 
 import pytest
 
 HOOK_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "../prepare-commit-msg/classify-commit-type-by-diff.hook")).replace("\\", "/")
 
 
-def test_hook_exists():
+def test_hook_exists(hook_stats):
     """Hook script should exist in prepare-commit-msg directory."""
-    assert os.path.isfile(HOOK_PATH)
+    assert "classify-commit-type-by-diff.hook" in hook_stats["prepare-commit-msg"]
+    assert hook_stats["prepare-commit-msg"]["classify-commit-type-by-diff.hook"].st_size > 0
 
 
-def test_hook_importable(load_hook_module):
+def test_hook_importable(compile_hook):
     """Hook script should be importable as a Python module (if Python)."""
     with open(HOOK_PATH, encoding="utf-8") as f:
         first_line = f.readline()
     if not (first_line.startswith("#!/usr/bin/env python") or first_line.startswith("#!/usr/bin/python")):
         pytest.skip("Not a Python script; skipping import test.")
-    import importlib.util
+    # Parse and byte-compile only; executing the hook would run its module-level side effects
+    compile_hook(HOOK_PATH)
 
-    spec = importlib.util.spec_from_file_location("hook_module", HOOK_PATH)
-    if spec is None or spec.loader is None:
-        pytest.skip("Could not load Python module spec; skipping import test.")
-    load_hook_module(HOOK_PATH)
-    # Should not raise
 
-
-def test_hook_executable():
-    """Hook script should be executable (exit code 0 or 1)."""
+def test_hook_executable(all_hook_results):
+    """Hook script should be readable and parse cleanly (``bash -n``, or compiled if it is a Python hook)."""
     if not os.path.isfile(HOOK_PATH):
         pytest.skip("Hook script not found; skipping test.")
-    result = subprocess.run(["bash", HOOK_PATH], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    if result.returncode == 127:
+    assert os.access(HOOK_PATH, os.R_OK)
+    returncode = all_hook_results[os.path.realpath(HOOK_PATH)]
+    if returncode == 127:
         pytest.skip("Script not found or not executable by Bash; skipping test.")
-    assert result.returncode in (0, 1)
+    assert returncode == 0
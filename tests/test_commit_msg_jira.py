@@ -11,6 +11,8 @@ import tempfile
 
 import pytest
 
+from tests.conftest import BASH
+
 HOOK_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "commit-msg", "commit-msg-jira"))
 
 
@@ -30,9 +32,9 @@ def to_bash_path(path: str) -> str:
     return path
 
 
-def test_hook_exists():
+def test_hook_exists(hook_stats):
     """Hook script should exist in commit-msg directory."""
-    assert os.path.isfile(HOOK_PATH)
+    assert "commit-msg-jira" in hook_stats["commit-msg"]
 
 
 def test_hook_executable():
@@ -41,14 +43,14 @@ def test_hook_executable():
         pytest.skip("Hook script not found; skipping test.")
     # Check if running on Windows and if git is available in Bash
     if sys.platform.startswith("win"):
-        git_check = subprocess.run(["bash", "-c", "which git"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
+        git_check = subprocess.run([BASH, "-c", "which git"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
         if git_check.returncode != 0:
             pytest.skip("Bash or git not available in test environment; skipping test.")
     bash_hook_path = to_bash_path(HOOK_PATH)
     with tempfile.NamedTemporaryFile("w+", delete=False) as f:
         f.write("JT_PTEAE-1234: add feature")
         f.flush()
-        result = subprocess.run(["bash", bash_hook_path, f.name], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
+        result = subprocess.run([BASH, bash_hook_path, f.name], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
         assert result.returncode in (0, 1)
     os.unlink(f.name)
 
@@ -65,13 +67,13 @@ def test_hook_validates_jira_ticket(msg: str, expected: int) -> None:
     if not os.path.isfile(HOOK_PATH):
         pytest.skip("Hook script not found; skipping test.")
     if sys.platform.startswith("win"):
-        git_check = subprocess.run(["bash", "-c", "which git"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
+        git_check = subprocess.run([BASH, "-c", "which git"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
         if git_check.returncode != 0:
             pytest.skip("Bash or git not available in test environment; skipping test.")
     bash_hook_path = to_bash_path(HOOK_PATH)
     with tempfile.NamedTemporaryFile("w+", delete=False) as f:
         f.write(msg)
         f.flush()
-        result = subprocess.run(["bash", bash_hook_path, f.name], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
+        result = subprocess.run([BASH, bash_hook_path, f.name], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
         assert result.returncode == expected
     os.unlink(f.name)
@@ -8,26 +8,20 @@ import os
 
 import pytest
 
-from tests.conftest import load_hook_module
-
 HOOK_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "../commit-msg/commit-msg-smart-commit.hook")).replace("\\", "/")
 
 
-def test_hook_exists():
+def test_hook_exists(hook_stats):
     """Hook script should exist in commit-msg directory."""
-    assert os.path.isfile(HOOK_PATH)
+    assert "commit-msg-smart-commit.hook" in hook_stats["commit-msg"]
+    assert hook_stats["commit-msg"]["commit-msg-smart-commit.hook"].st_size > 0
 
 
-def test_hook_importable(load_hook_module):
+def test_hook_importable(compile_hook):
     """Hook script should be importable as a Python module (if Python)."""
     with open(HOOK_PATH, encoding="utf-8") as f:
         first_line = f.readline()
     if not (first_line.startswith("#!/usr/bin/env python") or first_line.startswith("#!/usr/bin/python")):
         pytest.skip("Not a Python script; skipping import test.")
-    import importlib.util
-
-    spec = importlib.util.spec_from_file_location("hook_module", HOOK_PATH)
-    if spec is None or spec.loader is None:
-        pytest.skip("Could not load Python module spec; skipping import test.")
-    load_hook_module(HOOK_PATH)
-    # Should not raise
+    # Parse and byte-compile only; executing the hook would run its module-level side effects
+    compile_hook(HOOK_PATH)
@@ -6,12 +6,12 @@ via helper functions without mocking Typer prompts.
 
 import os
 import subprocess
-import tempfile
 from pathlib import Path
 from unittest import mock
 
 import pytest
 
+import githooks.cli.commitmint as commitmint
 from githooks.cli.commitmint import (
     add_footer_if_breaking_change,
     ensure_commitlint_installed,
@@ -24,27 +24,28 @@ from githooks.cli.commitmint import (
     suggest_type_header,
     validate_commit_message,
 )
+from tests.conftest import init_temp_repo_fast
 
 
-def init_temp_repo() -> Path:
-    repo_dir = Path(tempfile.mkdtemp(prefix="commitmint_test_"))
-    subprocess.run(["git", "init"], cwd=repo_dir, check=True, capture_output=True)
-    subprocess.run(["git", "config", "user.name", "Test User"], cwd=repo_dir, check=True, capture_output=True)
-    subprocess.run(["git", "config", "user.email", "test.user@example.com"], cwd=repo_dir, check=True, capture_output=True)
-    # Disable hooks in test repo to avoid interference
-    subprocess.run(["git", "config", "core.hooksPath", "/dev/null"], cwd=repo_dir, check=True, capture_output=True)
-    return repo_dir
+def _git(args: list[str], cwd: Path, *, capture: bool = False) -> subprocess.CompletedProcess:
+    """Run a git command in ``cwd``; output is discarded unless ``capture`` is set."""
+    kwargs: dict = {"cwd": cwd, "check": True}
+    if capture:
+        kwargs.update(capture_output=True, text=True)
+    else:
+        kwargs.update(stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return subprocess.run(["git", *args], **kwargs)
+
+
+@pytest.fixture
+def repo(git_repo: Path) -> Path:
+    """Fresh Git repo per test, cloned from the session template (see tests/conftest.py)."""
+    return git_repo
 
 
 def test_duplicate_scope_is_fixed():
     """Duplicate scope in header is removed: 'feat(scope): scope: msg' -> 'feat(scope): msg'."""
-    repo = init_temp_repo()
-    # Create initial commit
-    Path(repo / "README.md").write_text("hello", encoding="utf-8")
-    subprocess.run(["git", "add", "README.md"], cwd=repo, check=True, capture_output=True)
     msg = "feat(core): core: add readme"
-    subprocess.run(["git", "commit", "-m", msg], cwd=repo, check=True, capture_output=True)
-
     fixed = fix_duplicate_scope(msg)
     assert fixed == "feat(core): add readme"
 
@@ -57,15 +58,7 @@ def test_duplicate_scope_noop_when_not_present():
 
 def test_insert_ticket_in_header_when_missing():
     """Ticket JT_PTEAE-0000 is inserted after header when missing."""
-    repo = init_temp_repo()
-    # Create branch with ISSUE-0000 (generic) style to simulate branch naming
-    subprocess.run(["git", "checkout", "-b", "feature/ABCD-0000_sample"], cwd=repo, check=True, capture_output=True)
-
-    # Make a commit missing the ticket in header/body
-    Path(repo / "file.txt").write_text("data", encoding="utf-8")
-    subprocess.run(["git", "add", "file.txt"], cwd=repo, check=True, capture_output=True)
     msg = "fix(api): correct timeout logic"
-    subprocess.run(["git", "commit", "-m", msg], cwd=repo, check=True, capture_output=True)
 
     # Ensure ticket placement policy applies
     ticket = "ISSUE-0000"
@@ -121,8 +114,6 @@ def test_infer_branch_name_uppercases_ticket_and_uses_alias():
 
 def test_python_side_validation_reports_errors_without_commitlint():
     """When commitlint is absent, python-side validation flags missing type and ticket."""
-    import os
-
     # Prevent automatic installation of commitlint during test
     old_val = os.environ.get("COMMITMINT_SKIP_INSTALL")
     os.environ["COMMITMINT_SKIP_INSTALL"] = "1"
@@ -179,50 +170,55 @@ BAD_COMMITS = [
 ]
 
 
+def _correct_commit_message(original_msg: str, ticket: str) -> tuple[str, bool]:
+    """Run the commitmint correction stages on a message without Typer prompts.
+
+    Returns (final_msg, is_breaking).
+    """
+    # Check for breaking change FIRST before type suggestion might mask it
+    is_breaking = "!" in original_msg or "BREAKING CHANGE:" in original_msg
+
+    # Stage 0: Type suggestion (only if missing type)
+    corrected_msg = original_msg
+    if not has_conventional_type(corrected_msg):
+        corrected_msg = suggest_type_header(corrected_msg)
+
+    # Stage 1: Duplicate scope fix
+    corrected_msg = fix_duplicate_scope(corrected_msg)
+
+    # Stage 2: Ticket insertion
+    corrected_msg = ensure_ticket_in_header(corrected_msg, ticket)
+
+    # Stage 3: Breaking change footer (detect from FINAL corrected msg OR original flag)
+    if is_breaking or ("!" in corrected_msg.split("\n")[0]):
+        return add_footer_if_breaking_change(corrected_msg, ticket), is_breaking
+    return corrected_msg, is_breaking
+
+
 @pytest.mark.parametrize("bad_msg,description", BAD_COMMITS, ids=[desc for _, desc in BAD_COMMITS])
-def test_bad_commit_corrected_format(bad_msg: str, description: str):  # noqa: ARG001
+def test_bad_commit_corrected_format(bad_msg: str, description: str, repo):  # noqa: ARG001
     """Verify each bad commit message can be corrected using commitmint helpers.
 
     Simulates the correction pipeline without interactive Typer prompts by directly
     calling the helper functions on each bad commit message.
     """
-    repo = init_temp_repo()
     ticket = "ISSUE-1234"
 
     # Create test branch
-    subprocess.run(["git", "checkout", "-b", f"feature/{ticket}_test-corrections"], cwd=repo, check=True, capture_output=True)
+    _git(["checkout", "-b", f"feature/{ticket}_test-corrections"], repo)
 
     # Create commit with bad message
     file_path = repo / "test_file.txt"
     file_path.write_text("test content", encoding="utf-8")
-    subprocess.run(["git", "add", str(file_path)], cwd=repo, check=True, capture_output=True)
-    subprocess.run(["git", "commit", "-m", bad_msg], cwd=repo, check=True, capture_output=True)
+    _git(["add", str(file_path)], repo)
+    _git(["commit", "-m", bad_msg], repo)
 
     # Get the commit message
-    result = subprocess.run(["git", "log", "HEAD", "-1", "--pretty=%B"], cwd=repo, check=True, capture_output=True, text=True)
+    result = _git(["log", "HEAD", "-1", "--pretty=%B"], repo, capture=True)
     original_msg = result.stdout.strip()
 
     # Apply correction pipeline
-    corrected_msg = original_msg
-
-    # Check for breaking change FIRST before type suggestion might mask it
-    is_breaking = "!" in original_msg or "BREAKING CHANGE:" in original_msg
-
-    # Stage 0: Type suggestion (only if missing type)
-    if not has_conventional_type(corrected_msg):
-        corrected_msg = suggest_type_header(corrected_msg)
-
-    # Stage 1: Duplicate scope fix
-    corrected_msg = fix_duplicate_scope(corrected_msg)
-
-    # Stage 2: Ticket insertion
-    corrected_msg = ensure_ticket_in_header(corrected_msg, ticket)
-
-    # Stage 3: Breaking change footer (detect from FINAL corrected msg OR original flag)
-    if is_breaking or ("!" in corrected_msg.split("\n")[0]):
-        final_msg = add_footer_if_breaking_change(corrected_msg, ticket)
-    else:
-        final_msg = corrected_msg
+    final_msg, is_breaking = _correct_commit_message(original_msg, ticket)
 
     # Validate final message has required elements
     assert has_conventional_type(final_msg), f"Still missing conventional type: {final_msg}"
@@ -233,17 +229,19 @@ def test_bad_commit_corrected_format(bad_msg: str, description: str):  # noqa: A
         assert f"{ticket} #comment" in final_msg, f"Missing Smart Commit footer: {final_msg}"
 
 
-def test_thirty_bad_commits_corrected_format():
+@pytest.mark.slow
+def test_thirty_bad_commits_corrected_format(repo):
     """Create 30 bad commits and verify each can be corrected using commitmint helpers.
 
+    Redundant with ``test_bad_commit_corrected_format``; only runs when RUN_SLOW is set.
+
     Simulates the correction pipeline without interactive Typer prompts by directly
     calling the helper functions on each bad commit message.
     """
-    repo = init_temp_repo()
     ticket = "ISSUE-1234"
 
     # Create test branch
-    subprocess.run(["git", "checkout", "-b", f"feature/{ticket}_test-corrections"], cwd=repo, check=True, capture_output=True)
+    _git(["checkout", "-b", f"feature/{ticket}_test-corrections"], repo)
     # Open repo branch in browser for visual inspection if needed
 
     # 30 variations of bad commit messages covering common issues
@@ -290,41 +288,21 @@ def test_thirty_bad_commits_corrected_format():
     for idx, msg in enumerate(bad_commits, start=1):
         file_path = repo / f"file_{idx}.txt"
         file_path.write_text(f"content {idx}", encoding="utf-8")
-        subprocess.run(["git", "add", str(file_path)], cwd=repo, check=True, capture_output=True)
-        subprocess.run(["git", "commit", "-m", msg], cwd=repo, check=True, capture_output=True)
+        _git(["add", str(file_path)], repo)
+        _git(["commit", "-m", msg], repo)
 
     # Now verify corrections work for each commit message
     corrections_applied = 0
-    subprocess.run(["git", "checkout", f"feature/{ticket}_test-corrections"], cwd=repo, check=True, capture_output=True)
+    _git(["checkout", f"feature/{ticket}_test-corrections"], repo)
 
     for idx in range(1, 31):
         # Get the commit message for commit at HEAD~(30-idx)
         offset = 30 - idx
-        result = subprocess.run(["git", "log", f"HEAD~{offset}", "-1", "--pretty=%B"], cwd=repo, check=True, capture_output=True, text=True)
+        result = _git(["log", f"HEAD~{offset}", "-1", "--pretty=%B"], repo, capture=True)
         original_msg = result.stdout.strip()
 
         # Apply correction pipeline
-        corrected_msg = original_msg
-
-        # Check for breaking change FIRST before type suggestion might mask it
-        is_breaking = "!" in original_msg or "BREAKING CHANGE:" in original_msg
-
-        # Stage 0: Type suggestion (only if missing type)
-        if not has_conventional_type(corrected_msg):
-            corrected_msg = suggest_type_header(corrected_msg)
-
-        # Stage 1: Duplicate scope fix
-        corrected_msg = fix_duplicate_scope(corrected_msg)
-
-        # Stage 2: Ticket insertion
-        corrected_msg = ensure_ticket_in_header(corrected_msg, ticket)
-
-        # Stage 3: Breaking change footer (detect from FINAL corrected msg OR original flag)
-        # Use add_footer_if_breaking_change which does its own detection
-        if is_breaking or ("!" in corrected_msg.split("\n")[0]):
-            final_msg = add_footer_if_breaking_change(corrected_msg, ticket)
-        else:
-            final_msg = corrected_msg
+        final_msg, is_breaking = _correct_commit_message(original_msg, ticket)
 
         # Verify corrections were effective
         if final_msg != original_msg:
@@ -486,223 +464,184 @@ def test_validate_commit_message_commitlint_error():
                     assert len(errors) > 0
 
 
-def test_main_interactive_workflow():
+@mock.patch.dict(os.environ, {"COMMITMINT_SKIP_INSTALL": "1"})
+@mock.patch("typer.echo")
+@mock.patch("typer.prompt")
+@mock.patch("typer.confirm")
+def test_main_interactive_workflow(mock_confirm, mock_prompt, _mock_echo, monkeypatch, repo):
     """Test main() interactive workflow with mocked user inputs."""
-    repo = init_temp_repo()
 
     # Create initial commit
     Path(repo / "test.txt").write_text("content", encoding="utf-8")
-    subprocess.run(["git", "add", "test.txt"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(["git", "commit", "-m", "initial commit"], cwd=repo, check=True, capture_output=True)
+    _git(["add", "test.txt"], repo)
+    _git(["commit", "-m", "initial commit"], repo)
 
     # Create branch
-    subprocess.run(["git", "checkout", "-b", "ISSUE-456_test"], cwd=repo, check=True, capture_output=True)
+    _git(["checkout", "-b", "ISSUE-456_test"], repo)
 
     # Make a bad commit
     Path(repo / "test2.txt").write_text("content2", encoding="utf-8")
-    subprocess.run(["git", "add", "test2.txt"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(["git", "commit", "-m", "add feature"], cwd=repo, check=True, capture_output=True)
-
-    with mock.patch("typer.confirm") as mock_confirm:
-        with mock.patch("typer.prompt") as mock_prompt:
-            with mock.patch("typer.echo"):
-                with mock.patch.dict(os.environ, {"COMMITMINT_SKIP_INSTALL": "1"}):
-                    # User confirms all suggestions
-                    mock_confirm.return_value = True
-                    mock_prompt.return_value = "ISSUE-456"
-
-                    # Change to repo directory
-                    original_cwd = os.getcwd()
-                    try:
-                        os.chdir(repo)
-                        main("test", "ISSUE-456")
-                    finally:
-                        os.chdir(original_cwd)
-
-                    # Verify commit was amended
-                    result = subprocess.run(["git", "log", "-1", "--pretty=%B"], cwd=repo, check=True, capture_output=True, text=True)
-                    amended_msg = result.stdout.strip()
-
-                    # Should have conventional type and ticket
-                    assert has_conventional_type(amended_msg)
-                    assert "ISSUE-456" in amended_msg
-
-
-def test_main_user_rejects_changes():
+    _git(["add", "test2.txt"], repo)
+    _git(["commit", "-m", "add feature"], repo)
+
+    # User confirms all suggestions
+    mock_confirm.return_value = True
+    mock_prompt.return_value = "ISSUE-456"
+
+    # Change to repo directory
+    monkeypatch.chdir(repo)
+    main("test", "ISSUE-456")
+
+    # Verify commit was amended
+    result = _git(["log", "-1", "--pretty=%B"], repo, capture=True)
+    amended_msg = result.stdout.strip()
+
+    # Should have conventional type and ticket
+    assert has_conventional_type(amended_msg)
+    assert "ISSUE-456" in amended_msg
+
+
+@mock.patch.dict(os.environ, {"COMMITMINT_SKIP_INSTALL": "1"})
+@mock.patch("typer.echo")
+@mock.patch("typer.confirm")
+def test_main_user_rejects_changes(mock_confirm, _mock_echo, monkeypatch, repo):
     """Test main() when user rejects proposed changes."""
-    repo = init_temp_repo()
 
     # Create initial commit
     Path(repo / "test.txt").write_text("content", encoding="utf-8")
-    subprocess.run(["git", "add", "test.txt"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(["git", "commit", "-m", "initial commit"], cwd=repo, check=True, capture_output=True)
+    _git(["add", "test.txt"], repo)
+    _git(["commit", "-m", "initial commit"], repo)
 
     # Create branch
-    subprocess.run(["git", "checkout", "-b", "ISSUE-789_test"], cwd=repo, check=True, capture_output=True)
+    _git(["checkout", "-b", "ISSUE-789_test"], repo)
 
     # Make a commit that will pass validation (to avoid prompt)
     Path(repo / "test2.txt").write_text("content2", encoding="utf-8")
-    subprocess.run(["git", "add", "test2.txt"], cwd=repo, check=True, capture_output=True)
+    _git(["add", "test2.txt"], repo)
     original_msg = "feat: ISSUE-789 add new widget"
-    subprocess.run(["git", "commit", "-m", original_msg], cwd=repo, check=True, capture_output=True)
+    _git(["commit", "-m", original_msg], repo)
 
-    with mock.patch("typer.confirm") as mock_confirm:
-        with mock.patch("typer.echo"):
-            with mock.patch.dict(os.environ, {"COMMITMINT_SKIP_INSTALL": "1"}):
-                # User rejects final amend
-                mock_confirm.return_value = False
+    # User rejects final amend
+    mock_confirm.return_value = False
 
-                original_cwd = os.getcwd()
-                try:
-                    os.chdir(repo)
-                    main("test", "ISSUE-789")
-                finally:
-                    os.chdir(original_cwd)
+    monkeypatch.chdir(repo)
+    main("test", "ISSUE-789")
 
-                # Commit should remain unchanged since user rejected amend
-                result = subprocess.run(["git", "log", "-1", "--pretty=%B"], cwd=repo, check=True, capture_output=True, text=True)
-                final_msg = result.stdout.strip()
-                assert final_msg == original_msg
+    # Commit should remain unchanged since user rejected amend
+    result = _git(["log", "-1", "--pretty=%B"], repo, capture=True)
+    final_msg = result.stdout.strip()
+    assert final_msg == original_msg
 
 
-def test_main_with_validation_errors():
+@mock.patch.dict(os.environ, {"COMMITMINT_SKIP_INSTALL": "1"})
+@mock.patch("typer.echo")
+@mock.patch("typer.prompt")
+@mock.patch("typer.confirm")
+def test_main_with_validation_errors(mock_confirm, mock_prompt, _mock_echo, monkeypatch, repo):
     """Test main() when validation finds errors and user edits message."""
-    repo = init_temp_repo()
 
     # Create initial commit
     Path(repo / "test.txt").write_text("content", encoding="utf-8")
-    subprocess.run(["git", "add", "test.txt"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(["git", "commit", "-m", "initial"], cwd=repo, check=True, capture_output=True)
+    _git(["add", "test.txt"], repo)
+    _git(["commit", "-m", "initial"], repo)
 
     # Create branch and bad commit
-    subprocess.run(["git", "checkout", "-b", "ABC-111_feature"], cwd=repo, check=True, capture_output=True)
+    _git(["checkout", "-b", "ABC-111_feature"], repo)
     Path(repo / "test2.txt").write_text("data", encoding="utf-8")
-    subprocess.run(["git", "add", "test2.txt"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(["git", "commit", "-m", "bad message"], cwd=repo, check=True, capture_output=True)
-
-    with mock.patch("typer.confirm") as mock_confirm:
-        with mock.patch("typer.prompt") as mock_prompt:
-            with mock.patch("typer.echo"):
-                with mock.patch.dict(os.environ, {"COMMITMINT_SKIP_INSTALL": "1"}):
-                    # Accept corrections but edit final message
-                    mock_confirm.side_effect = [True, True, True, True]  # Accept all stages + final
-                    mock_prompt.return_value = "feat: ABC-111 proper message"
-
-                    original_cwd = os.getcwd()
-                    try:
-                        os.chdir(repo)
-                        main("test", "ABC-111")
-                    finally:
-                        os.chdir(original_cwd)
-
-
-def test_main_checkout_branch_error():
-    """Test main() when branch checkout fails."""
-    repo = init_temp_repo()
+    _git(["add", "test2.txt"], repo)
+    _git(["commit", "-m", "bad message"], repo)
 
-    with mock.patch("githooks.core.git_operations.safe_run_git") as mock_git:
-        with mock.patch("typer.echo"):
-            with pytest.raises(SystemExit):
-                mock_git.side_effect = RuntimeError("Branch not found")
+    # Accept corrections but edit final message
+    mock_confirm.side_effect = [True, True, True, True]  # Accept all stages + final
+    mock_prompt.return_value = "feat: ABC-111 proper message"
 
-                original_cwd = os.getcwd()
-                try:
-                    os.chdir(repo)
-                    main("test", "ISSUE-999")
-                finally:
-                    os.chdir(original_cwd)
+    monkeypatch.chdir(repo)
+    main("test", "ABC-111")
 
 
-def test_main_infers_branch_name():
+@mock.patch("typer.echo")
+@mock.patch("githooks.core.git_operations.safe_run_git")
+@mock.patch("githooks.cli.commitmint.get_current_branch", return_value=None)
+def test_main_checkout_branch_error(_mock_branch, mock_git, mock_echo, monkeypatch, repo):
+    """Test main() when branch checkout fails."""
+    mock_git.side_effect = RuntimeError("Branch not found")
+
+    monkeypatch.chdir(repo)
+    with pytest.raises(SystemExit):
+        main("test", "ISSUE-999")
+    mock_echo.assert_any_call("[ERROR] Could not checkout branch: Branch not found")
+
+
+@mock.patch.dict(os.environ, {"COMMITMINT_SKIP_INSTALL": "1"})
+@mock.patch("githooks.core.git_operations.safe_run_git")
+@mock.patch("typer.echo")
+@mock.patch("typer.confirm")
+@mock.patch("githooks.core.github_utils.get_current_branch")
+def test_main_infers_branch_name(mock_branch, mock_confirm, _mock_echo, mock_git, monkeypatch, repo):
     """Test main() infers branch name when not on a branch."""
-    repo = init_temp_repo()
 
     # Create detached HEAD state
     Path(repo / "test.txt").write_text("content", encoding="utf-8")
-    subprocess.run(["git", "add", "test.txt"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(["git", "commit", "-m", "initial"], cwd=repo, check=True, capture_output=True)
-
-    with mock.patch("githooks.core.github_utils.get_current_branch") as mock_branch:
-        with mock.patch("typer.confirm") as mock_confirm:
-            with mock.patch("typer.echo"):
-                with mock.patch("githooks.core.git_operations.safe_run_git") as mock_git:
-                    with mock.patch.dict(os.environ, {"COMMITMINT_SKIP_INSTALL": "1"}):
-                        mock_branch.return_value = None  # Not on any branch
-                        mock_confirm.return_value = False
-                        # Return valid message to avoid validation prompt
-                        mock_git.return_value = mock.Mock(stdout="feat: XYZ-123 test", returncode=0)
-
-                        original_cwd = os.getcwd()
-                        try:
-                            os.chdir(repo)
-                            # Should infer branch name from alias + ticket
-                            main("myrepo", "XYZ-123")
-                        finally:
-                            os.chdir(original_cwd)
-
-
-def test_main_prompt_for_ticket():
+    _git(["add", "test.txt"], repo)
+    _git(["commit", "-m", "initial"], repo)
+
+    mock_branch.return_value = None  # Not on any branch
+    mock_confirm.return_value = False
+    # Return valid message to avoid validation prompt
+    mock_git.return_value = mock.Mock(stdout="feat: XYZ-123 test", returncode=0)
+
+    monkeypatch.chdir(repo)
+    # Should infer branch name from alias + ticket
+    main("myrepo", "XYZ-123")
+
+
+@mock.patch.dict(os.environ, {"COMMITMINT_SKIP_INSTALL": "1"})
+@mock.patch("typer.echo")
+@mock.patch("typer.confirm")
+@mock.patch("typer.prompt")
+@mock.patch("githooks.core.github_utils.extract_ticket_from_branch")
+def test_main_prompt_for_ticket(mock_extract, mock_prompt, mock_confirm, _mock_echo, monkeypatch, repo):
     """Test main() prompts for ticket when not provided."""
-    repo = init_temp_repo()
 
     Path(repo / "test.txt").write_text("content", encoding="utf-8")
-    subprocess.run(["git", "add", "test.txt"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(["git", "commit", "-m", "initial"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(["git", "checkout", "-b", "feature-branch"], cwd=repo, check=True, capture_output=True)
-
-    with mock.patch("githooks.core.github_utils.extract_ticket_from_branch") as mock_extract:
-        with mock.patch("typer.prompt") as mock_prompt:
-            with mock.patch("typer.confirm") as mock_confirm:
-                with mock.patch("typer.echo"):
-                    with mock.patch.dict(os.environ, {"COMMITMINT_SKIP_INSTALL": "1"}):
-                        mock_extract.return_value = None  # No ticket in branch
-                        mock_prompt.return_value = "PROMPT-456"
-                        mock_confirm.return_value = False
-
-                        original_cwd = os.getcwd()
-                        try:
-                            os.chdir(repo)
-                            main("test", "")  # Empty ticket
-                        finally:
-                            os.chdir(original_cwd)
-
-                        # Should have prompted for ticket
-                        mock_prompt.assert_called()
-
-
-def test_main_accepts_duplicate_scope_fix():
-    """Test main() when user accepts duplicate scope fix."""
-    repo = init_temp_repo()
+    _git(["add", "test.txt"], repo)
+    _git(["commit", "-m", "initial"], repo)
+    _git(["checkout", "-b", "feature-branch"], repo)
 
-    Path(repo / "test.txt").write_text("content", encoding="utf-8")
-    subprocess.run(["git", "add", "test.txt"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(["git", "commit", "-m", "initial"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(["git", "checkout", "-b", "FIX-111_dup"], cwd=repo, check=True, capture_output=True)
+    mock_extract.return_value = None  # No ticket in branch
+    mock_prompt.return_value = "PROMPT-456"
+    mock_confirm.return_value = False
+
+    monkeypatch.chdir(repo)
+    main("test", "")  # Empty ticket
+
+    # Should have prompted for ticket
+    mock_prompt.assert_called()
+
+
+def test_main_accepts_duplicate_scope_fix(monkeypatch, tmp_path):
+    """Test main() when user accepts duplicate scope fix."""
+    repo = init_temp_repo_fast(tmp_path, {"test.txt": "content"}, branch="FIX-111_dup")
 
     # Create commit with duplicate scope
     Path(repo / "test2.txt").write_text("data", encoding="utf-8")
-    subprocess.run(["git", "add", "test2.txt"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(["git", "commit", "-m", "feat(core): core: implement"], cwd=repo, check=True, capture_output=True)
-
-    with mock.patch("typer.confirm") as mock_confirm:
-        with mock.patch("typer.echo"):
-            with mock.patch.dict(os.environ, {"COMMITMINT_SKIP_INSTALL": "1"}):
-                # Accept duplicate scope fix, then accept ticket, then accept final amend
-                mock_confirm.side_effect = [True, True, True]
-
-                original_cwd = os.getcwd()
-                try:
-                    os.chdir(repo)
-                    main("test", "FIX-111")
-                finally:
-                    os.chdir(original_cwd)
-
-                # Verify duplicate scope was fixed in commit
-                result = subprocess.run(["git", "log", "-1", "--pretty=%B"], cwd=repo, check=True, capture_output=True, text=True)
-                amended_msg = result.stdout.strip()
-                # Should not have "core: core:"
-                assert "core: core:" not in amended_msg
-                assert "FIX-111" in amended_msg
+    _git(["add", "test2.txt"], repo)
+    _git(["commit", "-m", "feat(core): core: implement"], repo)
+
+    # Accept duplicate scope fix, then accept ticket, then accept final amend
+    answers = iter([True, True, True])
+    monkeypatch.setattr("typer.confirm", lambda *a, **k: next(answers))
+    monkeypatch.setattr("typer.echo", lambda *a, **k: None)
+    monkeypatch.setenv("COMMITMINT_SKIP_INSTALL", "1")
+    monkeypatch.chdir(repo)
+    main("test", "FIX-111")
+
+    # Verify duplicate scope was fixed in commit
+    result = _git(["log", "-1", "--pretty=%B"], repo, capture=True)
+    amended_msg = result.stdout.strip()
+    # Should not have "core: core:"
+    assert "core: core:" not in amended_msg
+    assert "FIX-111" in amended_msg
 
 
 def test_validate_with_node_but_no_commitlint():
@@ -735,3 +674,36 @@ def test_validate_with_node_but_no_commitlint():
             # Should fall back to Python validation
             assert ok
             assert len(errors) == 0
+
+
+def test_validate_skips_commitlint_install_once_checked(monkeypatch):
+    """Once node and commitlint have been probed, validation never re-enters the install path."""
+    monkeypatch.setattr(commitmint, "_NODE_CHECKED", True)
+    monkeypatch.setattr(commitmint, "_COMMITLINT_CHECKED", True)
+    monkeypatch.delenv("COMMITMINT_SKIP_INSTALL", raising=False)
+
+    # commitlint is unavailable: which() finds node and npm only
+    with mock.patch("shutil.which", side_effect={"node": "/usr/bin/node", "npm": "/usr/bin/npm"}.get):
+        with mock.patch.object(commitmint, "ensure_commitlint_installed") as mock_install:
+            with mock.patch.object(commitmint, "subprocess") as mock_subprocess:
+                ok, errors = validate_commit_message("feat: TEST-123 message")
+
+    mock_install.assert_not_called()
+    mock_subprocess.run.assert_not_called()
+    # Falls back to the Python-side rules, which this message satisfies
+    assert ok
+    assert errors == []
+
+
+def test_validate_installs_commitlint_at_most_once(monkeypatch):
+    """The first validation attempts a commitlint install; later ones reuse the checked flag."""
+    monkeypatch.setattr(commitmint, "_NODE_CHECKED", False)
+    monkeypatch.setattr(commitmint, "_COMMITLINT_CHECKED", False)
+    monkeypatch.delenv("COMMITMINT_SKIP_INSTALL", raising=False)
+
+    with mock.patch("shutil.which", side_effect={"node": "/usr/bin/node", "npm": "/usr/bin/npm"}.get):
+        with mock.patch.object(commitmint, "ensure_commitlint_installed") as mock_install:
+            validate_commit_message("feat: TEST-123 message")
+            validate_commit_message("feat: TEST-123 message")
+
+    mock_install.assert_called_once()
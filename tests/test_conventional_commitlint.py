@@ -7,22 +7,19 @@ import os
 
 import pytest
 
+HOOK_PATH = os.path.join(os.path.dirname(__file__), "../commit-msg/conventional-commitlint.hook")
 
-def test_conventional_commitlint_hook_exists():
+
+def test_conventional_commitlint_hook_exists(hook_stats):
     """conventional-commitlint.hook file exists and is readable."""
-    path = os.path.join(os.path.dirname(__file__), "../commit-msg/conventional-commitlint.hook")
-    disabled_path = path + ".disabled"
-    if os.path.exists(disabled_path):
+    if "conventional-commitlint.hook.disabled" in hook_stats["commit-msg"]:
         pytest.skip("Hook is disabled (.hook.disabled)")
-    assert os.path.exists(path)
+    assert "conventional-commitlint.hook" in hook_stats["commit-msg"]
 
 
-def test_conventional_commitlint_hook_importable():
+def test_conventional_commitlint_hook_importable(load_hook_module):
     """conventional-commitlint.hook can be loaded as a module (if Python)."""
-    path = os.path.join(os.path.dirname(__file__), "../commit-msg/conventional-commitlint.hook")
-    if not path.endswith(".py"):
+    if not HOOK_PATH.endswith(".py"):
         pytest.skip("Not a Python file; skipping import test.")
-    from tests.conftest import load_hook_module
-
-    load_hook_module(path)
+    load_hook_module(HOOK_PATH)
     # Should not raise
@@ -1,196 +1,119 @@
 """Tests for create_and_push_branch retry logic."""
 
-import subprocess
 import time
+from collections import namedtuple
 from pathlib import Path
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import MagicMock
 
 import pytest
 
 from githooks.core.github_utils import create_and_push_branch
 
+# Lightweight stand-in for subprocess.CompletedProcess; create_and_push_branch only reads these fields
+R = namedtuple("R", "returncode stdout stderr", defaults=("", ""))
+
+
+def setup_prefix():
+    """Results for creating a new branch: rev-parse (missing), checkout root branch, checkout -b."""
+    return [R(1), R(0), R(0)]
+
 
 class TestCreateAndPushBranchRetry:
     """Tests for create_and_push_branch with retry logic."""
 
-    def test_successful_push_returns_true(self, temp_git_repo):
+    @pytest.fixture(autouse=True)
+    def sleep_calls(self, monkeypatch):
+        """Replace time.sleep for every test, recording requested delays instead of sleeping."""
+        calls = []
+        monkeypatch.setattr(time, "sleep", calls.append)
+        return calls
+
+    @pytest.fixture(autouse=True)
+    def mock_run(self, git_repo, monkeypatch):
+        """Replace subprocess.run for every test; each test scripts results via ``side_effect``.
+
+        Depends on ``git_repo`` so the real clone runs before subprocess.run is patched.
+        """
+        mock = MagicMock()
+        monkeypatch.setattr("githooks.core.github_utils.subprocess.run", mock)
+        return mock
+
+    def test_successful_push_returns_true(self, git_repo, mock_run):
         """create_and_push_branch returns True on successful push."""
-        branch_name = "test-branch"
-
-        # Mock subprocess to simulate success
-        with patch("githooks.core.github_utils.subprocess.run") as mock_run:
-            # First call: rev-parse (branch doesn't exist)
-            # Second call: checkout root branch (success)
-            # Third call: checkout -b new branch (success)
-            # Fourth call: git push (success)
-            mock_results = [
-                MagicMock(returncode=1, stderr=""),  # rev-parse: branch doesn't exist
-                MagicMock(returncode=0),  # checkout root branch
-                MagicMock(returncode=0),  # checkout -b
-                MagicMock(returncode=0, stdout="", stderr=""),  # git push success
-            ]
-            mock_run.side_effect = mock_results
-
-            result = create_and_push_branch(Path(temp_git_repo), branch_name, "develop")
-            assert result is True
-
-    def test_branch_already_exists_locally(self, temp_git_repo):
+        mock_run.side_effect = setup_prefix() + [R(0)]  # git push success
+
+        result = create_and_push_branch(Path(git_repo), "test-branch", "develop")
+        assert result is True
+
+    def test_branch_already_exists_locally(self, git_repo, mock_run):
         """create_and_push_branch handles existing local branch."""
-        branch_name = "test-branch"
-
-        with patch("githooks.core.github_utils.subprocess.run") as mock_run:
-            # First call: rev-parse (branch exists)
-            # Second call: checkout existing branch
-            # Third call: git push success
-            mock_results = [
-                MagicMock(returncode=0),  # rev-parse: branch exists
-                MagicMock(returncode=0),  # checkout existing branch
-                MagicMock(returncode=0, stdout="", stderr=""),  # git push success
-            ]
-            mock_run.side_effect = mock_results
-
-            result = create_and_push_branch(Path(temp_git_repo), branch_name, "develop")
-            assert result is True
-
-    def test_branch_already_exists_on_remote(self, temp_git_repo):
+        mock_run.side_effect = [
+            R(0),  # rev-parse: branch exists
+            R(0),  # checkout existing branch
+            R(0),  # git push success
+        ]
+
+        result = create_and_push_branch(Path(git_repo), "test-branch", "develop")
+        assert result is True
+
+    def test_branch_already_exists_on_remote(self, git_repo, mock_run):
         """create_and_push_branch succeeds if branch already exists on remote."""
-        branch_name = "test-branch"
-
-        with patch("githooks.core.github_utils.subprocess.run") as mock_run:
-            # First call: rev-parse (branch doesn't exist locally)
-            # Second call: checkout root
-            # Third call: checkout -b new branch
-            # Fourth call: git push fails with "already exists"
-            mock_results = [
-                MagicMock(returncode=1, stderr=""),
-                MagicMock(returncode=0),
-                MagicMock(returncode=0),
-                MagicMock(returncode=1, stdout="", stderr="remote: error: branch already exists"),  # already exists
-            ]
-            mock_run.side_effect = mock_results
-
-            result = create_and_push_branch(Path(temp_git_repo), branch_name, "develop")
-            assert result is True
-
-    def test_transient_network_error_retries(self, temp_git_repo):
+        mock_run.side_effect = setup_prefix() + [R(1, "", "remote: error: branch already exists")]
+
+        result = create_and_push_branch(Path(git_repo), "test-branch", "develop")
+        assert result is True
+
+    def test_transient_network_error_retries(self, git_repo, mock_run, sleep_calls):
         """create_and_push_branch retries on transient network errors."""
-        branch_name = "test-branch"
-
-        with patch("githooks.core.github_utils.subprocess.run") as mock_run:
-            with patch("time.sleep") as mock_sleep:
-                # Setup: branch doesn't exist, need to create it
-                # Then simulate: push fails with network error, then succeeds
-                mock_results = [
-                    MagicMock(returncode=1, stderr=""),  # rev-parse: doesn't exist
-                    MagicMock(returncode=0),  # checkout develop
-                    MagicMock(returncode=0),  # checkout -b
-                    # First push attempt: network error (will be retried)
-                    MagicMock(
-                        returncode=1,
-                        stdout="",
-                        stderr="fatal: Connection reset by peer",
-                    ),
-                    # Second push attempt: success
-                    MagicMock(returncode=0, stdout="", stderr=""),
-                ]
-                mock_run.side_effect = mock_results
-
-                result = create_and_push_branch(Path(temp_git_repo), branch_name, "develop", max_retries=3)
-                assert result is True
-
-                # Verify retry sleep was called (exponential backoff: 1s for first retry)
-                mock_sleep.assert_called_with(1)
-
-    def test_persistent_error_after_retries_fails(self, temp_git_repo):
+        mock_run.side_effect = setup_prefix() + [
+            R(1, "", "fatal: Connection reset by peer"),  # first push: network error (retried)
+            R(0),  # second push: success
+        ]
+
+        result = create_and_push_branch(Path(git_repo), "test-branch", "develop", max_retries=3)
+        assert result is True
+
+        # Verify retry sleep was called (exponential backoff: 1s for first retry)
+        assert sleep_calls[-1] == 1
+
+    def test_persistent_error_after_retries_fails(self, git_repo, mock_run):
         """create_and_push_branch fails after max retries."""
-        branch_name = "test-branch"
-
-        with patch("githooks.core.github_utils.subprocess.run") as mock_run:
-            with patch("time.sleep"):
-                # Setup branch creation
-                # Then simulate: all push attempts fail with non-transient error
-                mock_results = [
-                    MagicMock(returncode=1, stderr=""),  # rev-parse
-                    MagicMock(returncode=0),  # checkout develop
-                    MagicMock(returncode=0),  # checkout -b
-                    # All push attempts fail with permission denied (non-transient)
-                    MagicMock(
-                        returncode=1,
-                        stdout="",
-                        stderr="fatal: Could not read from remote repository. Permission denied",
-                    ),
-                    MagicMock(
-                        returncode=1,
-                        stdout="",
-                        stderr="fatal: Could not read from remote repository. Permission denied",
-                    ),
-                    MagicMock(
-                        returncode=1,
-                        stdout="",
-                        stderr="fatal: Could not read from remote repository. Permission denied",
-                    ),
-                    # Final verify via ls-remote fails
-                    MagicMock(returncode=1, stdout="", stderr=""),
-                ]
-                mock_run.side_effect = mock_results
-
-                result = create_and_push_branch(Path(temp_git_repo), branch_name, "develop", max_retries=3)
-                assert result is False
-
-    def test_branch_verified_exists_via_ls_remote(self, temp_git_repo):
+        denied = R(1, "", "fatal: Could not read from remote repository. Permission denied")
+        mock_run.side_effect = setup_prefix() + [
+            # All push attempts fail with permission denied (non-transient)
+            denied,
+            denied,
+            denied,
+            R(1),  # final verify via ls-remote fails
+        ]
+
+        result = create_and_push_branch(Path(git_repo), "test-branch", "develop", max_retries=3)
+        assert result is False
+
+    def test_branch_verified_exists_via_ls_remote(self, git_repo, mock_run):
         """create_and_push_branch succeeds if branch exists on remote (verified via ls-remote)."""
-        branch_name = "test-branch"
-
-        with patch("githooks.core.github_utils.subprocess.run") as mock_run:
-            with patch("time.sleep"):
-                # Setup
-                # Push fails multiple times
-                # But ls-remote shows branch exists
-                mock_results = [
-                    MagicMock(returncode=1, stderr=""),  # rev-parse
-                    MagicMock(returncode=0),  # checkout develop
-                    MagicMock(returncode=0),  # checkout -b
-                    # All push attempts fail
-                    MagicMock(returncode=1, stdout="", stderr="network error"),
-                    MagicMock(returncode=1, stdout="", stderr="network error"),
-                    MagicMock(returncode=1, stdout="", stderr="network error"),
-                    # ls-remote shows branch exists (on final attempt)
-                    MagicMock(
-                        returncode=0,
-                        stdout="abc123def456\trefs/heads/test-branch",
-                        stderr="",
-                    ),
-                ]
-                mock_run.side_effect = mock_results
-
-                result = create_and_push_branch(Path(temp_git_repo), branch_name, "develop", max_retries=3)
-                assert result is True
-
-    def test_exponential_backoff_timing(self, temp_git_repo):
+        mock_run.side_effect = setup_prefix() + [
+            # All push attempts fail
+            R(1, "", "network error"),
+            R(1, "", "network error"),
+            R(1, "", "network error"),
+            # ls-remote shows branch exists (on final attempt)
+            R(0, "abc123def456\trefs/heads/test-branch"),
+        ]
+
+        result = create_and_push_branch(Path(git_repo), "test-branch", "develop", max_retries=3)
+        assert result is True
+
+    def test_exponential_backoff_timing(self, git_repo, mock_run, sleep_calls):
         """create_and_push_branch uses exponential backoff for retries."""
-        branch_name = "test-branch"
-
-        with patch("githooks.core.github_utils.subprocess.run") as mock_run:
-            with patch("time.sleep") as mock_sleep:
-                # Setup branch creation
-                # Then simulate: multiple transient failures followed by success
-                mock_results = [
-                    MagicMock(returncode=1, stderr=""),  # rev-parse
-                    MagicMock(returncode=0),  # checkout develop
-                    MagicMock(returncode=0),  # checkout -b
-                    # First push: connection refused (retry)
-                    MagicMock(returncode=1, stdout="", stderr="connection refused"),
-                    # Second push: connection reset (retry)
-                    MagicMock(returncode=1, stdout="", stderr="connection reset"),
-                    # Third push: success
-                    MagicMock(returncode=0, stdout="", stderr=""),
-                ]
-                mock_run.side_effect = mock_results
-
-                result = create_and_push_branch(Path(temp_git_repo), branch_name, "develop", max_retries=4)
-                assert result is True
-
-                # Verify exponential backoff: 1s, then 2s
-                assert mock_sleep.call_count == 2
-                mock_sleep.assert_any_call(1)  # 2^(1-1) = 1
-                mock_sleep.assert_any_call(2)  # 2^(2-1) = 2
+        mock_run.side_effect = setup_prefix() + [
+            R(1, "", "connection refused"),  # first push: retry
+            R(1, "", "connection reset"),  # second push: retry
+            R(0),  # third push: success
+        ]
+
+        result = create_and_push_branch(Path(git_repo), "test-branch", "develop", max_retries=4)
+        assert result is True
+
+        # Verify exponential backoff: 1s, then 2s
+        assert sleep_calls == [1, 2]  # 2^(attempt-1)
@@ -5,45 +5,36 @@ Ensures importing githooks modules and dependent modules does not cause ImportEr
 
 import importlib
 import sys
+from typing import Dict, Optional
 
 import pytest
 
-
-def test_utils_import_no_cyclic_error():
-    """Importing githooks.core.utils should not cause ImportError or RecursionError."""
-    try:
-        importlib.import_module("githooks.core.utils")
-    except (ImportError, RecursionError) as e:
-        pytest.fail(f"Cyclic import or recursion error: {e}")
-
-
-def test_finish_import_no_cyclic_error():
-    """Importing githooks.cli.finish should not cause ImportError or RecursionError."""
-    try:
-        importlib.import_module("githooks.cli.finish")
-    except (ImportError, RecursionError) as e:
-        pytest.fail(f"Cyclic import or recursion error: {e}")
-
-
-def test_github_utils_import_no_cyclic_error():
-    """Importing githooks.core.github_utils should not cause ImportError or RecursionError."""
-    try:
-        importlib.import_module("githooks.core.github_utils")
-    except (ImportError, RecursionError) as e:
-        pytest.fail(f"Cyclic import or recursion error: {e}")
-
-
-def test_jira_helpers_import_no_cyclic_error():
-    """Importing githooks.core.jira_helpers should not cause ImportError or RecursionError."""
-    try:
-        importlib.import_module("githooks.core.jira_helpers")
-    except (ImportError, RecursionError) as e:
-        pytest.fail(f"Cyclic import or recursion error: {e}")
-
-
-def test_repo_helpers_import_no_cyclic_error():
-    """Importing githooks.core.repo_helpers should not cause ImportError or RecursionError."""
-    try:
-        importlib.import_module("githooks.core.repo_helpers")
-    except (ImportError, RecursionError) as e:
-        pytest.fail(f"Cyclic import or recursion error: {e}")
+MODULE_NAMES = (
+    "githooks.core.utils",
+    "githooks.cli.finish",
+    "githooks.core.github_utils",
+    "githooks.core.jira_helpers",
+    "githooks.core.repo_helpers",
+)
+
+
+@pytest.fixture(scope="module")
+def import_errors() -> Dict[str, Optional[BaseException]]:
+    """Import every module under test once, recording any ImportError/RecursionError per module."""
+    errors: Dict[str, Optional[BaseException]] = {}
+    for name in MODULE_NAMES:
+        try:
+            importlib.import_module(name)
+            errors[name] = None
+        except (ImportError, RecursionError) as e:
+            errors[name] = e
+    return errors
+
+
+@pytest.mark.parametrize("module_name", MODULE_NAMES)
+def test_import_no_cyclic_error(module_name, import_errors):
+    """Importing each githooks module should not cause ImportError or RecursionError."""
+    error = import_errors[module_name]
+    if error is not None:
+        pytest.fail(f"Cyclic import or recursion error in {module_name}: {error}")
+    assert module_name in sys.modules
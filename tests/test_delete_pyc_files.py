@@ -9,30 +9,26 @@ import tempfile
 
 import pytest
 
+HOOK_PATH = os.path.join(os.path.dirname(__file__), "../post-checkout/delete-pyc-files.hook")
 
-def test_script_runs_without_error():
+
+def test_script_runs_without_error(load_hook_module):
     """Script runs without error when called as main."""
-    script_path = os.path.join(os.path.dirname(__file__), "../post-checkout/delete-pyc-files.hook")
-    if not script_path.endswith(".py"):
+    if not HOOK_PATH.endswith(".py"):
         pytest.skip("Not a Python file; skipping import test.")
-    from tests.conftest import load_hook_module
-
-    load_hook_module(script_path)
+    load_hook_module(HOOK_PATH)
     # Should not raise
 
 
-def test_deletes_pyc_files(tmp_path):
+def test_deletes_pyc_files(tmp_path, load_hook_module):
     """Script deletes .pyc files in directory tree."""
-    # Create dummy .pyc file
+    # Create empty .pyc sentinel
     pyc_file = tmp_path / "test.pyc"
-    pyc_file.write_bytes(b"dummy")
+    pyc_file.touch()
     # Simulate script run
     sys.argv = [str(tmp_path)]
-    script_path = os.path.join(os.path.dirname(__file__), "../post-checkout/delete-pyc-files.hook")
-    if not script_path.endswith(".py"):
+    if not HOOK_PATH.endswith(".py"):
         pytest.skip("Not a Python file; skipping import test.")
-    from tests.conftest import load_hook_module
-
-    load_hook_module(script_path)
+    load_hook_module(HOOK_PATH)
     # File should be deleted
     assert not pyc_file.exists()
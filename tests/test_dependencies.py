@@ -5,6 +5,7 @@ Verifies that the dependency installation and validation mechanism works correct
 for both modules when dependencies are missing or present.
 """
 
+import importlib.util
 import subprocess
 import sys
 from pathlib import Path
@@ -31,12 +32,18 @@ class TestEnsureDependencies:
             pytest.fail("ensure_dependencies should not exit when dependencies present")
 
     def test_ensure_dependencies_imports_successfully(self):
-        """Verify required modules can be imported after ensure_dependencies."""
+        """Verify required modules are importable after ensure_dependencies."""
         from githooks.hooks.jira_add_push_worklog import ensure_dependencies
 
         ensure_dependencies()
 
-        # These imports should work after ensure_dependencies
+        # Locate each module without executing it; the real import is covered by the slow test below
+        for name in ("jira", "keyring", "typer"):
+            assert importlib.util.find_spec(name) is not None, f"Required dependency not available: {name}"
+
+    @pytest.mark.slow
+    def test_required_modules_import(self):
+        """Verify required modules actually import (executes the full jira/keyring/typer import graphs)."""
         try:
             import jira
             import keyring
@@ -86,11 +93,9 @@ class TestServiceConfiguration:
         """Verify BRANCH_REGEX constant is defined and valid."""
         import re
 
-        from githooks.core.constants import BRANCH_REGEX
+        from githooks.core.constants import BRANCH_PATTERN, BRANCH_REGEX
 
         assert isinstance(BRANCH_REGEX, str)
-        # Should compile without errors
-        try:
-            re.compile(BRANCH_REGEX)
-        except re.error as e:
-            pytest.fail(f"BRANCH_REGEX is not valid regex: {e}")
+        # Precompiled at import, so an invalid pattern would already have failed above
+        assert isinstance(BRANCH_PATTERN, re.Pattern)
+        assert BRANCH_PATTERN.pattern == BRANCH_REGEX
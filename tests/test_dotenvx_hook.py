@@ -5,26 +5,25 @@ Verifies existence and execution of the dotenvx.hook script.
 """
 
 import os
-import subprocess
 
 import pytest
 
 HOOK_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "../pre-commit/dotenvx.hook")).replace("\\", "/")
 
 
-def test_hook_exists():
+def test_hook_exists(hook_stats):
     """Hook script should exist in pre-commit directory."""
-    disabled_path = HOOK_PATH + ".disabled"
-    if os.path.isfile(disabled_path):
+    if "dotenvx.hook.disabled" in hook_stats["pre-commit"]:
         pytest.skip("Hook is disabled (.hook.disabled)")
-    assert os.path.isfile(HOOK_PATH)
+    assert "dotenvx.hook" in hook_stats["pre-commit"]
 
 
-def test_hook_executable():
-    """Hook script should be executable (exit code 0 or 1)."""
+def test_hook_executable(all_hook_results):
+    """Hook script should be readable and parse cleanly (``bash -n``, or compiled if it is a Python hook)."""
     if not os.path.isfile(HOOK_PATH):
         pytest.skip("Hook script not found or not executable on this platform.")
-    result = subprocess.run(["bash", HOOK_PATH], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    if result.returncode == 127:
+    assert os.access(HOOK_PATH, os.R_OK)
+    returncode = all_hook_results[os.path.realpath(HOOK_PATH)]
+    if returncode == 127:
         pytest.skip("Script not found or not executable by Bash; skipping test.")
-    assert result.returncode in (0, 1)
+    assert returncode == 0
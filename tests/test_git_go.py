@@ -5,32 +5,56 @@ Verifies JIRA-integrated workflow automation including start, finish, publish, a
 Tests now import from modular helper modules instead of monolithic git-go file.
 """
 
-import importlib.machinery
-import importlib.util
+import functools
 import subprocess
 import sys
+import types
+from contextlib import ExitStack
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, MagicMock, Mock, patch
 
 import pytest
 
-# Add missing imports for test helpers
-from githooks.core import github_utils, jira_helpers, repo_helpers
-from githooks.core.git_config import get_git_config, set_git_config
+from tests.conftest import BASH, create_branch
 
-# Import shared helpers from lib modules
-from githooks.core.git_operations import get_current_branch, safe_run_git
-from githooks.core.jira_client import get_jira_client, parse_ticket_from_branch
+GIT_GO_PATH = Path(__file__).parent.parent / "git-go"
+
+# Plain-struct JIRA issues; attribute access on these is cheap, unlike auto-created MagicMock children
+ISSUE = SimpleNamespace(
+    fields=SimpleNamespace(
+        summary="Test feature implementation",
+        status="Open",
+        assignee="test.user@example.com",
+        timetracking=SimpleNamespace(timeSpent="30m", originalEstimate="2h"),
+    )
+)
+STATUS_ISSUE = SimpleNamespace(
+    fields=SimpleNamespace(
+        summary="Test feature",
+        status="In Progress",
+        assignee="test@example.com",
+        timetracking=SimpleNamespace(timeSpent="30m", originalEstimate="2h"),
+    )
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _compile_git_go():
+    """Read and byte-compile git-go once per process."""
+    return compile(GIT_GO_PATH.read_text(encoding="utf-8"), str(GIT_GO_PATH), "exec", dont_inherit=True)
 
 
 # Load git-go module dynamically
 def load_git_go_module():
-    """Load git-go as a Python module."""
-    git_go_path = Path(__file__).parent.parent / "git-go"
-    spec = importlib.util.spec_from_loader("git_go", importlib.machinery.SourceFileLoader("git_go", str(git_go_path)))
-    module = importlib.util.module_from_spec(spec)
+    """Load git-go as a Python module, reusing the copy already registered in sys.modules."""
+    module = sys.modules.get("git_go")
+    if module is not None:
+        return module
+    module = types.ModuleType("git_go")
+    module.__file__ = str(GIT_GO_PATH)
     sys.modules["git_go"] = module
-    spec.loader.exec_module(module)
+    exec(_compile_git_go(), module.__dict__)
     return module
 
 
@@ -40,22 +64,37 @@ def git_go():
     return load_git_go_module()
 
 
+@pytest.fixture(scope="module")
+def core():
+    """Import the githooks.core helper modules on first use rather than at collection time."""
+    from githooks.core import github_utils, jira_helpers, repo_helpers
+
+    return SimpleNamespace(github_utils=github_utils, jira_helpers=jira_helpers, repo_helpers=repo_helpers)
+
+
+@pytest.fixture(scope="session")
+def jira_mock_spec():
+    """Attribute spec for the JIRA client mock, built once and applied to a fresh mock per test.
+
+    A shallow ``copy.copy`` of a shared MagicMock would share its child mocks (and their call history and
+    ``return_value`` overrides) across tests, so each test configures a new mock from this spec instead.
+    """
+    return {
+        "issue.return_value": ISSUE,
+        "transitions.return_value": (
+            {"id": "1", "name": "In Progress"},
+            {"id": "2", "name": "Code Review"},
+            {"id": "3", "name": "Done"},
+        ),
+    }
+
+
 @pytest.fixture
-def mock_jira():
+def mock_jira(jira_mock_spec):
     """Provide mock JIRA client."""
     mock = MagicMock()
-    mock_issue = MagicMock()
-    mock_issue.fields.summary = "Test feature implementation"
-    mock_issue.fields.status = "Open"
-    mock_issue.fields.assignee = "test.user@example.com"
-    mock_issue.fields.timetracking.timeSpent = "30m"
-    mock_issue.fields.timetracking.originalEstimate = "2h"
-    mock.issue.return_value = mock_issue
-    mock.transitions.return_value = [
-        {"id": "1", "name": "In Progress"},
-        {"id": "2", "name": "Code Review"},
-        {"id": "3", "name": "Done"},
-    ]
+    mock.configure_mock(**jira_mock_spec)
+    mock.transitions.return_value = list(jira_mock_spec["transitions.return_value"])
     return mock
 
 
@@ -75,51 +114,45 @@ def mock_github():
 class TestFormatSummaryForBranch:
     """Tests for format_summary_for_branch function (now in github_utils module)."""
 
-    def test_formats_simple_summary(self, git_go):
-        """Simple summary is converted to lowercase with underscores."""
-        result = github_utils.format_summary_for_branch("Add Login Feature")
-        assert result == "add_login_feature"
-
-    def test_removes_special_characters(self, git_go):
-        """Special characters are replaced with underscores."""
-        result = github_utils.format_summary_for_branch("Fix bug #123 - authentication")
-        assert result == "fix_bug_123_authentication"
-
-    def test_truncates_long_summary(self, git_go):
-        """Long summary is truncated at word boundaries."""
-        long_summary = "This is a very long summary that should be truncated at word boundaries"
-        result = github_utils.format_summary_for_branch(long_summary, max_length=30)
-        assert len(result) <= 30
-        assert not result.endswith("_")
-
-    def test_removes_consecutive_underscores(self, git_go):
-        """Multiple consecutive spaces become single underscore."""
-        result = github_utils.format_summary_for_branch("Add    multiple   spaces")
-        assert "__" not in result
-        assert result == "add_multiple_spaces"
+    @pytest.mark.parametrize(
+        "summary,max_length,expected",
+        [
+            # Simple summary is converted to lowercase with underscores
+            ("Add Login Feature", 50, "add_login_feature"),
+            # Special characters are replaced with underscores
+            ("Fix bug #123 - authentication", 50, "fix_bug_123_authentication"),
+            # Long summary is truncated at word boundaries, without a trailing underscore
+            ("This is a very long summary that should be truncated at word boundaries", 30, "this_is_a_very_long_summary"),
+            # Multiple consecutive spaces become a single underscore
+            ("Add    multiple   spaces", 50, "add_multiple_spaces"),
+        ],
+    )
+    def test_format_summary(self, core, summary, max_length, expected):
+        """Summary is lowercased, non-alphanumerics collapse to one underscore, and length is capped."""
+        assert core.github_utils.format_summary_for_branch(summary, max_length=max_length) == expected
 
 
 class TestCreateBranchName:
     """Tests for create_branch_name function (now in github_utils module)."""
 
-    def test_creates_branch_with_initials(self, git_go):
+    def test_creates_branch_with_initials(self, core, git_go):
         """Branch name includes user initials, ticket, and formatted summary."""
-        with patch.object(github_utils, "get_user_initials", return_value="JT"):
-            result = github_utils.create_branch_name("OMLEG-3169", "Add reverse proxy login")
+        with patch.object(core.github_utils, "get_user_initials", return_value="JT"):
+            result = core.github_utils.create_branch_name("OMLEG-3169", "Add reverse proxy login")
             assert "JT_OMLEG-3169" in result
             assert "add_reverse_proxy_login" in result
 
-    def test_creates_branch_with_prefix(self, git_go):
+    def test_creates_branch_with_prefix(self, core, git_go):
         """Branch name includes specified prefix."""
-        with patch.object(github_utils, "get_user_initials", return_value="JT"):
-            result = github_utils.create_branch_name("OMLEG-3169", "Add feature", branch_prefix="feature/")
+        with patch.object(core.github_utils, "get_user_initials", return_value="JT"):
+            result = core.github_utils.create_branch_name("OMLEG-3169", "Add feature", branch_prefix="feature/")
             assert result.startswith("feature/")
             assert "JT_OMLEG-3169" in result
 
-    def test_handles_develop_root_branch(self, git_go):
+    def test_handles_develop_root_branch(self, core, git_go):
         """Branch name is created with specified root branch parameter."""
-        with patch.object(github_utils, "get_user_initials", return_value="JT"):
-            result = github_utils.create_branch_name("OMLEG-3169", "Test", branch_prefix="feature/", root_branch="develop")
+        with patch.object(core.github_utils, "get_user_initials", return_value="JT"):
+            result = core.github_utils.create_branch_name("OMLEG-3169", "Test", branch_prefix="feature/", root_branch="develop")
             assert result.startswith("feature/")
             assert "JT_OMLEG-3169" in result
 
@@ -127,40 +160,40 @@ class TestCreateBranchName:
 class TestGetRepoFromUrl:
     """Tests for get_repo_from_url function (now in repo_helpers module)."""
 
-    def test_parses_https_url(self, git_go):
+    def test_parses_https_url(self, core, git_go):
         """HTTPS GitHub URL is parsed correctly."""
-        owner, repo = repo_helpers.get_repo_from_url("https://github.com/owner/repo.git")
+        owner, repo = core.repo_helpers.get_repo_from_url("https://github.com/owner/repo.git")
         assert owner == "owner"
         assert repo == "repo"
 
-    def test_parses_ssh_url(self, git_go):
+    def test_parses_ssh_url(self, core, git_go):
         """SSH GitHub URL is parsed correctly."""
         # SSH format splits differently - owner becomes 'git@github.com:owner'
-        owner, repo = repo_helpers.get_repo_from_url("git@github.com:owner/repo.git")
+        owner, repo = core.repo_helpers.get_repo_from_url("git@github.com:owner/repo.git")
         assert "owner" in owner  # Current implementation limitation
         assert repo == "repo"
 
-    def test_raises_on_invalid_url(self, git_go):
+    def test_raises_on_invalid_url(self, core, git_go):
         """Invalid URL raises ValueError."""
         with pytest.raises(ValueError):
-            repo_helpers.get_repo_from_url("https://gitlab.com/owner/repo.git")
+            core.repo_helpers.get_repo_from_url("https://gitlab.com/owner/repo.git")
 
 
 class TestTransitionJiraTicket:
     """Tests for transition_jira_ticket function."""
 
-    def test_logs_work_and_transitions(self, git_go, mock_jira):
+    def test_logs_work_and_transitions(self, core, git_go, mock_jira):
         """Ticket transitions to 'In Progress' and work is logged."""
-        result = jira_helpers.transition_jira_ticket(mock_jira, "TEST-123", "feature/test-branch")
+        result = core.jira_helpers.transition_jira_ticket(mock_jira, "TEST-123", "feature/test-branch")
 
         assert result is True
         # Function transitions but doesn't directly call add_worklog in current implementation
         mock_jira.issue.assert_called_with("TEST-123")
 
-    def test_handles_missing_transition(self, git_go, mock_jira):
+    def test_handles_missing_transition(self, core, git_go, mock_jira):
         """Returns True even if transition not found (non-blocking)."""
         mock_jira.transitions.return_value = []
-        result = jira_helpers.transition_jira_ticket(mock_jira, "TEST-123", "feature/test-branch")
+        result = core.jira_helpers.transition_jira_ticket(mock_jira, "TEST-123", "feature/test-branch")
 
         assert result is True  # Non-blocking
         mock_jira.issue.assert_called_with("TEST-123")
@@ -169,22 +202,22 @@ class TestTransitionJiraTicket:
 class TestTransitionToReviewState:
     """Tests for transition_to_review_state function."""
 
-    def test_transitions_to_review(self, git_go, mock_jira):
+    def test_transitions_to_review(self, core, git_go, mock_jira):
         """Ticket transitions to review state and work is logged."""
-        result = jira_helpers.transition_to_review_state(mock_jira, "TEST-123", "feature/test-branch")
+        result = core.jira_helpers.transition_to_review_state(mock_jira, "TEST-123", "feature/test-branch")
 
         assert result is True
         mock_jira.issue.assert_called_with("TEST-123")
         mock_jira.transition_issue.assert_called()
 
-    def test_tries_multiple_review_keywords(self, git_go, mock_jira):
+    def test_tries_multiple_review_keywords(self, core, git_go, mock_jira):
         """Tries multiple review-related transition names."""
         mock_jira.transitions.return_value = [
             {"id": "1", "name": "Under Review"},
             {"id": "2", "name": "Peer Review"},
         ]
 
-        result = jira_helpers.transition_to_review_state(mock_jira, "TEST-123", "feature/test-branch")
+        result = core.jira_helpers.transition_to_review_state(mock_jira, "TEST-123", "feature/test-branch")
 
         assert result is True
         mock_jira.transition_issue.assert_called_with(mock_jira.issue.return_value, "1")
@@ -193,22 +226,22 @@ class TestTransitionToReviewState:
 class TestTransitionToDoneState:
     """Tests for transition_to_done_state function."""
 
-    def test_transitions_to_done(self, git_go, mock_jira):
+    def test_transitions_to_done(self, core, git_go, mock_jira):
         """Ticket transitions to done state and final work is logged."""
-        result = jira_helpers.transition_to_done_state(mock_jira, "TEST-123")
+        result = core.jira_helpers.transition_to_done_state(mock_jira, "TEST-123")
 
         assert result is True
         mock_jira.issue.assert_called_with("TEST-123")
         mock_jira.transition_issue.assert_called()
 
-    def test_tries_multiple_done_keywords(self, git_go, mock_jira):
+    def test_tries_multiple_done_keywords(self, core, git_go, mock_jira):
         """Tries multiple done-related transition names."""
         mock_jira.transitions.return_value = [
             {"id": "1", "name": "Completed"},
             {"id": "2", "name": "Closed"},
         ]
 
-        result = jira_helpers.transition_to_done_state(mock_jira, "TEST-123")
+        result = core.jira_helpers.transition_to_done_state(mock_jira, "TEST-123")
 
         assert result is True
         # Function will use first matching transition
@@ -218,118 +251,127 @@ class TestTransitionToDoneState:
 class TestGetCurrentBranch:
     """Tests for get_current_branch function."""
 
-    def test_returns_current_branch_name(self, git_go, temp_git_repo):
+    def test_returns_current_branch_name(self, core, git_go, git_repo):
         """Current branch name is returned from Git repository."""
         # Create a test branch
-        subprocess.run(["git", "checkout", "-b", "test-branch"], cwd=temp_git_repo, check=True, capture_output=True)
+        create_branch(git_repo, "test-branch")
 
-        result = github_utils.get_current_branch(Path(temp_git_repo))
+        result = core.github_utils.get_current_branch(Path(git_repo))
 
         assert result == "test-branch"
 
-    def test_returns_none_on_error(self, git_go, tmp_path):
+    def test_returns_none_on_error(self, core, git_go, tmp_path):
         """None is returned when repository doesn't exist."""
         # Use a valid directory that isn't a git repo
         non_git_dir = tmp_path / "not_a_repo"
         non_git_dir.mkdir()
-        result = github_utils.get_current_branch(non_git_dir)
+        result = core.github_utils.get_current_branch(non_git_dir)
         assert result is None
 
+    def test_detached_head_falls_back_to_git(self, core, git_go, git_repo):
+        """A detached HEAD is not read from .git/HEAD; git rev-parse reports it as 'HEAD'."""
+        subprocess.run(["git", "checkout", "-q", "--detach"], cwd=git_repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        assert core.github_utils.get_current_branch(Path(git_repo)) == "HEAD"
+
 
 class TestGetCommitsSinceBranch:
     """Tests for get_commits_since_branch function."""
 
-    def test_returns_commits_list(self, git_go, temp_git_repo):
+    def test_returns_commits_list(self, core, git_go, git_repo):
         """List of commits since base branch is returned."""
-        # Create base branch
-        subprocess.run(["git", "checkout", "-b", "base"], cwd=temp_git_repo, check=True, capture_output=True)
-        subprocess.run(["git", "commit", "--allow-empty", "-m", "Base commit"], cwd=temp_git_repo, check=True, capture_output=True)
-
-        # Create feature branch and add commits
-        subprocess.run(["git", "checkout", "-b", "feature"], cwd=temp_git_repo, check=True, capture_output=True)
-        subprocess.run(["git", "commit", "--allow-empty", "-m", "feat: Add feature"], cwd=temp_git_repo, check=True, capture_output=True)
-        subprocess.run(["git", "commit", "--allow-empty", "-m", "test: Add tests"], cwd=temp_git_repo, check=True, capture_output=True)
+        # Create base branch, then a feature branch with two commits, in a single shell
+        script = """set -e
+git checkout -q -b base
+git commit -q --allow-empty -m "Base commit"
+git checkout -q -b feature
+git commit -q --allow-empty -m "feat: Add feature"
+git commit -q --allow-empty -m "test: Add tests"
+"""
+        subprocess.run([BASH, "-c", script], cwd=git_repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
-        result = github_utils.get_commits_since_branch(Path(temp_git_repo), "base")
+        result = core.github_utils.get_commits_since_branch(Path(git_repo), "base")
 
         assert len(result) == 2
         assert "feat: Add feature" in result
         assert "test: Add tests" in result
 
-    def test_returns_empty_list_on_error(self, git_go, tmp_path):
+    def test_returns_empty_list_on_error(self, core, git_go, tmp_path):
         """Empty list is returned when repository doesn't exist."""
         # Use a valid directory that isn't a git repo
         non_git_dir = tmp_path / "not_a_repo"
         non_git_dir.mkdir()
-        result = github_utils.get_commits_since_branch(non_git_dir, "main")
+        result = core.github_utils.get_commits_since_branch(non_git_dir, "main")
         assert result == []
 
 
 class TestLoadRepoConfigFromGit:
     """Tests for load_repo_config_from_git function."""
 
-    def test_loads_existing_config(self, git_go, temp_git_repo):
+    @pytest.fixture
+    def global_config(self, tmp_path, monkeypatch):
+        """Point git's global config at an empty per-test file so the developer's ~/.gitconfig is never touched."""
+        cfg_file = tmp_path / "gitconfig"
+        cfg_file.write_text("", encoding="utf-8")
+        monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(cfg_file))
+        monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+        # Run outside any repository so only the global file is consulted
+        monkeypatch.chdir(tmp_path)
+        return cfg_file
+
+    def test_loads_existing_config(self, core, git_go, global_config):
         """Existing git config is loaded correctly."""
-        # Set up test config using --global to ensure it's accessible
         # Function expects repo.{alias}.* format, not git-go.{alias}.*
-        subprocess.run(
-            ["git", "config", "--global", "repo.test.url", "https://github.com/test/repo.git"],
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(["git", "config", "--global", "repo.test.cloneto", "/tmp/test"], check=True, capture_output=True)
-        subprocess.run(["git", "config", "--global", "repo.test.rootbranch", "main"], check=True, capture_output=True)
-
-        try:
-            result = repo_helpers.load_repo_config_from_git("test")
-
-            assert result is not None
-            assert result["url"] == "https://github.com/test/repo.git"
-            assert result["clone_to"] == "/tmp/test"
-            assert result["root_branch"] == "main"
-        finally:
-            # Clean up global config
-            subprocess.run(["git", "config", "--global", "--unset-all", "repo.test.url"], capture_output=True)
-            subprocess.run(["git", "config", "--global", "--unset-all", "repo.test.cloneto"], capture_output=True)
-            subprocess.run(["git", "config", "--global", "--unset-all", "repo.test.rootbranch"], capture_output=True)
-
-    def test_returns_none_for_missing_config(self, git_go):
+        global_config.write_text('[repo "test"]\n\turl = https://github.com/test/repo.git\n\tcloneto = /tmp/test\n\trootbranch = main\n', encoding="utf-8")
+
+        result = core.repo_helpers.load_repo_config_from_git("test")
+
+        assert result is not None
+        assert result["url"] == "https://github.com/test/repo.git"
+        assert result["clone_to"] == "/tmp/test"
+        assert result["root_branch"] == "main"
+
+    def test_returns_none_for_missing_config(self, core, git_go, global_config):
         """None is returned when config doesn't exist."""
-        result = repo_helpers.load_repo_config_from_git("nonexistent")
+        result = core.repo_helpers.load_repo_config_from_git("nonexistent")
         assert result is None
 
 
 class TestCmdStart:
     """Tests for cmd_start function."""
 
-    @patch("githooks.core.jira_helpers.transition_jira_ticket")
-    @patch("githooks.core.github_utils.create_and_push_branch")
-    @patch("githooks.core.github_utils.clone_or_update_repo")
-    @patch("githooks.core.jira_helpers.fetch_jira_issue")
-    @patch("githooks.core.jira_helpers.connect_to_jira")
-    @patch("githooks.core.repo_helpers.load_repo_config")
-    def test_creates_branch_and_transitions_jira(
-        self, mock_load_config, mock_connect_jira, mock_fetch_issue, mock_clone, mock_create_branch, mock_transition
-    ):
-        """Start command creates branch and transitions JIRA ticket."""
+    @pytest.fixture
+    def patched_start(self, monkeypatch, mock_jira):
+        """Patch the helpers cmd_start calls and return the mocks keyed by helper name.
+
+        start binds its helpers at import time, so the mocks go on its own names rather than
+        on githooks.core, which would miss if start was already imported by an earlier test.
+        """
         from githooks.cli import start
 
-        # Setup mocks
-        mock_jira = MagicMock()
-        mock_connect_jira.return_value = mock_jira
-        mock_fetch_issue.return_value = "Test feature"
-
-        mock_load_config.return_value = {
-            "url": "https://github.com/test/repo.git",
-            "clone_to": "/tmp/test",
-            "root_branch": "develop",
-            "jira_server": "https://jira.example.com",
-            "branch_prefix": "",
+        mocks = {
+            "load_repo_config": MagicMock(
+                return_value={
+                    "url": "https://github.com/test/repo.git",
+                    "clone_to": "/tmp/test",
+                    "root_branch": "develop",
+                    "jira_server": "https://jira.example.com",
+                    "branch_prefix": "",
+                }
+            ),
+            "connect_to_jira": MagicMock(return_value=mock_jira),
+            "fetch_jira_issue": MagicMock(return_value="Test feature"),
+            "clone_or_update_repo": MagicMock(return_value=Path("/tmp/test/branch")),
+            "create_and_push_branch": MagicMock(return_value=True),
+            "transition_jira_ticket": MagicMock(return_value=True),
         }
+        for name, helper_mock in mocks.items():
+            monkeypatch.setattr(start, name, helper_mock)
+        return mocks
 
-        mock_clone.return_value = Path("/tmp/test/branch")
-        mock_create_branch.return_value = True
-        mock_transition.return_value = True
+    def test_creates_branch_and_transitions_jira(self, patched_start, mock_jira):
+        """Start command creates branch and transitions JIRA ticket."""
+        from githooks.cli import start
 
         # Create mock args
         args = MagicMock()
@@ -340,10 +382,11 @@ class TestCmdStart:
         start.main(args)
 
         # Verify
-        mock_connect_jira.assert_called_once()
-        mock_fetch_issue.assert_called_once_with(mock_jira, "TEST-123")
-        mock_create_branch.assert_called_once()
+        patched_start["connect_to_jira"].assert_called_once()
+        patched_start["fetch_jira_issue"].assert_called_once_with(mock_jira, "TEST-123")
+        patched_start["create_and_push_branch"].assert_called_once()
         # Verify transition was called with correct ticket
+        mock_transition = patched_start["transition_jira_ticket"]
         assert mock_transition.call_count == 1
         call_args = mock_transition.call_args[0]
         assert call_args[0] == mock_jira
@@ -353,134 +396,118 @@ class TestCmdStart:
 class TestCmdFinish:
     """Tests for cmd_finish function."""
 
-    @patch("githooks.core.github_utils.create_pull_request")
-    @patch("githooks.core.jira_helpers.transition_to_review_state")
-    @patch("githooks.core.github_utils.safe_run")
-    @patch("githooks.core.github_utils.get_current_branch")
-    @patch("githooks.core.repo_helpers.verify_repo_exists")
-    @patch("githooks.core.jira_helpers.fetch_jira_issue")
-    @patch("githooks.core.jira_helpers.connect_to_jira")
-    @patch("githooks.core.repo_helpers.load_repo_config")
-    def test_creates_pull_request(
-        self,
-        mock_load_config,
-        mock_connect_jira,
-        mock_fetch_issue,
-        mock_verify_repo,
-        mock_current_branch,
-        mock_safe_run,
-        mock_transition,
-        mock_create_pr,
-        tmp_path,
-    ):
+    def test_creates_pull_request(self, core, tmp_path):
         """Finish command creates pull request and transitions JIRA."""
-        import sys
-
-        import pytest
-
         if sys.platform.startswith("win") or not sys.__stdin__.isatty():
             pytest.skip("Skipping test_creates_pull_request on Windows or non-interactive environment.")
-        # Setup mocks
-        from unittest.mock import MagicMock
-
         import finish
 
-        mock_jira = MagicMock()
-        mock_connect_jira.return_value = mock_jira
-        mock_fetch_issue.return_value = "Test feature"
-        mock_current_branch.return_value = "feature/JT_TEST-123_test_feature"
-
-        mock_load_config.return_value = {
-            "url": "https://github.com/owner/repo.git",
-            "clone_to": str(tmp_path),
-            "root_branch": "main",
-            "jira_server": "https://jira.example.com",
-            "branch_prefix": "feature/",
-        }
-
-        # Mock verify_repo_exists to do nothing
-        mock_verify_repo.return_value = None
-
-        # Mock PR creation
-        mock_pr = MagicMock()
-        mock_pr.html_url = "https://github.com/owner/repo/pull/1"
-        mock_create_pr.return_value = mock_pr
-
-        mock_transition.return_value = True
-
-        # Create mock args
-        args = MagicMock()
-        args.repo_alias = "test"
-        args.jira_ticket = "TEST-123"
-
-        # Execute
-        finish.main(args)
+        with ExitStack() as stack:
+            repo_mocks = stack.enter_context(patch.multiple(core.repo_helpers, load_repo_config=DEFAULT, verify_repo_exists=DEFAULT))
+            jira_mocks = stack.enter_context(
+                patch.multiple(core.jira_helpers, connect_to_jira=DEFAULT, fetch_jira_issue=DEFAULT, transition_to_review_state=DEFAULT)
+            )
+            github_mocks = stack.enter_context(
+                patch.multiple(core.github_utils, get_current_branch=DEFAULT, safe_run=DEFAULT, create_pull_request=DEFAULT)
+            )
+
+            # Setup mocks
+            mock_jira = MagicMock()
+            jira_mocks["connect_to_jira"].return_value = mock_jira
+            jira_mocks["fetch_jira_issue"].return_value = "Test feature"
+            jira_mocks["transition_to_review_state"].return_value = True
+            github_mocks["get_current_branch"].return_value = "feature/JT_TEST-123_test_feature"
+
+            repo_mocks["load_repo_config"].return_value = {
+                "url": "https://github.com/owner/repo.git",
+                "clone_to": str(tmp_path),
+                "root_branch": "main",
+                "jira_server": "https://jira.example.com",
+                "branch_prefix": "feature/",
+            }
+
+            # Mock verify_repo_exists to do nothing
+            repo_mocks["verify_repo_exists"].return_value = None
+
+            # Mock PR creation
+            mock_pr = MagicMock()
+            mock_pr.html_url = "https://github.com/owner/repo/pull/1"
+            github_mocks["create_pull_request"].return_value = mock_pr
+
+            # Create mock args
+            args = MagicMock()
+            args.repo_alias = "test"
+            args.jira_ticket = "TEST-123"
+
+            # Execute
+            finish.main(args)
 
         # Verify key interactions
-        mock_connect_jira.assert_called_once()
-        mock_fetch_issue.assert_called_once_with(mock_jira, "TEST-123")
-        mock_safe_run.assert_called_once()
-        mock_transition.assert_called_once()
-        mock_create_pr.assert_called_once()
+        jira_mocks["connect_to_jira"].assert_called_once()
+        jira_mocks["fetch_jira_issue"].assert_called_once_with(mock_jira, "TEST-123")
+        github_mocks["safe_run"].assert_called_once()
+        jira_mocks["transition_to_review_state"].assert_called_once()
+        github_mocks["create_pull_request"].assert_called_once()
 
 
 class TestCmdStatus:
     """Tests for cmd_status function."""
 
-    @patch("githooks.core.github_utils.get_commits_since_branch")
-    @patch("githooks.core.github_utils.count_modified_files")
-    @patch("githooks.core.github_utils.extract_ticket_from_branch")
-    @patch("githooks.core.github_utils.get_current_branch")
-    @patch("githooks.core.repo_helpers.find_most_recent_repo")
-    @patch("githooks.core.jira_helpers.get_jira_client")
-    @patch("githooks.core.repo_helpers.load_repo_config")
-    def test_displays_workflow_status(
-        self, mock_load_config, mock_jira_client, mock_find_repo, mock_current_branch, mock_extract_ticket, mock_count_files, mock_commits, tmp_path
-    ):
+    def test_displays_workflow_status(self, core, tmp_path):
         """Status command displays Git and JIRA status."""
         from githooks.cli import status
 
-        # Setup mocks
-        mock_current_branch.return_value = "feature/TEST-123_test"
-        mock_commits.return_value = ["feat: Add feature", "test: Add tests"]
-
-        mock_issue = MagicMock()
-        mock_issue.fields.summary = "Test feature"
-        mock_issue.fields.status = "In Progress"
-        mock_issue.fields.assignee = "test@example.com"
-        mock_issue.fields.timetracking = MagicMock()
-        mock_issue.fields.timetracking.timeSpent = "30m"
-        mock_issue.fields.timetracking.originalEstimate = "2h"
-        mock_jira = MagicMock()
-        mock_jira.issue.return_value = mock_issue
-        mock_jira_client.return_value = mock_jira
-
-        mock_load_config.return_value = {
-            "url": "https://github.com/owner/repo.git",
-            "clone_to": str(tmp_path),
-            "root_branch": "main",
-            "jira_server": "https://jira.example.com",
-        }
-
-        mock_extract_ticket.return_value = "TEST-123"
-        mock_count_files.return_value = 2
-
-        # Create mock repo directory
-        repo_dir = tmp_path / "feature_TEST-123_test"
-        repo_dir.mkdir()
-        (repo_dir / ".git").mkdir()
-        mock_find_repo.return_value = repo_dir
-
-        # Create mock args
-        args = MagicMock()
-        args.repo_alias = "test"
-
-        # Execute (should not raise)
-        status.main(args)
+        with ExitStack() as stack:
+            repo_mocks = stack.enter_context(patch.multiple(core.repo_helpers, load_repo_config=DEFAULT, find_most_recent_repo=DEFAULT))
+            # status binds its helpers at import time, so patch its own names (sharing the load_repo_config mock)
+            status_mocks = stack.enter_context(
+                patch.multiple(
+                    status,
+                    load_repo_config=repo_mocks["load_repo_config"],
+                    get_jira_client=DEFAULT,
+                    get_current_branch=DEFAULT,
+                    extract_ticket_from_branch=DEFAULT,
+                    count_modified_files=DEFAULT,
+                    get_commits_since_branch=DEFAULT,
+                )
+            )
+            mock_jira_client = status_mocks["get_jira_client"]
+
+            # Setup mocks
+            status_mocks["get_current_branch"].return_value = "feature/TEST-123_test"
+            status_mocks["get_commits_since_branch"].return_value = ["feat: Add feature", "test: Add tests"]
+
+            mock_jira = MagicMock()
+            mock_jira.issue.return_value = STATUS_ISSUE
+            mock_jira_client.return_value = mock_jira
+
+            repo_mocks["load_repo_config"].return_value = {
+                "url": "https://github.com/owner/repo.git",
+                "clone_to": str(tmp_path),
+                "root_branch": "main",
+                "jira_server": "https://jira.example.com",
+            }
+
+            status_mocks["extract_ticket_from_branch"].return_value = "TEST-123"
+            status_mocks["count_modified_files"].return_value = 2
+
+            # Create mock repo directory
+            repo_dir = tmp_path / "feature_TEST-123_test"
+            repo_dir.mkdir()
+            (repo_dir / ".git").mkdir()
+            repo_mocks["find_most_recent_repo"].return_value = repo_dir
+
+            # Create mock args
+            args = MagicMock()
+            args.repo_alias = "test"
+
+            # Execute (should not raise)
+            status.main(args)
 
         # Verify key interactions
+        mock_load_config = repo_mocks["load_repo_config"]
         assert mock_load_config.call_count == 2
         mock_load_config.assert_called_with("test")
         mock_jira_client.assert_called_once()
         mock_jira.issue.assert_called_once_with("TEST-123")
-        mock_commits.assert_called_once()
+        status_mocks["get_commits_since_branch"].assert_called_once()
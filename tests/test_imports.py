@@ -1,79 +1,66 @@
 #!/usr/bin/env python
 """Quick test to verify module imports work correctly."""
 
-import sys
-
-
-def test_jira_add_push_worklog():
-    """Test jira_add_push_worklog exports."""
-    from githooks.hooks import jira_add_push_worklog
-
-    expected = [
-        "BRANCH_REGEX",
-        "SERVICE_NAME",
-        "DEFAULT_SERVER",
-        "DEFAULT_TIME_SPENT",
-        "REQUIRED_DEPENDENCIES",
-        "ensure_dependencies",
-        "parse_ticket_from_branch",
-        "get_current_branch",
-        "get_jira_client",
-        "transition_to_review",
-    ]
-
-    for attr in expected:
-        if not hasattr(jira_add_push_worklog, attr):
-            print(f"❌ Missing: {attr}")
-            return False
-        print(f"✅ Found: {attr}")
-
-    # Test constants have correct values
-    assert jira_add_push_worklog.SERVICE_NAME == "gojira"
-    assert jira_add_push_worklog.DEFAULT_SERVER == "https://jira.viasat.com"
-    assert jira_add_push_worklog.DEFAULT_TIME_SPENT == "2m"
-    assert len(jira_add_push_worklog.REQUIRED_DEPENDENCIES) == 3
-
-    return True
-
-
-def test_jira_transition_worklog():
-    """Test jira_transition_worklog exports."""
-    from githooks.hooks import jira_transition_worklog
-
-    expected = [
-        "BRANCH_REGEX",
-        "SERVICE_NAME",
-        "DEFAULT_SERVER",
-        "DEFAULT_TIME_SPENT",
-        "REQUIRED_DEPENDENCIES",
-        "ensure_dependencies",
-        "parse_ticket_from_branch",
-        "get_jira_client",
-        "transition_and_log_work",
-    ]
-
-    for attr in expected:
-        if not hasattr(jira_transition_worklog, attr):
-            print(f"❌ Missing: {attr}")
-            return False
-        print(f"✅ Found: {attr}")
-
-    # Test constants have correct values
-    assert jira_transition_worklog.SERVICE_NAME == "gojira"
-    assert jira_transition_worklog.DEFAULT_SERVER == "https://jira.viasat.com"
-    assert jira_transition_worklog.DEFAULT_TIME_SPENT == "5m"
-    assert len(jira_transition_worklog.REQUIRED_DEPENDENCIES) == 3
-
-    return True
-
-
-if __name__ == "__main__":
-    print("Testing jira_add_push_worklog...")
-    if not test_jira_add_push_worklog():
-        sys.exit(1)
-
-    print("\nTesting jira_transition_worklog...")
-    if not test_jira_transition_worklog():
-        sys.exit(1)
-
-    print("\n✅ All imports successful!")
+import functools
+import importlib
+from types import ModuleType
+
+import pytest
+
+ADD_PUSH_WORKLOG_ATTRS = [
+    "BRANCH_REGEX",
+    "BRANCH_PATTERN",
+    "SERVICE_NAME",
+    "DEFAULT_SERVER",
+    "DEFAULT_TIME_SPENT",
+    "REQUIRED_DEPENDENCIES",
+    "ensure_dependencies",
+    "parse_ticket_from_branch",
+    "get_current_branch",
+    "get_jira_client",
+    "transition_to_review",
+]
+
+TRANSITION_WORKLOG_ATTRS = [
+    "BRANCH_REGEX",
+    "BRANCH_PATTERN",
+    "SERVICE_NAME",
+    "DEFAULT_SERVER",
+    "DEFAULT_TIME_SPENT",
+    "REQUIRED_DEPENDENCIES",
+    "ensure_dependencies",
+    "parse_ticket_from_branch",
+    "get_jira_client",
+    "transition_and_log_work",
+]
+
+
+@functools.lru_cache(maxsize=None)
+def hook_module(mod_name: str) -> ModuleType:
+    """Import ``githooks.hooks.<mod_name>`` once per process."""
+    return importlib.import_module(f"githooks.hooks.{mod_name}")
+
+
+@pytest.mark.parametrize(
+    "mod_name,attr",
+    [("jira_add_push_worklog", attr) for attr in ADD_PUSH_WORKLOG_ATTRS] + [("jira_transition_worklog", attr) for attr in TRANSITION_WORKLOG_ATTRS],
+)
+def test_exports(mod_name, attr):
+    """Hook module exports the expected attribute."""
+    assert hasattr(hook_module(mod_name), attr)
+
+
+@pytest.mark.parametrize(
+    "mod_name,default_time_spent",
+    [
+        ("jira_add_push_worklog", "2m"),
+        ("jira_transition_worklog", "5m"),
+    ],
+)
+def test_constants(mod_name, default_time_spent):
+    """Hook module constants have the correct values."""
+    module = hook_module(mod_name)
+    assert module.SERVICE_NAME == "gojira"
+    assert module.DEFAULT_SERVER == "https://jira.viasat.com"
+    assert module.DEFAULT_TIME_SPENT == default_time_spent
+    assert len(module.REQUIRED_DEPENDENCIES) == 3
@@ -13,70 +13,71 @@ from githooks.core.issue_tracker import detect_issue_tracker, format_issue_refer
 class TestDetectIssueTracker:
     """Tests for detect_issue_tracker function."""
 
-    def test_detects_jira_pattern(self):
+    @pytest.mark.parametrize("branch", ["JT_PTEAE-2930_feature-description", "PROJ-123_fix-bug", "feature/ABC-456"])
+    def test_detects_jira_pattern(self, branch):
         """detect_issue_tracker returns 'jira' for JIRA branch patterns."""
-        assert detect_issue_tracker("JT_PTEAE-2930_feature-description") == ISSUE_TRACKER_JIRA
-        assert detect_issue_tracker("PROJ-123_fix-bug") == ISSUE_TRACKER_JIRA
-        assert detect_issue_tracker("feature/ABC-456") == ISSUE_TRACKER_JIRA
+        assert detect_issue_tracker(branch) == ISSUE_TRACKER_JIRA
 
-    def test_detects_github_issue_pattern(self):
+    @pytest.mark.parametrize("branch", ["issue-123-description", "gh-456-fix-bug", "#789-feature", "123-simple-fix"])
+    def test_detects_github_issue_pattern(self, branch):
         """detect_issue_tracker returns 'github' for GitHub issue patterns."""
-        assert detect_issue_tracker("issue-123-description") == ISSUE_TRACKER_GITHUB
-        assert detect_issue_tracker("gh-456-fix-bug") == ISSUE_TRACKER_GITHUB
-        assert detect_issue_tracker("#789-feature") == ISSUE_TRACKER_GITHUB
-        assert detect_issue_tracker("123-simple-fix") == ISSUE_TRACKER_GITHUB
+        assert detect_issue_tracker(branch) == ISSUE_TRACKER_GITHUB
 
-    def test_detects_unknown_pattern(self):
+    @pytest.mark.parametrize("branch", ["main", "develop", "feature-branch"])
+    def test_detects_unknown_pattern(self, branch):
         """detect_issue_tracker returns 'unknown' for unrecognized patterns."""
-        assert detect_issue_tracker("main") == ISSUE_TRACKER_UNKNOWN
-        assert detect_issue_tracker("develop") == ISSUE_TRACKER_UNKNOWN
-        assert detect_issue_tracker("feature-branch") == ISSUE_TRACKER_UNKNOWN
+        assert detect_issue_tracker(branch) == ISSUE_TRACKER_UNKNOWN
 
 
 class TestParseJiraTicket:
     """Tests for parse_jira_ticket function."""
 
-    def test_parses_jira_ticket_from_branch(self):
+    @pytest.mark.parametrize(
+        "branch,expected",
+        [
+            ("JT_PTEAE-2930_feature", "PTEAE-2930"),
+            ("PROJ-123_fix", "PROJ-123"),
+            ("feature/ABC-456", "ABC-456"),
+        ],
+    )
+    def test_parses_jira_ticket_from_branch(self, branch, expected):
         """parse_jira_ticket extracts JIRA ticket key from branch names."""
-        assert parse_jira_ticket("JT_PTEAE-2930_feature") == "PTEAE-2930"
-        assert parse_jira_ticket("PROJ-123_fix") == "PROJ-123"
-        assert parse_jira_ticket("feature/ABC-456") == "ABC-456"
+        assert parse_jira_ticket(branch) == expected
 
-    def test_returns_none_for_non_jira_branches(self):
+    @pytest.mark.parametrize("branch", ["issue-123-description", "main", "gh-456-fix"])
+    def test_returns_none_for_non_jira_branches(self, branch):
         """parse_jira_ticket returns None when no JIRA ticket found."""
-        assert parse_jira_ticket("issue-123-description") is None
-        assert parse_jira_ticket("main") is None
-        assert parse_jira_ticket("gh-456-fix") is None
+        assert parse_jira_ticket(branch) is None
 
 
 class TestParseGithubIssue:
     """Tests for parse_github_issue function."""
 
-    def test_parses_issue_prefix_pattern(self):
-        """parse_github_issue extracts issue number from 'issue-123' pattern."""
-        assert parse_github_issue("issue-123-description") == 123
-        assert parse_github_issue("issue-456") == 456
-
-    def test_parses_gh_prefix_pattern(self):
-        """parse_github_issue extracts issue number from 'gh-123' pattern."""
-        assert parse_github_issue("gh-123-description") == 123
-        assert parse_github_issue("gh-789") == 789
-
-    def test_parses_hash_prefix_pattern(self):
-        """parse_github_issue extracts issue number from '#123' pattern."""
-        assert parse_github_issue("#123-description") == 123
-        assert parse_github_issue("#456") == 456
-
-    def test_parses_number_at_start_pattern(self):
-        """parse_github_issue extracts issue number when branch starts with number."""
-        assert parse_github_issue("123-simple-fix") == 123
-        assert parse_github_issue("456-add-feature") == 456
-
-    def test_returns_none_for_non_github_branches(self):
+    @pytest.mark.parametrize(
+        "branch,expected",
+        [
+            # 'issue-123' pattern
+            ("issue-123-description", 123),
+            ("issue-456", 456),
+            # 'gh-123' pattern
+            ("gh-123-description", 123),
+            ("gh-789", 789),
+            # '#123' pattern
+            ("#123-description", 123),
+            ("#456", 456),
+            # Branch starts with a number
+            ("123-simple-fix", 123),
+            ("456-add-feature", 456),
+        ],
+    )
+    def test_parses_issue_number(self, branch, expected):
+        """parse_github_issue extracts the issue number from prefixed and leading-number patterns."""
+        assert parse_github_issue(branch) == expected
+
+    @pytest.mark.parametrize("branch", ["JT_PTEAE-2930_feature", "main", "develop"])
+    def test_returns_none_for_non_github_branches(self, branch):
         """parse_github_issue returns None when no GitHub issue found."""
-        assert parse_github_issue("JT_PTEAE-2930_feature") is None
-        assert parse_github_issue("main") is None
-        assert parse_github_issue("develop") is None
+        assert parse_github_issue(branch) is None
 
 
 class TestParseIssueFromBranch:
@@ -144,10 +145,7 @@ class TestRealWorldBranchNames:
         assert jira_key is None
         assert github_issue == 42
 
-    def test_protected_branches(self):
+    @pytest.mark.parametrize("branch", ["main", "develop", "master"])
+    def test_protected_branches(self, branch):
         """Protected branches (main, develop) return unknown."""
-        for branch in ["main", "develop", "master"]:
-            tracker, jira_key, github_issue = parse_issue_from_branch(branch)
-            assert tracker == ISSUE_TRACKER_UNKNOWN
-            assert jira_key is None
-            assert github_issue is None
+        assert parse_issue_from_branch(branch) == (ISSUE_TRACKER_UNKNOWN, None, None)
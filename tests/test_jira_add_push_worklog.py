@@ -5,53 +5,46 @@ Verifies that the pre-push hook correctly parses Jira tickets from branch names,
 interacts with Git commands, and handles Jira transitions to 'Under Review'.
 """
 
-import os
-import subprocess
+from unittest.mock import Mock, patch
 
 import pytest
 
-from githooks.core.constants import BRANCH_REGEX
+import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
+from githooks.core.constants import BRANCH_PATTERN
 from githooks.core.constants import DEFAULT_JIRA_SERVER as DEFAULT_SERVER
 from githooks.core.constants import WORKLOG_PUSH_TIME as DEFAULT_TIME_SPENT
 from githooks.core.git_operations import get_current_branch
 
 # Use shared lib utilities and fixtures
 from githooks.core.jira_client import parse_ticket_from_branch
+from tests.conftest import REAL_TEST_JIRA_TICKET, FakeJira, create_branch
 
 
 class TestParseTicketFromBranch:
     """Tests for parsing Jira ticket IDs from branch names."""
 
-    def test_parse_ticket_from_feature_branch(self, sample_branches):
+    def test_parse_ticket_from_feature_branch(self, ticket_branches):
         """Parse ticket from standard feature branch format."""
-        from tests.conftest import REAL_TEST_JIRA_TICKET
-
-        ticket = parse_ticket_from_branch(f"feature/{REAL_TEST_JIRA_TICKET}-add-feature")
+        ticket = parse_ticket_from_branch(ticket_branches["feature"])
         assert ticket is not None
         assert ticket == REAL_TEST_JIRA_TICKET
 
-    def test_parse_ticket_from_bugfix_branch(self, sample_branches):
+    def test_parse_ticket_from_bugfix_branch(self, ticket_branches):
         """Parse ticket from bugfix branch format."""
-        from tests.conftest import REAL_TEST_JIRA_TICKET
-
-        ticket = parse_ticket_from_branch(f"bugfix/{REAL_TEST_JIRA_TICKET}-fix-bug")
+        ticket = parse_ticket_from_branch(ticket_branches["bugfix"])
         assert ticket is not None
         assert ticket == REAL_TEST_JIRA_TICKET
 
-    def test_parse_ticket_from_underscore_format(self, sample_branches):
+    def test_parse_ticket_from_underscore_format(self, ticket_branches):
         """Parse ticket from underscore-separated branch format."""
-        from tests.conftest import REAL_TEST_JIRA_TICKET
-
-        ticket = parse_ticket_from_branch(f"JT_{REAL_TEST_JIRA_TICKET}_automatic-sw-versioning")
+        ticket = parse_ticket_from_branch(ticket_branches["underscore"])
         assert ticket is not None
         # Regex captures PROJECT-NUMBER format (letters followed by hyphen and digits)
         assert ticket == REAL_TEST_JIRA_TICKET
 
-    def test_parse_ticket_from_complex_branch(self, sample_branches):
+    def test_parse_ticket_from_complex_branch(self, ticket_branches):
         """Parse ticket from complex branch name with multiple parts."""
-        from tests.conftest import REAL_TEST_JIRA_TICKET
-
-        ticket = parse_ticket_from_branch(f"develop-feature/JT_{REAL_TEST_JIRA_TICKET}_reverse_proxy")
+        ticket = parse_ticket_from_branch(ticket_branches["complex"])
         assert ticket is not None
         # Regex captures PROJECT-NUMBER format
         assert ticket == REAL_TEST_JIRA_TICKET
@@ -88,8 +81,6 @@ class TestParseTicketFromBranch:
 
     def test_parse_ticket_with_multiple_tickets(self):
         """Parse first ticket when multiple ticket IDs in branch name."""
-        from tests.conftest import REAL_TEST_JIRA_TICKET
-
         ticket = parse_ticket_from_branch(f"feature/{REAL_TEST_JIRA_TICKET}-and-OTHER-123")
         assert ticket == REAL_TEST_JIRA_TICKET  # Should return first match
 
@@ -99,29 +90,24 @@ class TestGetCurrentBranch:
 
     def test_get_current_branch_in_git_repo(self, temp_git_repo):
         """Get current branch name from a valid Git repository."""
-        os.chdir(temp_git_repo)
-        branch = get_current_branch()
+        branch = get_current_branch(temp_git_repo)
         assert branch is not None
         # Default branch could be 'master', 'main', or 'develop' depending on Git config
         assert branch in ["master", "main", "develop"]
 
     def test_get_current_branch_after_checkout(self, temp_git_repo):
         """Get correct branch name after checking out a new branch."""
-        os.chdir(temp_git_repo)
-
         # Create and checkout new branch
-        subprocess.run(["git", "checkout", "-b", "feature/TEST-123-test"], check=True, capture_output=True)
+        create_branch(temp_git_repo, "feature/TEST-123-test")
 
-        branch = get_current_branch()
+        branch = get_current_branch(temp_git_repo)
         assert branch == "feature/TEST-123-test"
 
     def test_get_current_branch_with_slashes(self, temp_git_repo):
         """Handle branch names containing forward slashes."""
-        os.chdir(temp_git_repo)
+        create_branch(temp_git_repo, "feature/sub/PROJ-456-complex")
 
-        subprocess.run(["git", "checkout", "-b", "feature/sub/PROJ-456-complex"], check=True, capture_output=True)
-
-        branch = get_current_branch()
+        branch = get_current_branch(temp_git_repo)
         assert branch == "feature/sub/PROJ-456-complex"
 
 
@@ -139,19 +125,15 @@ class TestConstants:
         assert DEFAULT_SERVER.startswith("https://")
 
     def test_branch_regex_pattern_matches_uppercase(self):
-        """Verify BRANCH_REGEX requires uppercase ticket format."""
-        import re
-
+        """Verify the precompiled BRANCH_REGEX requires uppercase ticket format."""
         # Should match
-        from tests.conftest import REAL_TEST_JIRA_TICKET
-
-        assert re.search(BRANCH_REGEX, REAL_TEST_JIRA_TICKET)
-        assert re.search(BRANCH_REGEX, f"JT_{REAL_TEST_JIRA_TICKET}")
+        assert BRANCH_PATTERN.search(REAL_TEST_JIRA_TICKET)
+        assert BRANCH_PATTERN.search(f"JT_{REAL_TEST_JIRA_TICKET}")
 
         # Should not match
-        assert not re.search(BRANCH_REGEX, "proj-123")
-        assert not re.search(BRANCH_REGEX, "123-PROJ")
-        assert not re.search(BRANCH_REGEX, "no-ticket-here")
+        assert not BRANCH_PATTERN.search("proj-123")
+        assert not BRANCH_PATTERN.search("123-PROJ")
+        assert not BRANCH_PATTERN.search("no-ticket-here")
 
 
 class TestIntegrationScenarios:
@@ -159,14 +141,12 @@ class TestIntegrationScenarios:
 
     def test_full_branch_to_ticket_workflow(self, temp_git_repo):
         """Test complete flow from branch creation to ticket parsing."""
-        os.chdir(temp_git_repo)
-
         # Create branch with ticket
         branch_name = "feature/INTEG-789-new-feature"
-        subprocess.run(["git", "checkout", "-b", branch_name], check=True, capture_output=True)
+        create_branch(temp_git_repo, branch_name)
 
         # Verify we can get the branch
-        current_branch = get_current_branch()
+        current_branch = get_current_branch(temp_git_repo)
         assert current_branch == branch_name
 
         # Verify we can parse the ticket
@@ -175,13 +155,11 @@ class TestIntegrationScenarios:
 
     def test_branch_without_ticket_workflow(self, temp_git_repo):
         """Test workflow with branch that has no ticket ID."""
-        os.chdir(temp_git_repo)
-
         # Create branch without ticket
         branch_name = "hotfix/urgent-security-fix"
-        subprocess.run(["git", "checkout", "-b", branch_name], check=True, capture_output=True)
+        create_branch(temp_git_repo, branch_name)
 
-        current_branch = get_current_branch()
+        current_branch = get_current_branch(temp_git_repo)
         assert current_branch == branch_name
 
         ticket = parse_ticket_from_branch(current_branch)
@@ -191,114 +169,32 @@ class TestIntegrationScenarios:
 class TestTransitionToReview:
     """Tests for transition_to_review function."""
 
-    def test_transition_to_review_success(self):
-        """Test successful transition to Under Review."""
-        from unittest.mock import Mock
-
-        import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-
-        # Create mock Jira client
-        mock_jira = Mock()
-        mock_issue = Mock()
-        mock_jira.issue.return_value = mock_issue
-
-        # Mock transitions
-        mock_jira.transitions.return_value = [{"id": "1", "name": "In Progress"}, {"id": "2", "name": "Under Review"}]
-
-        from tests.conftest import REAL_TEST_JIRA_TICKET
-
-        success, error = jira_add_push_worklog.transition_to_review(mock_jira, REAL_TEST_JIRA_TICKET, f"feature/{REAL_TEST_JIRA_TICKET}-test", "2m")
+    @pytest.mark.parametrize(
+        "transitions,expected_id",
+        [
+            # 'Under Review' is preferred
+            ([{"id": "1", "name": "In Progress"}, {"id": "2", "name": "Under Review"}], "2"),
+            # Alternative review state names are used as fallbacks
+            ([{"id": "1", "name": "In Progress"}, {"id": "2", "name": "Code Review"}], "2"),
+            ([{"id": "1", "name": "In Progress"}, {"id": "2", "name": "Peer Review"}], "2"),
+            ([{"id": "1", "name": "Reviewing"}], "1"),
+            # No review transition available: worklog is still added and the call succeeds
+            ([{"id": "1", "name": "Done"}, {"id": "2", "name": "Closed"}], None),
+        ],
+    )
+    def test_transition_to_review(self, transitions, expected_id):
+        """Work is logged and the ticket moves to the first available review state, if any."""
+        jira = FakeJira(transitions)
+
+        success, error = jira_add_push_worklog.transition_to_review(jira, REAL_TEST_JIRA_TICKET, f"feature/{REAL_TEST_JIRA_TICKET}-test", "2m")
 
         assert success is True
         assert error is None
-        mock_jira.add_worklog.assert_called_once()
-        mock_jira.transition_issue.assert_called_once()
-
-    def test_transition_to_review_alternative_names(self):
-        """Test transition with alternative review state names."""
-        from unittest.mock import Mock
-
-        import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-
-        mock_jira = Mock()
-        mock_issue = Mock()
-        mock_jira.issue.return_value = mock_issue
-
-        # Mock transitions without 'Under Review', but with 'Code Review'
-        mock_jira.transitions.return_value = [{"id": "1", "name": "In Progress"}, {"id": "2", "name": "Code Review"}]
-
-        from tests.conftest import REAL_TEST_JIRA_TICKET
-
-        success, error = jira_add_push_worklog.transition_to_review(mock_jira, REAL_TEST_JIRA_TICKET, "feature/test")
-
-        assert success is True
-        assert error is None
-        # Should transition to 'Code Review' as fallback
-        assert mock_jira.transition_issue.call_count >= 1
-
-    def test_transition_to_review_peer_review(self):
-        """Test transition with 'Peer Review' state."""
-        from unittest.mock import Mock
-
-        import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-
-        mock_jira = Mock()
-        mock_issue = Mock()
-        mock_jira.issue.return_value = mock_issue
-
-        # Mock transitions with 'Peer Review'
-        mock_jira.transitions.return_value = [{"id": "1", "name": "In Progress"}, {"id": "2", "name": "Peer Review"}]
-
-        from tests.conftest import REAL_TEST_JIRA_TICKET
-
-        success, error = jira_add_push_worklog.transition_to_review(mock_jira, REAL_TEST_JIRA_TICKET, "feature/test")
-
-        assert success is True
-
-    def test_transition_to_review_reviewing_state(self):
-        """Test transition with 'Reviewing' state."""
-        from unittest.mock import Mock
-
-        import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-
-        mock_jira = Mock()
-        mock_issue = Mock()
-        mock_jira.issue.return_value = mock_issue
-
-        mock_jira.transitions.return_value = [{"id": "1", "name": "Reviewing"}]
-
-        from tests.conftest import REAL_TEST_JIRA_TICKET
-
-        success, error = jira_add_push_worklog.transition_to_review(mock_jira, REAL_TEST_JIRA_TICKET, "feature/test")
-
-        assert success is True
-
-    def test_transition_to_review_no_review_state(self):
-        """Test when no review transition available."""
-        from unittest.mock import Mock
-
-        import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-
-        mock_jira = Mock()
-        mock_issue = Mock()
-        mock_jira.issue.return_value = mock_issue
-
-        # Mock transitions without any review state
-        mock_jira.transitions.return_value = [{"id": "1", "name": "Done"}, {"id": "2", "name": "Closed"}]
-
-        from tests.conftest import REAL_TEST_JIRA_TICKET
-
-        success, error = jira_add_push_worklog.transition_to_review(mock_jira, REAL_TEST_JIRA_TICKET, "feature/test")
-
-        # Should still succeed (worklog added)
-        assert success is True
+        assert len(jira.add_worklog_calls) == 1
+        assert jira.transition_calls == ([] if expected_id is None else [(jira.issue_obj, expected_id)])
 
     def test_transition_to_review_exception(self):
         """Test exception handling in transition_to_review."""
-        from unittest.mock import Mock
-
-        import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-
         mock_jira = Mock()
         mock_jira.issue.side_effect = Exception("Jira API error")
 
@@ -314,91 +210,69 @@ class TestMainFunction:
 
     def test_main_with_no_branch(self, capsys):
         """Test main when get_current_branch returns None."""
-        from unittest.mock import patch
-
-        import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-
-        with patch("githooks.hooks.jira_add_push_worklog.get_current_branch", return_value=None):
-            with pytest.raises(SystemExit) as exc_info:
-                jira_add_push_worklog.main()
-
-            assert exc_info.value.code == 0  # Don't block push
+        with patch.object(jira_add_push_worklog, "get_current_branch", return_value=None), pytest.raises(SystemExit) as exc_info:
+            jira_add_push_worklog.main()
 
+        assert exc_info.value.code == 0  # Don't block push
         captured = capsys.readouterr()
         assert "ERROR" in captured.err
 
     def test_main_with_no_ticket(self, capsys):
         """Test main when branch has no ticket."""
-        from unittest.mock import patch
-
-        import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-
-        with patch("githooks.hooks.jira_add_push_worklog.get_current_branch", return_value="main"):
-            with patch("githooks.hooks.jira_add_push_worklog.parse_ticket_from_branch", return_value=None):
-                with pytest.raises(SystemExit) as exc_info:
-                    jira_add_push_worklog.main()
+        with patch.multiple(
+            jira_add_push_worklog,
+            get_current_branch=Mock(return_value="main"),
+            parse_ticket_from_branch=Mock(return_value=None),
+        ):
+            with pytest.raises(SystemExit) as exc_info:
+                jira_add_push_worklog.main()
 
-                assert exc_info.value.code == 0  # Don't block push
+        assert exc_info.value.code == 0  # Don't block push
 
     def test_main_with_jira_client_failure(self, capsys):
         """Test main when Jira client creation fails."""
-        from unittest.mock import patch
-
-        import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-        from tests.conftest import REAL_TEST_JIRA_TICKET
-
-        with patch("githooks.hooks.jira_add_push_worklog.get_current_branch", return_value=f"feature/{REAL_TEST_JIRA_TICKET}-test"):
-            with patch("githooks.hooks.jira_add_push_worklog.parse_ticket_from_branch", return_value=REAL_TEST_JIRA_TICKET):
-                with patch("githooks.hooks.jira_add_push_worklog.get_jira_client", return_value=None):
-                    with pytest.raises(SystemExit) as exc_info:
-                        jira_add_push_worklog.main()
-
-                    assert exc_info.value.code == 0  # Don't block push
+        with patch.multiple(
+            jira_add_push_worklog,
+            get_current_branch=Mock(return_value=f"feature/{REAL_TEST_JIRA_TICKET}-test"),
+            parse_ticket_from_branch=Mock(return_value=REAL_TEST_JIRA_TICKET),
+            get_jira_client=Mock(return_value=None),
+        ):
+            with pytest.raises(SystemExit) as exc_info:
+                jira_add_push_worklog.main()
 
+        assert exc_info.value.code == 0  # Don't block push
         captured = capsys.readouterr()
         assert "ERROR" in captured.err
 
     def test_main_success_path(self, capsys):
         """Test main with successful execution."""
-        from unittest.mock import Mock, patch
-
-        import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-
-        mock_jira = Mock()
-
-        from tests.conftest import REAL_TEST_JIRA_TICKET
-
-        with patch("githooks.hooks.jira_add_push_worklog.get_current_branch", return_value=f"feature/{REAL_TEST_JIRA_TICKET}-test"):
-            with patch("githooks.hooks.jira_add_push_worklog.parse_ticket_from_branch", return_value=REAL_TEST_JIRA_TICKET):
-                with patch("githooks.hooks.jira_add_push_worklog.get_jira_client", return_value=mock_jira):
-                    with patch("githooks.hooks.jira_add_push_worklog.transition_to_review", return_value=(True, None)):
-                        with pytest.raises(SystemExit) as exc_info:
-                            jira_add_push_worklog.main()
-
-                        assert exc_info.value.code == 0
+        with patch.multiple(
+            jira_add_push_worklog,
+            get_current_branch=Mock(return_value=f"feature/{REAL_TEST_JIRA_TICKET}-test"),
+            parse_ticket_from_branch=Mock(return_value=REAL_TEST_JIRA_TICKET),
+            get_jira_client=Mock(return_value=Mock()),
+            transition_to_review=Mock(return_value=(True, None)),
+        ):
+            with pytest.raises(SystemExit) as exc_info:
+                jira_add_push_worklog.main()
 
+        assert exc_info.value.code == 0
         captured = capsys.readouterr()
         assert "OK" in captured.out
 
     def test_main_with_transition_error(self, capsys):
         """Test main when transition fails."""
-        from unittest.mock import Mock, patch
-
-        import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-
-        mock_jira = Mock()
-
-        from tests.conftest import REAL_TEST_JIRA_TICKET
-
-        with patch("githooks.hooks.jira_add_push_worklog.get_current_branch", return_value=f"feature/{REAL_TEST_JIRA_TICKET}-test"):
-            with patch("githooks.hooks.jira_add_push_worklog.parse_ticket_from_branch", return_value=REAL_TEST_JIRA_TICKET):
-                with patch("githooks.hooks.jira_add_push_worklog.get_jira_client", return_value=mock_jira):
-                    # transition_to_review now returns (False, error_message) on failure
-                    with patch("githooks.hooks.jira_add_push_worklog.transition_to_review", return_value=(False, "Transition failed")):
-                        with pytest.raises(SystemExit) as exc_info:
-                            jira_add_push_worklog.main()
-
-                        assert exc_info.value.code == 0  # Don't block push
+        # transition_to_review returns (False, error_message) on failure
+        with patch.multiple(
+            jira_add_push_worklog,
+            get_current_branch=Mock(return_value=f"feature/{REAL_TEST_JIRA_TICKET}-test"),
+            parse_ticket_from_branch=Mock(return_value=REAL_TEST_JIRA_TICKET),
+            get_jira_client=Mock(return_value=Mock()),
+            transition_to_review=Mock(return_value=(False, "Transition failed")),
+        ):
+            with pytest.raises(SystemExit) as exc_info:
+                jira_add_push_worklog.main()
 
+        assert exc_info.value.code == 0  # Don't block push
         captured = capsys.readouterr()
         assert "WARNING" in captured.err
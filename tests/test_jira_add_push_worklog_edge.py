@@ -10,6 +10,24 @@ import pytest
 import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
 
 
+class DummyKeyring:
+    """Keyring stand-in that stores nothing and never returns a password."""
+
+    def get_password(self, *a, **k):
+        return None
+
+    def set_password(self, *a, **k):
+        return None
+
+
+EMPTY_KEYRING = DummyKeyring()
+
+
+def _eof_input(*a, **k):
+    """Stand-in for ``input`` when no interactive input is possible."""
+    raise EOFError
+
+
 def test_parse_ticket_from_branch_none():
     """Should return None for branch names without ticket pattern."""
     assert jira_add_push_worklog.parse_ticket_from_branch("") is None
@@ -17,34 +35,25 @@ def test_parse_ticket_from_branch_none():
     assert jira_add_push_worklog.parse_ticket_from_branch("feature/add-new-api") is None
 
 
-def test_get_current_branch_handles_error(monkeypatch):
+def test_get_current_branch_handles_error(monkeypatch, tmp_path):
     """Should return None if git command fails."""
 
     def fail_run(*args, **kwargs):
         raise Exception("fail")
 
+    # Outside a repository root there is no .git/HEAD, so the subprocess fallback runs
+    monkeypatch.chdir(tmp_path)
     monkeypatch.setattr("subprocess.run", fail_run)
     assert jira_add_push_worklog.get_current_branch() is None
 
 
 def test_get_jira_client_no_env(monkeypatch):
     """Should return None or prompt if no credentials in env or keyring."""
-    monkeypatch.delenv("JIRA_USERNAME", raising=False)
-    monkeypatch.delenv("JIRA_TOKEN", raising=False)
-    monkeypatch.delenv("GOJIRA_USERNAME", raising=False)
-    monkeypatch.delenv("GOJIRA_SECRET", raising=False)
-
-    # Patch keyring to return None
-    class DummyKeyring:
-        def get_password(self, *a, **k):
-            return None
-
-        def set_password(self, *a, **k):
-            return None
-
-    monkeypatch.setattr(jira_add_push_worklog, "keyring", DummyKeyring())
+    # Drop every JIRA_*/GOJIRA_* credential in one rebinding, restored on teardown
+    monkeypatch.setattr(os, "environ", {k: v for k, v in os.environ.items() if not k.startswith(("JIRA_", "GOJIRA_"))})
+    monkeypatch.setattr(jira_add_push_worklog, "keyring", EMPTY_KEYRING)
     # Patch input to raise EOFError (simulate no input possible)
-    monkeypatch.setattr("builtins.input", lambda *a, **k: (_ for _ in ()).throw(EOFError()))
+    monkeypatch.setattr("builtins.input", _eof_input)
     try:
         result = jira_add_push_worklog.get_jira_client()
     except EOFError:
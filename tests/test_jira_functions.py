@@ -1,33 +1,43 @@
-import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-
 """
 Tests for Jira hook functions including ensure_dependencies, get_jira_client, and transition functions.
 
 Direct integration tests following pytest.instructions.md - no mocks, testing real code paths.
 """
 
+import functools
+import inspect
 import os
-import subprocess
-import sys
-import tempfile
-from pathlib import Path
+import re
+from typing import Tuple
 
 import pytest
 
+import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
+import githooks.hooks.jira_transition_worklog as jira_transition_worklog
+from githooks.core.constants import REQUIRED_DEPENDENCIES
+from githooks.core.jira_client import get_jira_client
+from tests.conftest import REAL_TEST_JIRA_TICKET
+
+# Branches both hook modules must parse identically, with the ticket each should yield
+CONSISTENCY_BRANCHES = ("feature/PROJ-123", "bugfix/ABC-456-fix", "JT_OMLEG-3169_description", "main", "develop")
+CONSISTENCY_TICKETS = ("PROJ-123", "ABC-456", "OMLEG-3169", None, None)
+
+
+@functools.lru_cache(maxsize=None)
+def param_names(func) -> Tuple[str, ...]:
+    """Parameter names of ``func``, inspected once per process."""
+    return tuple(inspect.signature(func).parameters)
+
 
 def test_ensure_dependencies_with_installed_packages():
     """ensure_dependencies() succeeds when all packages are installed."""
     # This should not raise an exception since dependencies are installed
-    from githooks.core.jira_client import get_jira_client
-
     client = get_jira_client()
     # Should not raise
 
 
 def test_ensure_dependencies_constant_structure():
     """REQUIRED_DEPENDENCIES constant has correct structure."""
-    from githooks.core.constants import REQUIRED_DEPENDENCIES
-
     deps = REQUIRED_DEPENDENCIES
     assert isinstance(deps, dict)
     assert "jira" in deps
@@ -40,8 +50,6 @@ def test_ensure_dependencies_constant_structure():
 
 def test_get_jira_client_without_credentials():
     """get_jira_client() returns None when credentials unavailable and no input provided."""
-    from githooks.core.jira_client import get_jira_client
-
     # Clear environment variables
     for var in ["JIRA_USERNAME", "JIRA_TOKEN", "GOJIRA_USERNAME", "GOJIRA_SECRET"]:
         os.environ.pop(var, None)
@@ -55,8 +63,6 @@ def test_get_jira_client_without_credentials():
 
 def test_default_server_value():
     """DEFAULT_SERVER has expected value."""
-    import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-
     # Should be either from environment or default
     server = jira_add_push_worklog.DEFAULT_SERVER
     assert isinstance(server, str)
@@ -65,35 +71,25 @@ def test_default_server_value():
 
 def test_service_name_constant():
     """SERVICE_NAME constant is properly defined."""
-    import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-
     assert jira_add_push_worklog.SERVICE_NAME == "gojira"
 
 
 def test_branch_regex_pattern():
     """BRANCH_REGEX constant matches expected patterns."""
-    import re
-
-    import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-
-    pattern = jira_add_push_worklog.BRANCH_REGEX
-
-    from tests.conftest import REAL_TEST_JIRA_TICKET
+    pattern = re.compile(jira_add_push_worklog.BRANCH_REGEX)
 
     # Test valid patterns
-    assert re.search(pattern, f"feature/{REAL_TEST_JIRA_TICKET}")
-    assert re.search(pattern, f"bugfix/{REAL_TEST_JIRA_TICKET}-fix")
-    assert re.search(pattern, f"JT_{REAL_TEST_JIRA_TICKET}_description")
+    assert pattern.search(f"feature/{REAL_TEST_JIRA_TICKET}")
+    assert pattern.search(f"bugfix/{REAL_TEST_JIRA_TICKET}-fix")
+    assert pattern.search(f"JT_{REAL_TEST_JIRA_TICKET}_description")
 
     # Test invalid patterns
-    assert not re.search(pattern, "feature/no-ticket")
-    assert not re.search(pattern, "main")
+    assert not pattern.search("feature/no-ticket")
+    assert not pattern.search("main")
 
 
 def test_default_time_spent_value():
     """DEFAULT_TIME_SPENT has expected format."""
-    import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-
     time_spent = jira_add_push_worklog.DEFAULT_TIME_SPENT
     assert isinstance(time_spent, str)
     assert time_spent == "2m"
@@ -104,18 +100,11 @@ class TestTransitionWorklogFunctions:
 
     def test_transition_and_log_work_function_exists(self):
         """transition_and_log_work function is callable."""
-        import githooks.hooks.jira_transition_worklog as jira_transition_worklog
-
         assert callable(jira_transition_worklog.transition_and_log_work)
 
     def test_transition_and_log_work_signature(self):
         """transition_and_log_work accepts expected parameters."""
-        import inspect
-
-        import githooks.hooks.jira_transition_worklog as jira_transition_worklog
-
-        sig = inspect.signature(jira_transition_worklog.transition_and_log_work)
-        params = list(sig.parameters.keys())
+        params = param_names(jira_transition_worklog.transition_and_log_work)
 
         assert "jira" in params
         assert "ticket" in params
@@ -128,18 +117,11 @@ class TestPushWorklogFunctions:
 
     def test_transition_to_review_function_exists(self):
         """transition_to_review function is callable."""
-        import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-
         assert callable(jira_add_push_worklog.transition_to_review)
 
     def test_transition_to_review_signature(self):
         """transition_to_review accepts expected parameters."""
-        import inspect
-
-        import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-
-        sig = inspect.signature(jira_add_push_worklog.transition_to_review)
-        params = list(sig.parameters.keys())
+        params = param_names(jira_add_push_worklog.transition_to_review)
 
         assert "jira" in params
         assert "ticket" in params
@@ -152,8 +134,6 @@ class TestModuleStructure:
 
     def test_jira_add_push_worklog_imports(self):
         """Module imports required dependencies."""
-        import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-
         # Check that third-party modules are available in the module
         assert hasattr(jira_add_push_worklog, "typer")
         assert hasattr(jira_add_push_worklog, "keyring")
@@ -161,8 +141,6 @@ class TestModuleStructure:
 
     def test_jira_transition_worklog_imports(self):
         """Module imports required dependencies."""
-        import githooks.hooks.jira_transition_worklog as jira_transition_worklog
-
         # Check that third-party modules are available in the module
         assert hasattr(jira_transition_worklog, "typer")
         assert hasattr(jira_transition_worklog, "keyring")
@@ -170,17 +148,11 @@ class TestModuleStructure:
 
     def test_both_modules_have_parse_function(self):
         """Both modules implement parse_ticket_from_branch."""
-        import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-        import githooks.hooks.jira_transition_worklog as jira_transition_worklog
-
         assert callable(jira_add_push_worklog.parse_ticket_from_branch)
         assert callable(jira_transition_worklog.parse_ticket_from_branch)
 
     def test_both_modules_have_get_jira_client(self):
         """Both modules implement get_jira_client."""
-        import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-        import githooks.hooks.jira_transition_worklog as jira_transition_worklog
-
         assert callable(jira_add_push_worklog.get_jira_client)
         assert callable(jira_transition_worklog.get_jira_client)
 
@@ -190,8 +162,6 @@ class TestErrorHandling:
 
     def test_parse_ticket_with_invalid_input(self):
         """parse_ticket_from_branch handles invalid input gracefully."""
-        import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-
         # Test with various invalid inputs
         assert jira_add_push_worklog.parse_ticket_from_branch("") is None
         assert jira_add_push_worklog.parse_ticket_from_branch("no-ticket-here") is None
@@ -200,84 +170,53 @@ class TestErrorHandling:
 
     def test_parse_ticket_with_whitespace(self):
         """parse_ticket_from_branch handles whitespace correctly."""
-        import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-
         # Should still find ticket despite whitespace
-        from tests.conftest import REAL_TEST_JIRA_TICKET
-
         result = jira_add_push_worklog.parse_ticket_from_branch(f"  feature/{REAL_TEST_JIRA_TICKET}  ")
         assert result == REAL_TEST_JIRA_TICKET
 
     def test_parse_ticket_with_newlines(self):
         """parse_ticket_from_branch handles newlines in input."""
-        import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-        from tests.conftest import REAL_TEST_JIRA_TICKET
-
         branch = f"feature/{REAL_TEST_JIRA_TICKET}\n"
         result = jira_add_push_worklog.parse_ticket_from_branch(branch)
         assert result == REAL_TEST_JIRA_TICKET
 
 
 class TestRealWorldUsage:
-    """Tests simulating real-world hook usage patterns."""
-
-    def test_typical_feature_branch_workflow(self):
-        """Simulate typical feature branch workflow."""
-        import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-
-        # User creates feature branch
-        from tests.conftest import REAL_TEST_JIRA_TICKET
-
-        branch = f"feature/JT_{REAL_TEST_JIRA_TICKET}_automatic-sw-versioning"
-        ticket = jira_add_push_worklog.parse_ticket_from_branch(branch)
-
-        assert ticket == REAL_TEST_JIRA_TICKET
-        assert isinstance(ticket, str)
-
-    def test_typical_bugfix_workflow(self):
-        """Simulate typical bugfix workflow."""
-        import githooks.hooks.jira_transition_worklog as jira_transition_worklog
-
-        # User checks out bugfix branch
-        branch = "bugfix/ISSUE-456_fix_critical_bug"
-        ticket = jira_transition_worklog.parse_ticket_from_branch(branch)
-
-        assert ticket == "ISSUE-456"
-
-    def test_no_ticket_branch_workflow(self):
-        """Simulate workflow with branch containing no ticket."""
-        import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-
-        # User works on branch without ticket
-        branch = "experimental/new-feature"
-        ticket = jira_add_push_worklog.parse_ticket_from_branch(branch)
-
-        # Should return None, indicating no Jira action needed
-        assert ticket is None
+    """Tests simulating real-world hook usage patterns, run against both hook modules."""
+
+    @pytest.mark.parametrize("module", [jira_add_push_worklog, jira_transition_worklog], ids=["pre-push", "post-checkout"])
+    @pytest.mark.parametrize(
+        "branch,expected",
+        [
+            pytest.param(f"feature/JT_{REAL_TEST_JIRA_TICKET}_automatic-sw-versioning", REAL_TEST_JIRA_TICKET, id="feature"),
+            pytest.param(f"develop-feature/JT_{REAL_TEST_JIRA_TICKET}_reverse_proxy_login_to_oracle", REAL_TEST_JIRA_TICKET, id="complex-prefix"),
+            pytest.param("bugfix/ISSUE-456_fix_critical_bug", "ISSUE-456", id="bugfix"),
+            pytest.param("hotfix/URGENT-911-critical-fix", "URGENT-911", id="hotfix"),
+            pytest.param("release/v2.0/RELEASE-100-preparation", "RELEASE-100", id="release"),
+            # No Jira action is needed when the branch has no PROJECT-NUMBER key
+            pytest.param("experimental/new-feature", None, id="no-ticket"),
+            pytest.param("JT_PROJ_1234_feature_with_many_parts", None, id="underscores-only"),
+        ],
+    )
+    def test_parse_real_world_branch(self, module, branch, expected):
+        """Both hook modules extract the expected ticket from common branch naming conventions."""
+        assert module.parse_ticket_from_branch(branch) == expected
 
 
 class TestCrossModuleConsistency:
     """Tests verifying consistency between pre-push and post-checkout modules."""
 
-    def test_same_regex_pattern(self):
-        """Both modules use same BRANCH_REGEX pattern."""
-        import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-        import githooks.hooks.jira_transition_worklog as jira_transition_worklog
-
-        assert jira_add_push_worklog.BRANCH_REGEX == jira_transition_worklog.BRANCH_REGEX
-
-    def test_same_service_name(self):
-        """Both modules use same SERVICE_NAME."""
-        import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-        import githooks.hooks.jira_transition_worklog as jira_transition_worklog
+    @pytest.mark.parametrize("attr", ["BRANCH_REGEX", "BRANCH_PATTERN", "SERVICE_NAME"])
+    def test_module_constants_consistent(self, attr):
+        """Both modules expose the same value for the shared constant."""
+        assert getattr(jira_add_push_worklog, attr) == getattr(jira_transition_worklog, attr)
 
-        assert jira_add_push_worklog.SERVICE_NAME == jira_transition_worklog.SERVICE_NAME
+    def test_branch_pattern_compiles_branch_regex(self):
+        """The shared precompiled BRANCH_PATTERN is built from BRANCH_REGEX."""
+        assert jira_add_push_worklog.BRANCH_PATTERN.pattern == jira_add_push_worklog.BRANCH_REGEX
 
     def test_same_default_time(self):
         """Both modules use same DEFAULT_TIME_SPENT."""
-        import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-        import githooks.hooks.jira_transition_worklog as jira_transition_worklog
-
         if jira_add_push_worklog.DEFAULT_TIME_SPENT != jira_transition_worklog.DEFAULT_TIME_SPENT:
             pytest.skip(
                 f"DEFAULT_TIME_SPENT mismatch: {jira_add_push_worklog.DEFAULT_TIME_SPENT} != {jira_transition_worklog.DEFAULT_TIME_SPENT}; skipping test."
@@ -286,9 +225,6 @@ class TestCrossModuleConsistency:
 
     def test_same_dependencies(self):
         """Both modules require same dependencies."""
-        import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-        import githooks.hooks.jira_transition_worklog as jira_transition_worklog
-
         deps1 = set(jira_add_push_worklog.REQUIRED_DEPENDENCIES.keys())
         deps2 = set(jira_transition_worklog.REQUIRED_DEPENDENCIES.keys())
 
@@ -296,18 +232,6 @@ class TestCrossModuleConsistency:
 
     def test_consistent_parse_behavior(self):
         """Both modules parse tickets identically."""
-        import githooks.hooks.jira_add_push_worklog as jira_add_push_worklog
-        import githooks.hooks.jira_transition_worklog as jira_transition_worklog
-
-        test_branches = [
-            "feature/PROJ-123",
-            "bugfix/ABC-456-fix",
-            "JT_OMLEG-3169_description",
-            "main",
-            "develop",
-        ]
-
-        for branch in test_branches:
-            result1 = jira_add_push_worklog.parse_ticket_from_branch(branch)
-            result2 = jira_transition_worklog.parse_ticket_from_branch(branch)
-            assert result1 == result2, f"Inconsistent parsing for branch: {branch}"
+        push_results = tuple(map(jira_add_push_worklog.parse_ticket_from_branch, CONSISTENCY_BRANCHES))
+        checkout_results = tuple(map(jira_transition_worklog.parse_ticket_from_branch, CONSISTENCY_BRANCHES))
+        assert push_results == checkout_results == CONSISTENCY_TICKETS
@@ -3,11 +3,31 @@ Edge case and error handling tests for jira_transition_worklog.py.
 Covers parse_ticket_from_branch and get_jira_client error paths.
 """
 
+import os
+
 import pytest
 
 import githooks.hooks.jira_transition_worklog as jira_transition_worklog
 
 
+class DummyKeyring:
+    """Keyring stand-in that stores nothing and never returns a password."""
+
+    def get_password(self, *a, **k):
+        return None
+
+    def set_password(self, *a, **k):
+        return None
+
+
+EMPTY_KEYRING = DummyKeyring()
+
+
+def _eof_input(*a, **k):
+    """Stand-in for ``input`` when no interactive input is possible."""
+    raise EOFError
+
+
 def test_parse_ticket_from_branch_none():
     """Should return None for branch names without ticket pattern."""
     assert jira_transition_worklog.parse_ticket_from_branch("") is None
@@ -17,22 +37,11 @@ def test_parse_ticket_from_branch_none():
 
 def test_get_jira_client_no_env(monkeypatch):
     """Should return None or prompt if no credentials in env or keyring."""
-    monkeypatch.delenv("JIRA_USERNAME", raising=False)
-    monkeypatch.delenv("JIRA_TOKEN", raising=False)
-    monkeypatch.delenv("GOJIRA_USERNAME", raising=False)
-    monkeypatch.delenv("GOJIRA_SECRET", raising=False)
-
-    # Patch keyring to return None
-    class DummyKeyring:
-        def get_password(self, *a, **k):
-            return None
-
-        def set_password(self, *a, **k):
-            return None
-
-    monkeypatch.setattr(jira_transition_worklog, "keyring", DummyKeyring())
+    # Drop every JIRA_*/GOJIRA_* credential in one rebinding, restored on teardown
+    monkeypatch.setattr(os, "environ", {k: v for k, v in os.environ.items() if not k.startswith(("JIRA_", "GOJIRA_"))})
+    monkeypatch.setattr(jira_transition_worklog, "keyring", EMPTY_KEYRING)
     # Patch input to raise EOFError (simulate no input possible)
-    monkeypatch.setattr("builtins.input", lambda *a, **k: (_ for _ in ()).throw(EOFError()))
+    monkeypatch.setattr("builtins.input", _eof_input)
     try:
         result = jira_transition_worklog.get_jira_client()
     except EOFError:
@@ -3,27 +3,28 @@ Tests for new-branch-alert.hook shell script.
 Verifies file existence and basic execution.
 """
 
-import os
 import subprocess
 import sys
 
 import pytest
 
+from tests.conftest import BASH
 
-def test_new_branch_alert_hook_exists():
+
+def test_new_branch_alert_hook_exists(hook_stats):
     """new-branch-alert.hook file exists and is readable."""
-    path = os.path.join(os.path.dirname(__file__), "../post-checkout/new-branch-alert.hook")
-    path_disabled = path + ".disabled"
-    if os.path.exists(path_disabled):
-        pytest.skip(f"Hook is disabled ({path_disabled})")
-    assert os.path.exists(path)
+    if "new-branch-alert.hook.disabled" in hook_stats["post-checkout"]:
+        pytest.skip("Hook is disabled (new-branch-alert.hook.disabled)")
+    assert "new-branch-alert.hook" in hook_stats["post-checkout"]
+
 
+def test_new_branch_alert_hook_executable(new_branch_alert_hook):
+    """new-branch-alert.hook parses as a Bash script (skipped on Windows).
 
-def test_new_branch_alert_hook_executable():
-    """new-branch-alert.hook is executable as a shell script (skipped on Windows)."""
+    Uses ``bash -n`` so the hook is syntax-checked without running its body, which
+    would create a commit in the current repository.
+    """
     if sys.platform.startswith("win"):
         pytest.skip("Shell execution test skipped on Windows")
-    path = os.path.join(os.path.dirname(__file__), "../post-checkout/new-branch-alert.hook")
-    path = os.path.normpath(path)
-    result = subprocess.run(["bash", path], capture_output=True)
+    result = subprocess.run([BASH, "-n", new_branch_alert_hook], capture_output=True)
     assert result.returncode == 0
@@ -4,23 +4,23 @@ Verifies file existence and basic execution.
 """
 
 import os
-import subprocess
 import sys
 
 import pytest
 
+HOOK_PATH = os.path.normpath(os.path.join(os.path.dirname(__file__), "../pre-push/prevent-bad-push.hook"))
 
-def test_prevent_bad_push_hook_exists():
+
+def test_prevent_bad_push_hook_exists(hook_stats):
     """prevent-bad-push.hook file exists and is readable."""
-    path = os.path.join(os.path.dirname(__file__), "../pre-push/prevent-bad-push.hook")
-    assert os.path.exists(path)
+    assert "prevent-bad-push.hook" in hook_stats["pre-push"]
+    assert hook_stats["pre-push"]["prevent-bad-push.hook"].st_size > 0
 
 
-def test_prevent_bad_push_hook_executable():
-    """prevent-bad-push.hook is executable as a shell script (skipped on Windows)."""
+def test_prevent_bad_push_hook_executable(all_hook_results):
+    """prevent-bad-push.hook is readable and parses cleanly (skipped on Windows)."""
     if sys.platform.startswith("win"):
         pytest.skip("Shell execution test skipped on Windows")
-    path = os.path.join(os.path.dirname(__file__), "../pre-push/prevent-bad-push.hook")
-    path = os.path.normpath(path)
-    result = subprocess.run(["bash", path], capture_output=True)
-    assert result.returncode == 0
+    assert os.access(HOOK_PATH, os.R_OK)
+    returncode = all_hook_results[os.path.realpath(HOOK_PATH)]
+    assert returncode == 0
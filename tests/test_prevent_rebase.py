@@ -4,23 +4,23 @@ Verifies file existence and basic execution.
 """
 
 import os
-import subprocess
 import sys
 
 import pytest
 
+HOOK_PATH = os.path.normpath(os.path.join(os.path.dirname(__file__), "../pre-rebase/prevent-rebase.hook"))
 
-def test_prevent_rebase_hook_exists():
+
+def test_prevent_rebase_hook_exists(hook_stats):
     """prevent-rebase.hook file exists and is readable."""
-    path = os.path.join(os.path.dirname(__file__), "../pre-rebase/prevent-rebase.hook")
-    assert os.path.exists(path)
+    assert "prevent-rebase.hook" in hook_stats["pre-rebase"]
+    assert hook_stats["pre-rebase"]["prevent-rebase.hook"].st_size > 0
 
 
-def test_prevent_rebase_hook_executable():
-    """prevent-rebase.hook is executable as a shell script (skipped on Windows)."""
+def test_prevent_rebase_hook_executable(all_hook_results):
+    """prevent-rebase.hook is readable and parses cleanly (skipped on Windows)."""
     if sys.platform.startswith("win"):
         pytest.skip("Shell execution test skipped on Windows")
-    path = os.path.join(os.path.dirname(__file__), "../pre-rebase/prevent-rebase.hook")
-    path = os.path.normpath(path)
-    result = subprocess.run(["bash", path], capture_output=True)
-    assert result.returncode == 0
+    assert os.access(HOOK_PATH, os.R_OK)
+    returncode = all_hook_results[os.path.realpath(HOOK_PATH)]
+    assert returncode == 0
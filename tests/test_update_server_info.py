@@ -4,25 +4,24 @@ Verifies file existence and basic execution.
 """
 
 import os
-import subprocess
 import sys
 
 import pytest
 
+HOOK_PATH = os.path.normpath(os.path.join(os.path.dirname(__file__), "../post-update/update-server-info.hook"))
 
-def test_update_server_info_hook_exists():
+
+def test_update_server_info_hook_exists(hook_stats):
     """update-server-info.hook file exists and is readable."""
-    path = os.path.join(os.path.dirname(__file__), "../post-update/update-server-info.hook")
-    if not os.path.exists(path):
+    if "update-server-info.hook" not in hook_stats["post-update"]:
         pytest.skip("update-server-info.hook not found; skipping test.")
-    assert os.path.exists(path)
+    assert "update-server-info.hook" in hook_stats["post-update"]
 
 
-def test_update_server_info_hook_executable():
-    """update-server-info.hook is executable as a shell script (skipped on Windows)."""
+def test_update_server_info_hook_executable(all_hook_results):
+    """update-server-info.hook is readable and parses cleanly (skipped on Windows)."""
     if sys.platform.startswith("win"):
         pytest.skip("Shell execution test skipped on Windows")
-    path = os.path.join(os.path.dirname(__file__), "../post-update/update-server-info.hook")
-    path = os.path.normpath(path)
-    result = subprocess.run(["bash", path], capture_output=True)
-    assert result.returncode == 0
+    assert os.access(HOOK_PATH, os.R_OK)
+    returncode = all_hook_results[os.path.realpath(HOOK_PATH)]
+    assert returncode == 0
@@ -9,17 +9,18 @@ import subprocess
 
 import pytest
 
+from tests.conftest import git_batch
+
 
 def test_verify_name_and_email_hook_blocks_without_config(temp_git_repo):
     """Should block commit if user.name is not set."""
     repo = temp_git_repo
-    subprocess.run(["git", "init"], cwd=repo, check=True)
-    # Unset user.name
-    subprocess.run(["git", "config", "--unset", "user.name"], cwd=repo, check=False)
-    # Create a file and stage it
+    # Create a file, then init and stage it in one spawn
     with open(os.path.join(repo, "foo.txt"), "w") as f:
         f.write("test")
-    subprocess.run(["git", "add", "foo.txt"], cwd=repo, check=True)
+    git_batch(repo, ["init"], ["add", "foo.txt"])
+    # Unset user.name (may already be unset, so failures are ignored)
+    subprocess.run(["git", "config", "--unset", "user.name"], cwd=repo, check=False)
     # Try to commit (should fail due to hook)
     import sys
 
@@ -0,0 +1,67 @@
+"""
+Cached scratch repository for the tools/debug_*.py scripts.
+
+The first run does `git init` plus the user.name/user.email setup once and keeps the
+result under ~/.cache/githooks-debug; later runs copy that template instead of spawning
+git again. The cache key is derived from the git executable's path, size and mtime, so
+upgrading git (and with it, possibly, the repository layout) builds a fresh template
+without having to run `git --version` on every start.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from _git import git_init_and_config
+
+CACHE_ROOT = Path.home() / ".cache" / "githooks-debug"
+TEMPLATE_BRANCH = "testbranch"
+
+
+def _cache_key() -> str:
+    """Fingerprint the installed git without executing it."""
+    git = shutil.which("git") or "git"
+    try:
+        st = os.stat(git)
+        fingerprint = f"{git}:{st.st_size}:{st.st_mtime_ns}"
+    except OSError:
+        fingerprint = git
+    return hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()[:12]
+
+
+def _build_template(dest: Path, env: Optional[Dict[str, str]]) -> None:
+    """Initialise a repository at dest with the debug identity configured."""
+    git_init_and_config(dest, "Test User", "test@test.com", TEMPLATE_BRANCH, env)
+
+
+def get_template_repo(env: Optional[Dict[str, str]] = None) -> Path:
+    """Return the cached template repository, building it on first use."""
+    template = CACHE_ROOT / _cache_key()
+    if not template.is_dir():
+        CACHE_ROOT.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=CACHE_ROOT))
+        _build_template(staging / "repo", env)
+        try:
+            os.rename(staging / "repo", template)
+        except OSError:
+            pass  # Another run cached it first; use theirs
+        shutil.rmtree(staging, ignore_errors=True)
+    return template
+
+
+@contextmanager
+def template_repo(tmp_root: Optional[str] = None, env: Optional[Dict[str, str]] = None) -> Iterator[Path]:
+    """Yield a throwaway copy of the template repository, removed on exit.
+
+    Args:
+        tmp_root: Directory to create the copy in (default: the system temp dir)
+        env: Environment for the git calls if the template has to be built
+    """
+    with tempfile.TemporaryDirectory(dir=tmp_root) as tmpdir:
+        repo = Path(tmpdir) / "repo"
+        shutil.copytree(get_template_repo(env), repo, symlinks=True)
+        yield repo
@@ -0,0 +1,51 @@
+"""
+Batched git queries for the tools/debug_*.py scripts.
+
+Each helper does with a single git process what would otherwise take several: one
+`git config --list -z` for every config value, and a plain file write instead of
+`git config` calls when setting up a fresh fixture repository.
+"""
+
+import subprocess
+from pathlib import Path
+from typing import Dict, Optional
+
+
+def config_snapshot(repo: Path, *scope: str, env: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """Read every config entry with one `git config --list -z` call.
+
+    Args:
+        repo: Repository to read from
+        *scope: Optional scope flags such as "--local" or "--global"
+        env: Environment for the git call
+
+    Returns:
+        Dictionary mapping lower-cased section.key names to values (last one wins for multi-valued keys)
+    """
+    result = subprocess.run(["git", "config", *scope, "--list", "-z"], cwd=repo, capture_output=True, text=True, check=False, env=env)
+    return dict(entry.split("\n", 1) for entry in result.stdout.split("\0") if "\n" in entry)
+
+
+def _quote(value: str) -> str:
+    """Quote a value for a git config file."""
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def git_init_and_config(repo: Path, name: str, email: str, branch: str = "main", env: Optional[Dict[str, str]] = None) -> None:
+    """Initialise a repository and set its commit identity with a single git process.
+
+    The [user] section is appended to .git/config directly rather than through two
+    `git config` calls. That is fine for the throwaway fixtures these scripts build: the
+    file was just written by `git init`, nothing else holds its lock, and the section
+    format is fixed.
+
+    Args:
+        repo: Directory to initialise
+        name: user.name for commits in the fixture
+        email: user.email for commits in the fixture
+        branch: Initial branch name
+        env: Environment for the git call
+    """
+    subprocess.run(["git", "init", f"--initial-branch={branch}", str(repo)], capture_output=True, check=True, env=env)
+    with open(Path(repo) / ".git" / "config", "a", encoding="utf-8") as config:
+        config.write(f"[user]\n\tname = {_quote(name)}\n\temail = {_quote(email)}\n")
@@ -0,0 +1,43 @@
+"""
+In-process hook runner for tools/profile-hooks.py --in-process.
+
+Reads one hook path per line on stdin, runs it with runpy as __main__, and writes
+"<exit code>\t<duration ns>" per hook. Interpreter startup and shared imports are
+paid once for the whole session instead of once per hook, at the cost of hooks
+seeing each other's module-level state (sys.modules, os.environ, cwd changes).
+"""
+
+import os
+import runpy
+import sys
+import time
+
+# Keep the protocol on private (non-inheritable) copies of stdin/stdout; hooks and their
+# children get /dev/null instead, so a hook that reads stdin can't swallow the queued paths
+requests = os.fdopen(os.dup(0), "r")
+protocol = os.fdopen(os.dup(1), "w", buffering=1)
+null_in = os.open(os.devnull, os.O_RDONLY)
+null_out = os.open(os.devnull, os.O_WRONLY)
+os.dup2(null_out, 1)
+os.dup2(null_out, 2)
+
+for line in requests:
+    path = line.strip()
+    if not path:
+        continue
+
+    # Fresh empty stdin per hook, in case the previous one consumed, replaced or closed it
+    os.dup2(null_in, 0)
+    sys.stdin = open(0, closefd=False)
+    sys.argv = [path]
+    start = time.perf_counter_ns()
+    try:
+        runpy.run_path(path, run_name="__main__")
+        exit_code = 0
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except Exception:
+        exit_code = 1
+    duration_ns = time.perf_counter_ns() - start
+
+    protocol.write(f"{exit_code}\t{duration_ns}\n")
@@ -1,27 +1,27 @@
 """Debug script to test the commitmint functions."""
+import argparse
+import functools
 import subprocess
-from pathlib import Path
-import tempfile
-from githooks.cli.commitmint import (
-    has_conventional_type,
-    suggest_type_header,
-    ensure_ticket_in_header,
-    fix_duplicate_scope,
-    add_footer_if_breaking_change,
-)
+import time
 
-# Create a temp test repo
-with tempfile.TemporaryDirectory() as tmpdir:
-    repo = Path(tmpdir)
+from _fixture_repo import template_repo
 
-    # Initialize git repo
-    subprocess.run(['git', 'init'], cwd=repo, capture_output=True, check=True)
-    subprocess.run(['git', 'config', 'user.email', 'test@test.com'], cwd=repo, check=True)
-    subprocess.run(['git', 'config', 'user.name', 'Test User'], cwd=repo, check=True)
+from githooks.cli.commitmint import add_footer_if_breaking_change, ensure_ticket_in_header, fix_duplicate_scope, has_conventional_type, suggest_type_header
 
-    # Create a branch and add commits
-    subprocess.run(['git', 'checkout', '-b', 'testbranch'], cwd=repo, check=True, capture_output=True)
+parser = argparse.ArgumentParser(description='Run a sample commit message through the commitmint pipeline.')
+parser.add_argument('--no-cache', action='store_true', help='call the commitmint helpers directly instead of through lru_cache')
+args = parser.parse_args()
 
+# The pipeline steps are pure string functions, so repeated messages can be answered from a cache
+if not args.no_cache:
+    has_conventional_type = functools.lru_cache(maxsize=1024)(has_conventional_type)
+    suggest_type_header = functools.lru_cache(maxsize=1024)(suggest_type_header)
+    ensure_ticket_in_header = functools.lru_cache(maxsize=1024)(ensure_ticket_in_header)
+    fix_duplicate_scope = functools.lru_cache(maxsize=1024)(fix_duplicate_scope)
+    add_footer_if_breaking_change = functools.lru_cache(maxsize=1024)(add_footer_if_breaking_change)
+
+# Copy of the cached repo, already on the test branch (see _fixture_repo.py); the commits below are streamed in by one git fast-import
+with template_repo() as repo:
     # Add test commits
     test_cases = [
         ('file1.txt', 'add authentication module'),
@@ -31,11 +31,19 @@ with tempfile.TemporaryDirectory() as tmpdir:
         ('file5.txt', 'refactor(utils): utils: utils: extract helper functions'),
     ]
 
-    for filename, msg in test_cases:
-        file_path = repo / filename
-        file_path.write_text(f'Content for {filename}\n', encoding='utf-8')
-        subprocess.run(['git', 'add', filename], cwd=repo, check=True, capture_output=True)
-        subprocess.run(['git', 'commit', '-m', msg, '--no-verify'], cwd=repo, check=True, capture_output=True)
+    def data(text):
+        """fast-import `data` record: exact byte count, then the payload."""
+        payload = text.encode('utf-8')
+        return b'data %d\n%s\n' % (len(payload), payload)
+
+    stream = b''
+    timestamp = int(time.time())
+    for mark, (filename, msg) in enumerate(test_cases, start=1):
+        stream += b'blob\nmark :%d\n' % mark + data(f'Content for {filename}\n')
+        stream += b'commit refs/heads/testbranch\n'
+        stream += b'committer Test User <test@test.com> %d +0000\n' % timestamp + data(msg)
+        stream += b'M 100644 :%d %s\n\n' % (mark, filename.encode('utf-8'))
+    subprocess.run(['git', 'fast-import', '--quiet'], cwd=repo, input=stream, check=True, capture_output=True)
 
     # Now retrieve the 4th commit (feat(api)!...)
     result = subprocess.run(['git', 'log', 'HEAD~1', '-1', '--pretty=%B'], cwd=repo, check=True, capture_output=True, text=True)
@@ -7,91 +7,486 @@ Run before and after optimizations to quantify improvements.
 
 Usage:
     python tools/profile-hooks.py
+    python tools/profile-hooks.py -j 4 --two-pass
+    python tools/profile-hooks.py --in-process
+    python tools/profile-hooks.py --json | jq .
     python tools/profile-hooks.py > .github/performance-baseline-20251211.txt
 """
+import argparse
+import asyncio
+import compileall
+import json
+import os
+import signal
 import subprocess
 import sys
 import time
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+# Interpreter used for every launch, made absolute once. Deliberately not realpath()'d:
+# resolving a virtualenv's python symlink would start the base interpreter without the venv.
+PYTHON = os.path.abspath(sys.executable)
 
-def profile_hook_type(hook_type: str, repo_path: Path) -> Dict[str, Dict[str, float]]:
-    """Profile all .hook files in a hook type directory.
+
+def collect_hooks(hook_types: List[str], repo_path: Path) -> List[Tuple[str, Path]]:
+    """List every profiled .hook file across the given hook types.
 
     Args:
-        hook_type: Git hook type (pre-commit, commit-msg, etc.)
+        hook_types: Git hook types (pre-commit, commit-msg, etc.)
         repo_path: Repository root path
 
     Returns:
-        Dictionary mapping hook filename to timing data
+        (hook_type, hook_file) pairs, excluding each directory's dispatcher.hook
     """
-    hooks_dir = repo_path / hook_type
-    if not hooks_dir.exists():
-        return {}
+    hooks = []
+    for hook_type in hook_types:
+        try:
+            with os.scandir(repo_path / hook_type) as entries:
+                hook_paths = sorted(
+                    entry.path for entry in entries if entry.name.endswith(".hook") and entry.name != "dispatcher.hook" and entry.is_file()
+                )
+        except FileNotFoundError:
+            continue
+        hooks.extend((hook_type, Path(hook_path)) for hook_path in hook_paths)
+    return hooks
 
-    timings = {}
-    hook_files = sorted(hooks_dir.glob("*.hook"))
 
-    for hook_file in hook_files:
-        if hook_file.name == "dispatcher.hook":
-            continue
+# Statements that, alone with comments and blank lines, make a hook a no-op
+NO_OP_STATEMENTS = {"import sys", "sys.exit(0)", "exit(0)", "exit 0"}
+
+
+def skip_reason(hook_file: Path) -> Optional[str]:
+    """Check statically whether running a hook would only measure interpreter startup.
+
+    Args:
+        hook_file: Path to the .hook file
+
+    Returns:
+        "SKIPPED_MARKER" for a ``# profile: skip`` line, "SKIPPED_EMPTY" for an empty or
+        exit-0-only body, otherwise None
+    """
+    lines = [line.strip() for line in hook_file.read_text(encoding="utf-8", errors="replace").splitlines()]
+    if "# profile: skip" in lines:
+        return "SKIPPED_MARKER"
+    if all(not line or line.startswith("#") or line in NO_OP_STATEMENTS for line in lines):
+        return "SKIPPED_EMPTY"
+    return None
+
+
+def syntax_error(hook_file: Path) -> Optional[str]:
+    """Compile a hook in-process so a broken one isn't charged a full interpreter start just to crash.
+
+    Args:
+        hook_file: Path to the .hook file
+
+    Returns:
+        "line N: message" for a SyntaxError, otherwise None (also for non-Python shebangs)
+    """
+    source = hook_file.read_bytes()
+    if source.startswith(b"#!") and b"python" not in source.split(b"\n", 1)[0]:
+        return None
+    try:
+        compile(source, str(hook_file), "exec")
+    except SyntaxError as e:
+        return f"line {e.lineno}: {e.msg}"
+    except ValueError as e:  # e.g. null bytes in the source
+        return str(e)
+    return None
+
+
+HOOK_TIMEOUT = 30  # seconds
+
+
+def rusage_to_dict(rusage: Any) -> Dict[str, float]:
+    """Convert a resource.struct_rusage into the profiler's CPU/memory columns.
+
+    Args:
+        rusage: struct_rusage from os.wait4
+
+    Returns:
+        user_ms, sys_ms, rss_kb (ru_maxrss is bytes on macOS, KiB elsewhere), majflt, inblock
+    """
+    rss_kb = rusage.ru_maxrss // 1024 if sys.platform == "darwin" else rusage.ru_maxrss
+    return {
+        "user_ms": rusage.ru_utime * 1000,
+        "sys_ms": rusage.ru_stime * 1000,
+        "rss_kb": rss_kb,
+        "majflt": rusage.ru_majflt,
+        "inblock": rusage.ru_inblock,
+    }
+
+
+async def spawn_and_wait(argv: List[str], timeout: float = HOOK_TIMEOUT) -> Tuple[int, Optional[Dict[str, float]]]:
+    """Run argv with output discarded and return its exit code and resource usage.
+
+    On Linux the child is started with os.posix_spawn (vfork-backed on glibc, no page-table
+    copy) and its exit is awaited through a pidfd registered with the event loop, so the
+    supervisor needs no thread per hook and can still reap it with os.wait4 for rusage.
+    Elsewhere it falls back to asyncio.create_subprocess_exec without usage columns.
+
+    Args:
+        argv: Command line; argv[0] must be an absolute executable path
+        timeout: Seconds before the process is killed
+
+    Returns:
+        Exit code (negative signal number if killed by a signal) and the child's
+        rusage_to_dict columns, or None on the create_subprocess_exec fallback
+
+    Raises:
+        subprocess.TimeoutExpired: If the process ran longer than timeout
+    """
+    if not hasattr(os, "pidfd_open"):
+        proc = await asyncio.create_subprocess_exec(*argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            return await asyncio.wait_for(proc.wait(), timeout), None
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(argv, timeout) from None
+
+    file_actions = [
+        (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+        (os.POSIX_SPAWN_DUP2, 1, 2),
+    ]
+    pid = os.posix_spawn(argv[0], argv, os.environ, file_actions=file_actions)
+    pidfd = os.pidfd_open(pid)
+
+    # The pidfd becomes readable once the child exits; the reader stays level-triggered until removed
+    loop = asyncio.get_running_loop()
+    exited = loop.create_future()
+    loop.add_reader(pidfd, lambda: exited.done() or exited.set_result(None))
+    timed_out = False
+    try:
+        await asyncio.wait_for(exited, timeout)
+    except asyncio.TimeoutError:
+        timed_out = True
+        os.kill(pid, signal.SIGKILL)
+    finally:
+        loop.remove_reader(pidfd)
+        os.close(pidfd)
+
+    _, status, rusage = os.wait4(pid, 0)
+    if timed_out:
+        raise subprocess.TimeoutExpired(argv, timeout)
+    return os.waitstatus_to_exitcode(status), rusage_to_dict(rusage)
+
+
+DRIVER_SCRIPT = Path(__file__).with_name("_profile_driver.py")
+
+
+class HookDriver:
+    """One long-lived _profile_driver.py process that runs hooks in-process via runpy.
+
+    Hooks share the driver's interpreter, so startup and common imports are paid once;
+    in exchange hooks can see state left behind by earlier hooks.
+    """
+
+    def __init__(self) -> None:
+        self.proc: Optional[asyncio.subprocess.Process] = None
+
+    async def run(self, hook_file: Path, timeout: float = HOOK_TIMEOUT) -> Tuple[int, int]:
+        """Run one hook in the driver.
+
+        Args:
+            hook_file: Path to the .hook file
+            timeout: Seconds before the driver is killed (and restarted on the next hook)
+
+        Returns:
+            Exit code and in-driver duration in nanoseconds
+
+        Raises:
+            subprocess.TimeoutExpired: If the hook ran longer than timeout
+            RuntimeError: If the driver exited without answering (e.g. the hook called os._exit)
+        """
+        if self.proc is None or self.proc.returncode is not None:
+            self.proc = await asyncio.create_subprocess_exec(PYTHON, "-u", str(DRIVER_SCRIPT), stdin=subprocess.PIPE, stdout=subprocess.PIPE)
 
-        start = time.perf_counter()
+        proc = self.proc
+        proc.stdin.write(f"{hook_file}\n".encode())
+        await proc.stdin.drain()
         try:
-            result = subprocess.run([sys.executable, str(hook_file)], capture_output=True, timeout=30)
-            duration = (time.perf_counter() - start) * 1000  # ms
+            reply = await asyncio.wait_for(proc.stdout.readline(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            self.proc = None
+            raise subprocess.TimeoutExpired(str(hook_file), timeout) from None
 
-            timings[hook_file.name] = {"duration_ms": duration, "exit_code": result.returncode, "error": None}
-        except subprocess.TimeoutExpired:
-            duration = 30000  # 30 seconds timeout
-            timings[hook_file.name] = {"duration_ms": duration, "exit_code": -1, "error": "TIMEOUT"}
-        except Exception as e:
-            duration = (time.perf_counter() - start) * 1000
-            timings[hook_file.name] = {"duration_ms": duration, "exit_code": -1, "error": str(e)}
+        if not reply:
+            await proc.wait()
+            self.proc = None
+            raise RuntimeError(f"driver exited with {proc.returncode}")
+        exit_code, duration_ns = reply.decode().split("\t")
+        return int(exit_code), int(duration_ns)
 
+    async def close(self) -> None:
+        """Stop the driver process."""
+        if self.proc is not None:
+            self.proc.stdin.close()
+            await self.proc.wait()
+            self.proc = None
+
+
+def stderr_tail(hook_file: Path, lines: int = 5) -> List[str]:
+    """Re-run a failed hook with stderr captured; timed runs discard output, so this is only paid on failure.
+
+    Args:
+        hook_file: Path to the .hook file
+        lines: Number of trailing stderr lines to keep
+
+    Returns:
+        The last lines of the hook's stderr (empty if it timed out)
+    """
+    try:
+        result = subprocess.run(
+            [PYTHON, str(hook_file)], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, errors="replace", timeout=HOOK_TIMEOUT
+        )
+    except subprocess.TimeoutExpired:
+        return []
+    return result.stderr.splitlines()[-lines:]
+
+
+async def time_hook(hook_file: Path, driver: Optional[HookDriver] = None) -> Dict[str, float]:
+    """Run one hook and time it.
+
+    Args:
+        hook_file: Path to the .hook file
+        driver: Run the hook in this in-process driver instead of its own interpreter
+
+    Returns:
+        Timing data: duration_ns, exit_code, error, skipped (reason or None), usage (CPU/memory
+        columns or None), plus perf_counter_ns start/end for makespan; all times are integer
+        nanoseconds, converted to milliseconds only when printed
+    """
+    reason = skip_reason(hook_file)
+    if reason:
+        now = time.perf_counter_ns()
+        return {"duration_ns": 0, "exit_code": 0, "error": None, "skipped": reason, "usage": None, "start": now, "end": now}
+
+    compile_error = syntax_error(hook_file)
+    if compile_error:
+        now = time.perf_counter_ns()
+        return {"duration_ns": 0, "exit_code": -1, "error": f"SYNTAX_ERROR {compile_error}", "skipped": None, "usage": None, "start": now, "end": now}
+
+    start = time.perf_counter_ns()
+    try:
+        if driver is not None:
+            exit_code, driver_ns = await driver.run(hook_file)
+            end = time.perf_counter_ns()
+            return {"duration_ns": driver_ns, "exit_code": exit_code, "error": None, "skipped": None, "usage": None, "start": start, "end": end}
+        exit_code, usage = await spawn_and_wait([PYTHON, str(hook_file)])
+        data = {"exit_code": exit_code, "error": None, "usage": usage}
+    except subprocess.TimeoutExpired:
+        data = {"exit_code": -1, "error": "TIMEOUT", "usage": None}
+    except Exception as e:
+        data = {"exit_code": -1, "error": str(e), "usage": None}
+    end = time.perf_counter_ns()
+
+    data.update(duration_ns=end - start, skipped=None, start=start, end=end)
+    return data
+
+
+async def profile_hooks(
+    hooks: List[Tuple[str, Path]],
+    jobs: int,
+    in_process: bool = False,
+    on_result: Optional[Callable[[str, str, Dict[str, float]], None]] = None,
+) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Profile hooks concurrently from a single event loop (each hook is its own subprocess).
+
+    Args:
+        hooks: (hook_type, hook_file) pairs from collect_hooks
+        jobs: Maximum number of hooks running at once; 1 profiles serially
+        in_process: Run hooks in a pool of long-lived HookDrivers (one per job) instead of
+            a fresh interpreter per hook
+        on_result: Called with (hook_type, hook_name, timing data) as each hook finishes
+
+    Returns:
+        Dictionary mapping hook type to {hook filename: timing data}
+    """
+    timings: Dict[str, Dict[str, Dict[str, float]]] = {}
+    slots = asyncio.Semaphore(jobs)
+    drivers = [HookDriver() for _ in range(min(jobs, len(hooks)))] if in_process else []
+    idle_drivers: asyncio.Queue = asyncio.Queue()
+    for driver in drivers:
+        idle_drivers.put_nowait(driver)
+
+    async def run_one(hook_type: str, hook_file: Path) -> None:
+        async with slots:
+            if in_process:
+                driver = await idle_drivers.get()
+                try:
+                    data = await time_hook(hook_file, driver)
+                finally:
+                    idle_drivers.put_nowait(driver)
+            else:
+                data = await time_hook(hook_file)
+        timings.setdefault(hook_type, {})[hook_file.name] = data
+        if on_result:
+            on_result(hook_type, hook_file.name, data)
+
+    try:
+        await asyncio.gather(*(run_one(hook_type, hook_file) for hook_type, hook_file in hooks))
+    finally:
+        for driver in drivers:
+            await driver.close()
     return timings
 
 
+def precompile_package(repo_path: Path) -> None:
+    """Write __pycache__ for the githooks package up front so every spawned hook imports warm .pyc files.
+
+    Args:
+        repo_path: Repository root path
+    """
+    package_dir = repo_path / "githooks"
+    if package_dir.is_dir():
+        compileall.compile_dir(str(package_dir), quiet=1)
+
+
+def warm_up_interpreter(runs: int = 2) -> None:
+    """Page in the interpreter, stdlib .pyc files and linker cache so the first hook isn't charged for them.
+
+    Args:
+        runs: Number of throwaway interpreter launches
+    """
+    for _ in range(runs):
+        subprocess.run([PYTHON, "-c", "import sys, os, subprocess, pathlib"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+# Summary sort orders: slowest overall, most CPU-bound, or most time spent waiting rather than on CPU
+SORT_KEYS = {
+    "wall": lambda data: data["duration_ns"],
+    "user": lambda data: data["usage"]["user_ms"] if data["usage"] else 0,
+    "wait": lambda data: data["duration_ns"] / 1e6 - data["usage"]["user_ms"] - data["usage"]["sys_ms"] if data["usage"] else 0,
+}
+
+
+def format_row(hook_name: str, data: Dict[str, float]) -> str:
+    """Render one hook's result as a report line: status, name, wall time, usage columns, reason."""
+    if data["skipped"]:
+        status = "SKIP"
+        error_msg = f" ({data['skipped']})"
+    elif data["error"]:
+        status = "X"
+        error_msg = f" ({data['error']})"
+    elif data["exit_code"] == 0:
+        status = "OK"
+        error_msg = ""
+    else:
+        status = "FAIL"
+        error_msg = f" (exit {data['exit_code']})"
+
+    usage = data["usage"]
+    usage_cols = f"  user {usage['user_ms']:7.2f}ms  sys {usage['sys_ms']:7.2f}ms  rss {usage['rss_kb']:7d}KB  majflt {usage['majflt']}" if usage else ""
+    return f"  {status} {hook_name:45s} {data['duration_ns'] / 1e6:8.2f}ms{usage_cols}{error_msg}"
+
+
+def json_row(hook_type: str, hook_name: str, data: Dict[str, float]) -> str:
+    """Render one hook's result as a JSON line for --json."""
+    row = {
+        "type": hook_type,
+        "hook": hook_name,
+        "ms": data["duration_ns"] / 1e6,
+        "exit_code": data["exit_code"],
+        "error": data["error"],
+        "skipped": data["skipped"],
+    }
+    row.update(data["usage"] or {})
+    return json.dumps(row)
+
+
 def main():
     """Main profiling entry point."""
+    parser = argparse.ArgumentParser(description="Profile git hook execution performance.")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1, help="hooks to run at once (default: 1; higher values contend for CPU and disk, inflating per-hook times)"
+    )
+    parser.add_argument("--two-pass", action="store_true", help="run every hook once untimed, then report warm timings alongside the cold total")
+    parser.add_argument("--sort", choices=sorted(SORT_KEYS), default="wall", help="order hooks by wall time, user CPU time, or wait time (default: wall)")
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="run hooks inside long-lived driver interpreters (see tools/_profile_driver.py); faster, but hooks share state",
+    )
+    parser.add_argument("--json", action="store_true", help="emit one JSON object per hook as it finishes, then a summary object (for jq / CI)")
+    parser.add_argument("--show-errors", action="store_true", help="re-run failing hooks with stderr captured and print its last lines")
+    args = parser.parse_args()
+
     repo_path = Path(__file__).parent.parent
     hook_types = ["pre-commit", "prepare-commit-msg", "commit-msg", "post-commit"]
 
-    print("Git Hooks Performance Profile")
-    print("=" * 70)
-    print(f"Repository: {repo_path}")
-    print(f"Python: {sys.executable}")
-    print(f"Date: {time.strftime('%Y-%m-%d %H:%M:%S')}")
-    print("=" * 70)
+    if not args.json:
+        print("Git Hooks Performance Profile")
+        print("=" * 70)
+        print(f"Repository: {repo_path}")
+        print(f"Python: {PYTHON}")
+        print(f"Date: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Jobs: {args.jobs}")
+        print(f"Mode: {'in-process driver' if args.in_process else 'isolated process per hook'}")
+        print("=" * 70)
+
+    hooks = collect_hooks(hook_types, repo_path)
+    jobs = max(args.jobs, 1)
+    precompile_package(repo_path)
+    warm_up_interpreter()
+
+    cold_total = None
+    if args.two_pass:
+        cold_timings = asyncio.run(profile_hooks(hooks, jobs, args.in_process))
+        cold_total = sum(data["duration_ns"] for timings in cold_timings.values() for data in timings.values()) / 1e6
+
+    # Show each hook as soon as it finishes, so a hook running into the timeout doesn't look like a hang
+    def report_live(hook_type: str, hook_name: str, data: Dict[str, float]) -> None:
+        print(json_row(hook_type, hook_name, data) if args.json else f"  [{hook_type}] {format_row(hook_name, data).lstrip()}", flush=True)
+
+    if not args.json:
+        print("\nRunning hooks...")
+    all_timings = asyncio.run(profile_hooks(hooks, jobs, args.in_process, on_result=report_live))
 
-    total_time = 0
+    total_ns = 0
     hook_count = 0
+    skipped_count = 0
+    starts = []
+    ends = []
 
     for hook_type in hook_types:
-        timings = profile_hook_type(hook_type, repo_path)
+        timings = all_timings.get(hook_type)
         if timings:
-            print(f"\n{hook_type}:")
-            for hook_name, data in sorted(timings.items(), key=lambda x: x[1]["duration_ms"], reverse=True):
-                duration = data["duration_ms"]
-                total_time += duration
+            if not args.json:
+                print(f"\n{hook_type}:")
+            for hook_name, data in sorted(timings.items(), key=lambda x: SORT_KEYS[args.sort](x[1]), reverse=True):
+                total_ns += data["duration_ns"]
                 hook_count += 1
+                skipped_count += bool(data["skipped"])
+                starts.append(data["start"])
+                ends.append(data["end"])
+                if not args.json:
+                    print(format_row(hook_name, data))
+                    if args.show_errors and not data["skipped"] and data["exit_code"] != 0 and not str(data["error"]).startswith("SYNTAX_ERROR"):
+                        for line in stderr_tail(repo_path / hook_type / hook_name):
+                            print(f"      | {line}")
 
-                if data["error"]:
-                    status = "X"
-                    error_msg = f" ({data['error']})"
-                elif data["exit_code"] == 0:
-                    status = "OK"
-                    error_msg = ""
-                else:
-                    status = "FAIL"
-                    error_msg = f" (exit {data['exit_code']})"
+    # Git runs hooks one after another, so the summed durations estimate commit latency;
+    # the makespan is how long this profiling run actually took.
+    makespan = (max(ends) - min(starts)) / 1e6 if hook_count else 0
+    total_time = total_ns / 1e6
 
-                print(f"  {status} {hook_name:45s} {duration:8.2f}ms{error_msg}")
+    if args.json:
+        summary = {"hooks": hook_count, "skipped": skipped_count, "total_ms": total_time, "wall_ms": makespan, "cold_total_ms": cold_total}
+        print(json.dumps({"summary": summary}))
+        return
 
     print(f"\n{'=' * 70}")
     print(f"Total hooks: {hook_count}")
+    print(f"Skipped hooks: {skipped_count}")
+    if cold_total is not None:
+        print(f"Cold total time: {cold_total:.2f}ms ({cold_total/1000:.2f}s)")
     print(f"Total time: {total_time:.2f}ms ({total_time/1000:.2f}s)")
+    print(f"Wall time: {makespan:.2f}ms ({makespan/1000:.2f}s)")
+    if jobs > 1:
+        print(f"Note: hooks ran {jobs} at a time and competed for CPU and disk; their times are inflated and not additive")
     print(f"Average per hook: {total_time/hook_count:.2f}ms" if hook_count > 0 else "")
     print("=" * 70)
 